@@ -1,25 +1,25 @@
-from . import (
-    classHandler,
-    classInstall,
-    classNews,
-    classPerson,
-    classQuotes,
-    classScheduler,
-    classSettings,
-    classWeather,
-    server,
-    
-    
-)
-
-__all__ = [
-    "classHandler",
-    "classInstall",
-    "classNews",
-    "classPerson",
-    "classQuotes",
-    "classScheduler",
-    "classSettings",
-    "classWeather",
-    "server",
-]
+from . import (
+    classHandler,
+    classInstall,
+    classNews,
+    classPerson,
+    classQuotes,
+    classScheduler,
+    classSettings,
+    classWeather,
+    server,
+    
+    
+)
+
+__all__ = [
+    "classHandler",
+    "classInstall",
+    "classNews",
+    "classPerson",
+    "classQuotes",
+    "classScheduler",
+    "classSettings",
+    "classWeather",
+    "server",
+]
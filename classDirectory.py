@@ -0,0 +1,102 @@
+import json, os, threading
+from classHandler import Handler
+from classListener import get_listener
+
+
+# In-memory copy of people_database keyed by employee_id, rows in the order Person.assign takes them.
+# The people_changed trigger (migration 4) notifies every insert, update, delete and truncate, and each
+# change refreshes just that employee. The whole table is reloaded whenever the listener (re)connects.
+class Employee_Directory:
+    columns = "employee_id, first_name, last_name, email, phone, pic_path, employee_role, position, department"
+
+    def __init__(self, handle=None):
+        self.handle = handle or Handler("user")
+        self.employees = {}
+        self.loaded = False
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.invalidations = 0
+        self.watchers = []
+        self._lock = threading.Lock()
+        self._listener = None
+
+    # Subscribes to changes and loads the table, the load runs from the listener once LISTEN is in place.
+    def start(self):
+        with self._lock:
+            # A forked worker keeps the parent's rows but needs its own listener
+            if self._listener is None or self._listener.pid != os.getpid():
+                self._listener = get_listener()
+                self._listener.subscribe("people_changed", self.on_change, self.load)
+        return self
+
+    def load(self):
+        rows = self.handle.send_query(f"SELECT {self.columns} FROM people_database;", primary=True)
+        # Swapped in whole so readers never see a half built directory
+        self.employees = {row[0]: row for row in rows}
+        self.loaded = True
+        self.reloads += 1
+        print(f"Employee directory loaded: {len(rows)} employees")
+        self.notify(None)
+
+    # True while every change is being received, a miss then means the badge is unknown.
+    def complete(self):
+        listener = self._listener
+        return self.loaded and listener is not None and listener.pid == os.getpid() and listener.connected.is_set()
+
+    def get(self, employee_id):
+        employee = self.employees.get(employee_id)
+        if employee is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return employee
+
+    # Same lookup without counting it, for background readers (the live feed) that would skew the scan hit rate
+    def peek(self, employee_id):
+        return self.employees.get(employee_id)
+
+    def put(self, row):
+        row = tuple(row)
+        # The scan path puts the row it already had on every scan, only a real change is passed on
+        if self.employees.get(row[0]) != row:
+            self.employees[row[0]] = row
+            self.notify(row[0])
+
+    # callback(employee_id) runs after that employee changed or was removed, callback(None) after a reload
+    def watch(self, callback):
+        self.watchers.append(callback)
+
+    def notify(self, employee_id):
+        for callback in self.watchers:
+            try:
+                callback(employee_id)
+            except Exception as e:
+                print(f"Employee directory watcher failed: {e}")
+
+    def on_change(self, payload):
+        change = json.loads(payload)
+        self.invalidations += 1
+        if change["op"] == "TRUNCATE":
+            self.load()
+            return
+        rows = self.handle.send_query(f"SELECT {self.columns} FROM people_database WHERE employee_id = %s;",
+            (change["employee_id"],), primary=True)
+        if rows:
+            self.put(rows[0])
+        elif self.employees.pop(change["employee_id"], None) is not None:
+            self.notify(change["employee_id"])
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"employees": len(self.employees),
+            "loaded": self.loaded,
+            "listening": self.complete(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "reloads": self.reloads,
+            "invalidations": self.invalidations}
+
+
+DIRECTORY = Employee_Directory()
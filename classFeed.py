@@ -0,0 +1,129 @@
+import json, os, queue, threading, time
+from collections import deque
+from datetime import datetime as dt
+from databaseConfig import feedSettings
+from classDirectory import DIRECTORY
+from classListener import get_listener
+
+
+# Live clock in and clock out events for the home and reports pages, sent to browsers as Server-Sent Events.
+# The timesheet_changed trigger (migration 6) notifies each committed change on the process's one LISTEN
+# connection, names come from the employee directory, and every open stream gets a copy from its own queue.
+# A stream that falls behind or a listener that reconnects gets a resync event, the page reloads what it may have missed.
+# Each open stream holds a server thread or greenlet for its whole lifetime, so at most max_clients are open at once
+# and each one ends after lifetime seconds, the browser's EventSource reconnects on its own. Events carry an id and the
+# last queue_size are kept, a reconnect sends Last-Event-ID and is given what it missed, or a resync if that is gone.
+class Scan_Feed:
+    def __init__(self, settings=None):
+        settings = settings or feedSettings()
+        self.queue_size = settings["queue_size"]
+        self.max_clients = settings["max_clients"]
+        self.lifetime = settings["lifetime"]
+        # Seconds between keep alive comments on an idle stream, a write to a closed browser ends the stream
+        self.heartbeat = settings["heartbeat"]
+        self.clients = set()
+        self.published = 0
+        self.resyncs = 0
+        self.connects = 0
+        self.refused = 0
+        self.backlog = deque(maxlen=self.queue_size)
+        # Event ids name the process, a Last-Event-ID from another process or an earlier run is never matched
+        self.prefix = f"{os.getpid()}-{int(time.time())}-"
+        self._lock = threading.Lock()
+        self._listener = None
+
+    def start(self):
+        with self._lock:
+            if self._listener is None or self._listener.pid != os.getpid():
+                self._listener = get_listener()
+                self._listener.subscribe("timesheet_changed", self.on_change, self.on_connect)
+        return self
+
+    # Every connect after the first follows a disconnect, changes made in between were not seen
+    def on_connect(self):
+        self.connects += 1
+        if self.connects > 1:
+            self.publish({"type": "resync"})
+
+    def on_change(self, payload):
+        self.publish(self.event(json.loads(payload)))
+
+    def event(self, change):
+        employee = DIRECTORY.peek(change["employee_id"])
+        clock_in = dt.fromisoformat(change["clock_in"]).astimezone()
+        time = dt.fromisoformat(change["clock_out"]).astimezone() if change["clock_out"] else clock_in
+        return {"type": change["op"],
+            "id": change["id"],
+            "employee_id": change["employee_id"],
+            "fname": employee[1] if employee else "",
+            "lname": employee[2] if employee else str(change["employee_id"]),
+            "io": "IN" if change["op"] == "in" else "OUT",
+            # Same formats as the recent scans list and Reports.format_clocked_in
+            "time": time.strftime("%I:%M %p %d-%m"),
+            "work_date": dt.fromisoformat(change["work_date"]).strftime("%m/%d/%Y"),
+            "clock_in": clock_in.strftime("%I:%M %p").lstrip("0")}
+
+    def publish(self, event):
+        with self._lock:
+            self.published += 1
+            event = dict(event, id=f"{self.prefix}{self.published}") if event["type"] != "resync" else event
+            self.backlog.append(event)
+            clients = list(self.clients)
+        for client in clients:
+            try:
+                client.put_nowait(event)
+            except queue.Full:
+                # The browser is behind, its backlog is replaced by one resync
+                self.resyncs += 1
+                with client.mutex:
+                    client.queue.clear()
+                client.put_nowait({"type": "resync"})
+
+    # None when max_clients streams are already open. A reconnect starts with the events after last_id.
+    def subscribe(self, last_id=None):
+        client = queue.Queue(self.queue_size)
+        with self._lock:
+            if len(self.clients) >= self.max_clients:
+                self.refused += 1
+                return None
+            if last_id:
+                ids = [event.get("id") for event in self.backlog]
+                if last_id in ids:
+                    for event in list(self.backlog)[ids.index(last_id) + 1:]:
+                        client.put_nowait(event)
+                else:
+                    client.put_nowait({"type": "resync"})
+            self.clients.add(client)
+        return client
+
+    def unsubscribe(self, client):
+        with self._lock:
+            self.clients.discard(client)
+
+    # text/event-stream for one subscribed browser, runs until it disconnects or its lifetime is up
+    def stream(self, client):
+        deadline = time.monotonic() + self.lifetime
+        try:
+            yield "retry: 3000\n\n"
+            while (left := deadline - time.monotonic()) > 0:
+                try:
+                    event = client.get(timeout=min(self.heartbeat, left))
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                if "id" in event:
+                    yield f"id: {event['id']}\n"
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            self.unsubscribe(client)
+
+    def stats(self):
+        return {"clients": len(self.clients),
+            "listening": self._listener is not None and self._listener.connected.is_set(),
+            "max_clients": self.max_clients,
+            "refused": self.refused,
+            "published": self.published,
+            "resyncs": self.resyncs}
+
+
+FEED = Scan_Feed()
@@ -1,209 +1,844 @@
-import psycopg2, os
-from psycopg2 import sql
-
-class Handler:
-    def __init__(self, profile="marcus", dbname="scanner", info=False):
-        # Set user and database properly
-        if profile == "admin":
-            self.user = "postgres"
-            self.dbname = dbname or "postgres"
-        elif profile == "superuser":
-            self.user = "postgres"
-            self.dbname = dbname or "scanner"
-        else:
-            self.user = "marcus"
-            self.dbname = dbname or "scanner"
-
-        self.password = "stoic"
-        self.port = 5000
-        self.host = "localhost"
-        self.info = info
-        self._shared_conn = None
-
-    def connect(self):
-        if self.info:
-            print(f"""Connecting...
-        ---Database: {self.dbname}
-        ---User: {self.user}
-        ---Port: {self.port}
-        ---Host: {self.host}""")
-        try:
-            conn = psycopg2.connect(
-                dbname=self.dbname,
-                user=self.user,
-                password=self.password,
-                host=self.host,
-                port=self.port
-            )
-            conn.autocommit = True
-            # Ensure public schema is used in this session
-            with conn.cursor() as cur:
-                cur.execute("SET search_path TO public;")
-            return conn
-        except Exception as e:
-            print("Failed to connect:", e)
-            raise
-
-    def report_error(self, e):
-        print("!!! PostgreSQL Error !!!")
-        msg = e.pgerror.strip() if e.pgerror else str(e)
-        print(f"Message: {msg}")
-        if hasattr(e, 'diag') and e.diag:
-            print(f"SQLSTATE: {e.pgcode}")
-            if getattr(e.diag, 'message_detail', None):
-                print(f"Details: {e.diag.message_detail.strip()}")
-            if getattr(e.diag, 'context', None):
-                print(f"Context: {e.diag.context.strip()}")
-        print("\n")
-
-    def send_command(self, cmd):
-        conn = cur = None
-        try:
-            conn = self.connect()
-            cur = conn.cursor()
-            if self.info:
-                print("<<< Executing command >>>")
-                print(cmd)
-            cur.execute(cmd)
-            conn.commit()
-            if self.info:
-                print(">>> Executed command <<<")
-            for notice in conn.notices:
-                print("NOTICE:", notice)
-        except psycopg2.Error as e:
-            if conn and not conn.closed:
-                conn.rollback()
-            self.report_error(e)
-            raise
-        finally:
-            if cur: cur.close()
-            if conn: conn.close()
-
-    def send_query(self, query):
-        conn = cur = None
-        results = []
-        try:
-            conn = self.connect()
-            cur = conn.cursor()
-            if self.info:
-                print("<<< Executing Query >>>")
-                print(query)
-            cur.execute(query)
-            results = cur.fetchall()
-            if self.info:
-                print("--- Query Results ---")
-                for row in results:
-                    print(row)
-                print("--- End Results ---")
-            for notice in conn.notices:
-                print("NOTICE:", notice)
-            return results
-        except psycopg2.Error as e:
-            self.report_error(e)
-            raise
-        finally:
-            if cur: cur.close()
-            if conn: conn.close()
-
-    def update_database(self, database, kname, vname, key, value, keep_open=False):
-        conn = cur = None
-        try:
-            if keep_open:
-                if not hasattr(self, "_shared_conn") or self._shared_conn is None or self._shared_conn.closed:
-                    self._shared_conn = self.connect()
-                conn = self._shared_conn
-            else:
-                conn = self.connect()
-
-            cur = conn.cursor()
-            cur.execute(
-                sql.SQL("""
-                    INSERT INTO {table} ({col_key}, {col_value})
-                    VALUES (%s, %s)
-                    ON CONFLICT ({col_key})
-                    DO UPDATE SET {col_value} = EXCLUDED.{col_value};
-                """).format(
-                    table=sql.Identifier(database),
-                    col_key=sql.Identifier(kname),
-                    col_value=sql.Identifier(vname)
-                ),
-                (key, value)
-            )
-            conn.commit()
-            #if self.info:
-            print(f"Configuration key '{key}' updated to {value}")
-        except psycopg2.Error as e:
-            if conn and not conn.closed:
-                conn.rollback()
-            self.report_error(e)
-            raise
-        finally:
-            if cur: cur.close()
-            if not keep_open and conn and not conn.closed:
-                conn.close()
-
-    # Insert or update a person in people_database
-    def update_people(self, employee_id, fields):
-        messages = {"error": [], "warning": [], "info": [], "success": []}
-        conn = cur = None
-        try:
-            conn = self.connect()
-            cur = conn.cursor()
-            cur.execute("SELECT employee_id FROM people_database WHERE employee_id = %s", (employee_id,))
-            existing = cur.fetchone()
-            
-            if existing:
-                update_fields = {k: v for k, v in fields.items() if v and str(v).strip()}
-                if not update_fields:
-                    messages["info"].append(f"No new data to update for employee {employee_id}")
-                    print(f"No new data to update for employee {employee_id}")
-                    return
-                
-                update_parts = sql.SQL(', ').join([
-                    sql.SQL("{} = %s").format(sql.Identifier(k))
-                    for k in update_fields.keys()
-                ])
-                
-                query = sql.SQL("UPDATE people_database SET {updates} WHERE employee_id = %s;").format(
-                    updates=update_parts
-                )
-                
-                values = list(update_fields.values()) + [employee_id]
-                messages["info"].append(f"Updated employee {employee_id}")
-                if self.info:
-                    print(f"Updating existing employee {employee_id} with values: {values}")
-                cur.execute(query, values)
-            else:
-                # Employee doesn't exist - do INSERT with all fields
-                columns = ['employee_id'] + list(fields.keys())
-                values = [employee_id] + list(fields.values())
-                placeholders = sql.SQL(', ').join([sql.Placeholder()] * len(values))
-                
-                query = sql.SQL("INSERT INTO people_database ({columns}) VALUES ({placeholders});").format(
-                    columns=sql.SQL(', ').join(map(sql.Identifier, columns)),
-                    placeholders=placeholders
-                )
-                messages["info"].append(f"Inserted new employee {employee_id}")
-                if self.info:
-                    print(f"Inserting new employee {employee_id} with values: {values}")
-                cur.execute(query, values)
-            
-            conn.commit()
-            messages["success"].append(f"Employee {employee_id} saved successfully")
-            print(f"Employee {employee_id} saved successfully")
-            
-        except psycopg2.Error as e:
-            if conn and not conn.closed:
-                conn.rollback()
-            self.report_error(e)
-            messages["error"].append(f"Database error for employee {employee_id}\n{e}")
-            raise
-        finally:
-            if cur: cur.close()
-            if conn: conn.close()
-            return messages
-
-    def disconnect(self):
-        if hasattr(self, "_shared_conn") and self._shared_conn and not self._shared_conn.closed:
-            self._shared_conn.close()
-            self._shared_conn = None
\ No newline at end of file
+import psycopg2, itertools, os, re, threading, time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from psycopg2 import sql, extensions, errors, extras
+from psycopg2.pool import PoolError
+from databaseConfig import poolSettings, metricsSettings, replicaSettings
+
+
+# Pooled connections carry their own bookkeeping so the pool can health check them on checkout.
+class Pooled_Connection(extensions.connection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_used = time.monotonic()
+        # name -> query text of every statement prepared on this session
+        self.prepared = {}
+
+
+# Connection_Pool keeps a bounded set of open connections for one user/database pair.
+# It is shared by every Handler in the process and is safe to use from multiple threads.
+class Connection_Pool:
+    def __init__(self, connect_kwargs, minconn=1, maxconn=10, timeout=30, check_idle=30):
+        self.connect_kwargs = connect_kwargs
+        self.minconn = max(0, minconn)
+        self.maxconn = max(1, maxconn, self.minconn)
+        self.timeout = timeout
+        self.check_idle = check_idle
+        # pid is used to detect forked workers (gunicorn) which must not reuse the parent's sockets
+        self.pid = os.getpid()
+        self._idle = []
+        self._in_use = set()
+        self._opening = 0
+        self._cond = threading.Condition()
+        self._stats = {"checkouts": 0, "waits": 0, "wait_time": 0.0, "timeouts": 0, "created": 0, "discarded": 0}
+        self.fill()
+
+
+    # Opens a new connection and runs the per-connection setup exactly once.
+    def _open(self):
+        conn = psycopg2.connect(connection_factory=Pooled_Connection, **self.connect_kwargs)
+        conn.autocommit = True
+        # Ensure public schema is used in this session
+        with conn.cursor() as cur:
+            cur.execute("SET search_path TO public;")
+        with self._cond:
+            self._stats["created"] += 1
+        return conn
+
+
+    # Opens connections until the pool holds minconn of them.
+    def fill(self):
+        try:
+            while True:
+                with self._cond:
+                    if len(self._idle) + len(self._in_use) + self._opening >= self.minconn:
+                        return
+                    self._opening += 1
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self._cond:
+                        self._opening -= 1
+                    raise
+                with self._cond:
+                    self._opening -= 1
+                    self._idle.append(conn)
+                    self._cond.notify()
+        except psycopg2.Error as e:
+            print(f"Connection pool could not open minimum connections: {e}")
+
+
+    # Returns True if an idle connection is still usable.
+    def _healthy(self, conn):
+        if conn.closed:
+            return False
+        if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+            return False
+        # Only round trip to the server when the connection has sat idle for a while
+        if time.monotonic() - conn.last_used >= self.check_idle:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1;")
+            except psycopg2.Error:
+                return False
+        return True
+
+
+    def _close(self, conn):
+        with self._cond:
+            self._stats["discarded"] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+    def getconn(self):
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        start = time.monotonic()
+        while True:
+            conn = None
+            with self._cond:
+                while not self._idle and len(self._in_use) + self._opening >= self.maxconn:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolError(f"Connection pool exhausted: {self.maxconn} connections in use")
+                    if not waited:
+                        waited = True
+                        self._stats["waits"] += 1
+                    self._cond.wait(remaining)
+                if self._idle:
+                    conn = self._idle.pop()
+                else:
+                    self._opening += 1
+
+            opened = conn is None
+            if opened:
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self._cond:
+                        self._opening -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._healthy(conn):
+                self._close(conn)
+                continue
+
+            with self._cond:
+                # The slot reserved while opening becomes an in-use connection in one step
+                if opened:
+                    self._opening -= 1
+                self._in_use.add(conn)
+                self._stats["checkouts"] += 1
+                if waited:
+                    self._stats["wait_time"] += time.monotonic() - start
+            return conn
+
+
+    def putconn(self, conn, discard=False):
+        if not discard and not conn.closed:
+            try:
+                # Never hand out a connection that is still inside a transaction
+                if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+                conn.autocommit = True
+                del conn.notices[:]
+            except psycopg2.Error:
+                discard = True
+        if discard or conn.closed:
+            self._close(conn)
+        else:
+            conn.last_used = time.monotonic()
+        # Leaving in_use and joining idle happen together so waiters never see a free slot twice
+        with self._cond:
+            self._in_use.discard(conn)
+            if not (discard or conn.closed):
+                self._idle.append(conn)
+            self._cond.notify()
+
+
+    def stats(self):
+        with self._cond:
+            data = dict(self._stats)
+            data["in_use"] = len(self._in_use)
+            data["idle"] = len(self._idle)
+            data["size"] = len(self._in_use) + len(self._idle)
+            data["minconn"] = self.minconn
+            data["maxconn"] = self.maxconn
+        return data
+
+
+    def closeall(self):
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._close(conn)
+
+
+# Registry of named statements. Each is prepared once per pooled connection and then
+# executed with bound arguments, so Postgres parses and plans the text only once per session.
+# Queries use $1, $2 ... placeholders like a server side PREPARE.
+STATEMENTS = {}
+READ_ONLY = set()
+
+
+# Normalizes a query so calls that only differ in literals share one entry.
+@lru_cache(maxsize=2048)
+def fingerprint(query):
+    query = re.sub(r"--[^\n]*", " ", query)
+    query = re.sub(r"'(?:[^']|'')*'", "?", query)
+    query = re.sub(r"\b\d+(?:\.\d+)?\b", "?", query)
+    query = re.sub(r"\(\s*\?(?:\s*,\s*\?)*\s*\)", "(?)", query)
+    return " ".join(query.split()).rstrip(";")
+
+
+# Bound parameters never reach the logs, only their types do.
+def redact(params):
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {k: f"<{type(v).__name__}>" for k, v in params.items()}
+    return [f"<{type(v).__name__}>" for v in params]
+
+
+# Query_Stats keeps in-process timing histograms per query fingerprint plus a bounded slow query log.
+class Query_Stats:
+    # Histogram bucket upper bounds in milliseconds
+    buckets = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf"))
+
+    def __init__(self):
+        settings = metricsSettings()
+        self.slow_ms = settings["slow_query_ms"]
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.slow = deque(maxlen=settings["slow_log_size"])
+
+    def record(self, query, seconds, wait, rows, params=None, error=False):
+        key = fingerprint(query)
+        ms = seconds * 1000
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {"calls": 0, "errors": 0, "rows": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                              "wait_ms": 0.0, "histogram": [0] * len(self.buckets)}
+            entry["calls"] += 1
+            entry["errors"] += int(error)
+            entry["rows"] += max(rows or 0, 0)
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+            entry["wait_ms"] += wait * 1000
+            entry["histogram"][next(i for i, bound in enumerate(self.buckets) if ms <= bound)] += 1
+        if ms >= self.slow_ms:
+            slow = {"query": key, "ms": round(ms, 3), "wait_ms": round(wait * 1000, 3), "rows": rows,
+                    "params": redact(params), "error": error, "at": time.time()}
+            self.slow.append(slow)
+            print(f"SLOW QUERY {slow['ms']}ms (wait {slow['wait_ms']}ms, rows {rows}): {key} params={slow['params']}")
+
+    # Upper bound of the bucket holding the requested percentile
+    def percentile(self, entry, q):
+        target = q * entry["calls"]
+        seen = 0
+        for bound, count in zip(self.buckets, entry["histogram"]):
+            seen += count
+            if count and seen >= target:
+                return entry["max_ms"] if bound == float("inf") else min(bound, entry["max_ms"])
+        return entry["max_ms"]
+
+    def summary(self):
+        with self._lock:
+            entries = {k: dict(v, histogram=list(v["histogram"])) for k, v in self._entries.items()}
+        result = {}
+        for key, entry in entries.items():
+            result[key] = {
+                "calls": entry["calls"],
+                "errors": entry["errors"],
+                "rows": entry["rows"],
+                "total_ms": round(entry["total_ms"], 3),
+                "mean_ms": round(entry["total_ms"] / entry["calls"], 3),
+                "max_ms": round(entry["max_ms"], 3),
+                "wait_ms": round(entry["wait_ms"], 3),
+                "p50_ms": round(self.percentile(entry, 0.50), 3),
+                "p95_ms": round(self.percentile(entry, 0.95), 3),
+                "p99_ms": round(self.percentile(entry, 0.99), 3),
+                "histogram": {("inf" if b == float("inf") else b): c for b, c in zip(self.buckets, entry["histogram"]) if c}}
+        return result
+
+    def slow_queries(self):
+        return list(self.slow)
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+            self.slow.clear()
+
+
+QUERY_STATS = Query_Stats()
+
+
+def query_stats():
+    return QUERY_STATS.summary()
+
+
+def slow_queries():
+    return QUERY_STATS.slow_queries()
+
+
+# Cursor names only need to be unique per session, a process wide counter is enough
+_cursor_ids = itertools.count(1)
+
+
+# read_only statements may be sent to a replica by Handlers that have them.
+def register_statement(name, query, read_only=False):
+    if not re.fullmatch(r"[a-z_][a-z0-9_]*", name):
+        raise ValueError(f"Invalid statement name: {name}")
+    STATEMENTS[name] = query.strip().rstrip(";")
+    if read_only:
+        READ_ONLY.add(name)
+    else:
+        READ_ONLY.discard(name)
+    return name
+
+
+# Runs a registered statement on cur, preparing it on the connection the first time it is seen there.
+def execute_statement(conn, cur, name, params=()):
+    query = STATEMENTS[name]
+    args = f" ({', '.join(['%s'] * len(params))})" if params else ""
+    if conn.prepared.get(name) != query:
+        if name in conn.prepared:
+            cur.execute(f"DEALLOCATE {name};")
+        cur.execute(f"PREPARE {name} AS {query};")
+        conn.prepared[name] = query
+    try:
+        cur.execute(f"EXECUTE {name}{args};", params)
+    except errors.InvalidSqlStatementName:
+        # Session state was reset behind the pool's back (DISCARD ALL), prepare again.
+        # Inside a transaction the failed EXECUTE has aborted it, so this only recovers in autocommit.
+        cur.execute(f"PREPARE {name} AS {query};")
+        cur.execute(f"EXECUTE {name}{args};", params)
+
+
+# Process-wide registry of pools keyed by connection target. _pools_lock only guards the dicts, a pool is
+# built and filled under its own target's lock so other targets and existing pools are not held up meanwhile.
+_pools = {}
+_pools_lock = threading.Lock()
+_pool_locks = {}
+
+
+def get_pool(connect_kwargs, minconn=None, maxconn=None):
+    key = tuple(sorted((k, v) for k, v in connect_kwargs.items() if k != "password"))
+    pid = os.getpid()
+    with _pools_lock:
+        pool = _pools.get(key)
+        # A forked worker drops the parent's pool without closing it; closing would end the parent's sessions
+        if pool is not None and pool.pid == pid:
+            return pool
+        # Keyed by pid as well, a lock held in the parent at fork time is never released in the child
+        build_lock = _pool_locks.setdefault((pid, key), threading.Lock())
+    with build_lock:
+        # Another caller may have built it while this one waited
+        with _pools_lock:
+            pool = _pools.get(key)
+        if pool is not None and pool.pid == pid:
+            return pool
+        settings = poolSettings()
+        pool = Connection_Pool(
+            connect_kwargs,
+            minconn=minconn if minconn is not None else settings["minconn"],
+            maxconn=maxconn if maxconn is not None else settings["maxconn"],
+            timeout=settings["timeout"],
+            check_idle=settings["check_idle"])
+        with _pools_lock:
+            _pools[key] = pool
+        return pool
+
+
+# Returns stats for every pool open in this process.
+def pool_stats():
+    with _pools_lock:
+        pools = [p for p in _pools.values() if p.pid == os.getpid()]
+    return {pool_name(p.connect_kwargs): p.stats() for p in pools}
+
+
+def pool_name(connect_kwargs):
+    return f"{connect_kwargs['user']}@{connect_kwargs['host']}:{connect_kwargs['port']}/{connect_kwargs['dbname']}"
+
+
+# Replicas that failed recently, by pool name, with the time they may be tried again.
+# Shared by every Handler in the process so one failure is not rediscovered by each of them.
+_replica_down = {}
+
+
+def close_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        if pool.pid == os.getpid():
+            pool.closeall()
+
+
+# Unit of work on one pooled connection, handed out by Handler.transaction().
+# Every step runs in the same transaction and its result is kept in results, in order.
+class Transaction:
+    def __init__(self, handler, conn):
+        self.handler = handler
+        self.conn = conn
+        self.results = []
+        self._savepoints = itertools.count(1)
+
+    def _run(self, label, params, execute):
+        start = time.perf_counter()
+        rows, error = 0, False
+        try:
+            with self.conn.cursor() as cur:
+                if self.handler.info:
+                    print(f"<<< Transaction step {label} >>>")
+                    print(params)
+                execute(cur)
+                result = cur.fetchall() if cur.description else cur.rowcount
+                rows = len(result) if cur.description else cur.rowcount
+            self.results.append(result)
+            return result
+        except Exception:
+            error = True
+            raise
+        finally:
+            QUERY_STATS.record(label, time.perf_counter() - start, 0.0, rows, params, error)
+
+    # Returns the rows of a query
+    def query(self, query, params=None):
+        label = query.as_string(self.conn) if isinstance(query, sql.Composable) else query
+        return self._run(label, params, lambda cur: cur.execute(query, params))
+
+    # Returns the number of rows a command changed
+    def command(self, cmd, params=None):
+        return self.query(cmd, params)
+
+    # Runs a registered statement, rows for a SELECT and the row count otherwise
+    def statement(self, name, params=()):
+        params = tuple(params)
+        return self._run(f"EXECUTE {name}", params, lambda cur: execute_statement(self.conn, cur, name, params))
+
+    # Work inside a savepoint is undone on its own if it raises, the transaction carries on once the error is handled.
+    # Results of the undone steps are dropped as well.
+    @contextmanager
+    def savepoint(self):
+        name = f"timewise_sp_{next(self._savepoints)}"
+        done = len(self.results)
+        with self.conn.cursor() as cur:
+            cur.execute(f"SAVEPOINT {name};")
+        try:
+            yield self
+        except Exception:
+            with self.conn.cursor() as cur:
+                cur.execute(f"ROLLBACK TO SAVEPOINT {name};")
+            del self.results[done:]
+            raise
+        with self.conn.cursor() as cur:
+            cur.execute(f"RELEASE SAVEPOINT {name};")
+
+
+class Handler:
+    # replicas is a list of DSNs for read-only copies of the database. Keys missing from a DSN
+    # (user, password, dbname...) are taken from the primary, so "host=replica1" is enough.
+    def __init__(self, profile="marcus", dbname="scanner", info=False, pool_min=None, pool_max=None, replicas=None):
+        # Set user and database properly
+        if profile == "admin":
+            self.user = "postgres"
+            self.dbname = dbname or "postgres"
+        elif profile == "superuser":
+            self.user = "postgres"
+            self.dbname = dbname or "scanner"
+        else:
+            self.user = "marcus"
+            self.dbname = dbname or "scanner"
+
+        self.password = "stoic"
+        self.port = 5000
+        self.host = "localhost"
+        self.info = info
+        self.pool_min = pool_min
+        self.pool_max = pool_max
+        self.replicas = list(replicas or [])
+        self._next_replica = itertools.count()
+        self._shared_conn = None
+
+    def connect_kwargs(self):
+        return {"dbname": self.dbname, "user": self.user, "password": self.password, "host": self.host, "port": self.port}
+
+    # Opens a dedicated connection outside of the pool.
+    def connect(self):
+        if self.info:
+            print(f"""Connecting...
+        ---Database: {self.dbname}
+        ---User: {self.user}
+        ---Port: {self.port}
+        ---Host: {self.host}""")
+        try:
+            conn = psycopg2.connect(**self.connect_kwargs())
+            conn.autocommit = True
+            # Ensure public schema is used in this session
+            with conn.cursor() as cur:
+                cur.execute("SET search_path TO public;")
+            return conn
+        except Exception as e:
+            print("Failed to connect:", e)
+            raise
+
+    @property
+    def pool(self):
+        return get_pool(self.connect_kwargs(), self.pool_min, self.pool_max)
+
+    def replica_kwargs(self, dsn):
+        return {**self.connect_kwargs(), **extensions.parse_dsn(dsn)}
+
+    def pool_stats(self):
+        return self.pool.stats()
+
+    # Marks a replica as failed, it is skipped until retry_after seconds have passed.
+    def replica_failed(self, name, e):
+        _replica_down[name] = time.monotonic() + replicaSettings()["retry_after"]
+        print(f"Replica {name} unavailable, reading from the primary: {str(e).strip()}")
+
+    def replica_down(self, name):
+        return _replica_down.get(name, 0) > time.monotonic()
+
+    # Takes a connection from the next healthy replica in round-robin order.
+    # Falls back to the primary when every replica is down or refuses the connection.
+    def read_connection(self):
+        count = len(self.replicas)
+        first = next(self._next_replica)
+        for i in range(count):
+            pool = get_pool(self.replica_kwargs(self.replicas[(first + i) % count]), self.pool_min, self.pool_max)
+            if self.replica_down(pool_name(pool.connect_kwargs)):
+                continue
+            try:
+                return pool, pool.getconn()
+            except (psycopg2.OperationalError, PoolError) as e:
+                self.replica_failed(pool_name(pool.connect_kwargs), e)
+        return self.pool, self.pool.getconn()
+
+    # Borrows a connection from the process pool and always returns it.
+    # read=True borrows from a replica when this Handler has any.
+    # Connections that fail at the protocol level are thrown away instead of being reused.
+    @contextmanager
+    def checkout(self, read=False):
+        if read and self.replicas:
+            pool, conn = self.read_connection()
+        else:
+            pool = self.pool
+            conn = pool.getconn()
+        discard = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            discard = True
+            if pool is not self.pool:
+                self.replica_failed(pool_name(pool.connect_kwargs), e)
+            raise
+        finally:
+            pool.putconn(conn, discard=discard or conn.closed)
+
+    # Reads go to a replica first when there are any and the caller did not ask for the primary.
+    # A replica that drops the connection mid query is retried once on the primary.
+    def read_routes(self, primary=False):
+        return [True, False] if self.replicas and not primary else [False]
+
+    # Checks out a connection and records wall time, connection wait and row count of the work done on it.
+    # Callers set metric["rows"]; failed statements are counted as errors.
+    @contextmanager
+    def timed(self, query, params=None, read=False):
+        metric = {"query": query, "rows": 0, "wait": 0.0}
+        start = time.perf_counter()
+        error = False
+        try:
+            with self.checkout(read=read) as conn:
+                metric["wait"] = time.perf_counter() - start
+                if isinstance(query, sql.Composable):
+                    metric["query"] = query.as_string(conn)
+                yield conn, metric
+        except Exception:
+            error = True
+            raise
+        finally:
+            QUERY_STATS.record(metric["query"], time.perf_counter() - start, metric["wait"], metric["rows"], params, error)
+
+    def report_error(self, e):
+        print("!!! PostgreSQL Error !!!")
+        msg = e.pgerror.strip() if e.pgerror else str(e)
+        print(f"Message: {msg}")
+        if hasattr(e, 'diag') and e.diag:
+            print(f"SQLSTATE: {e.pgcode}")
+            if getattr(e.diag, 'message_detail', None):
+                print(f"Details: {e.diag.message_detail.strip()}")
+            if getattr(e.diag, 'context', None):
+                print(f"Context: {e.diag.context.strip()}")
+        print("\n")
+
+    def print_notices(self, conn):
+        for notice in conn.notices:
+            print("NOTICE:", notice)
+        del conn.notices[:]
+
+    def send_command(self, cmd):
+        try:
+            with self.timed(cmd) as (conn, metric):
+                with conn.cursor() as cur:
+                    if self.info:
+                        print("<<< Executing command >>>")
+                        print(cmd)
+                    cur.execute(cmd)
+                    metric["rows"] = cur.rowcount
+                    if self.info:
+                        print(">>> Executed command <<<")
+                self.print_notices(conn)
+        except psycopg2.Error as e:
+            self.report_error(e)
+            raise
+
+    # Runs several statements on one connection and commits once when the block exits cleanly.
+    # Any exception rolls the whole block back. Transactions always run on the primary.
+    @contextmanager
+    def transaction(self):
+        try:
+            with self.checkout() as conn:
+                conn.autocommit = False
+                tx = Transaction(self, conn)
+                try:
+                    yield tx
+                    conn.commit()
+                except BaseException:
+                    if not conn.closed:
+                        conn.rollback()
+                    raise
+                self.print_notices(conn)
+        except psycopg2.Error as e:
+            self.report_error(e)
+            raise
+
+    # primary=True skips the replicas, for reads that must see a write that was just made.
+    def send_query(self, query, params=None, primary=False):
+        routes = self.read_routes(primary)
+        for read in routes:
+            results = []
+            try:
+                with self.timed(query, params, read=read) as (conn, metric):
+                    with conn.cursor() as cur:
+                        if self.info:
+                            print("<<< Executing Query >>>")
+                            print(query)
+                        cur.execute(query, params)
+                        results = cur.fetchall()
+                        metric["rows"] = len(results)
+                    if self.info:
+                        print("--- Query Results ---")
+                        for row in results:
+                            print(row)
+                        print("--- End Results ---")
+                    self.print_notices(conn)
+                return results
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                if read and len(routes) > 1:
+                    continue
+                self.report_error(e)
+                raise
+            except psycopg2.Error as e:
+                self.report_error(e)
+                raise
+
+    # Runs a registered statement, preparing it on the borrowed connection the first time it is seen there.
+    # Statements registered read_only may run on a replica, primary=True keeps them on the primary.
+    def run_statement(self, name, params=(), primary=False):
+        params = tuple(params)
+        routes = self.read_routes(primary or name not in READ_ONLY)
+        for read in routes:
+            try:
+                with self.timed(f"EXECUTE {name}", params, read=read) as (conn, metric):
+                    with conn.cursor() as cur:
+                        if self.info:
+                            print(f"<<< Executing Statement {name} >>>")
+                            print(params)
+                        execute_statement(conn, cur, name, params)
+                        results = cur.fetchall() if cur.description else []
+                        metric["rows"] = len(results) if cur.description else cur.rowcount
+                    if self.info:
+                        print("--- Statement Results ---")
+                        for row in results:
+                            print(row)
+                        print("--- End Results ---")
+                    self.print_notices(conn)
+                return results
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                if read and len(routes) > 1:
+                    continue
+                self.report_error(e)
+                raise
+            except psycopg2.Error as e:
+                self.report_error(e)
+                raise
+
+    # Streams a query through a named server side cursor. Rows arrive itersize at a time, so memory
+    # stays flat however large the result is. batch=True yields lists of up to itersize rows instead of rows.
+    # The connection is held until the generator is exhausted or closed.
+    def stream_query(self, query, params=None, itersize=2000, batch=False, primary=False):
+        routes = self.read_routes(primary)
+        for read in routes:
+            sent = False
+            try:
+                # Streamed timings include the time the consumer spends between batches
+                with self.timed(query, params, read=read) as (conn, metric):
+                    # Named cursors only live inside a transaction
+                    conn.autocommit = False
+                    with conn.cursor(name=f"timewise_stream_{next(_cursor_ids)}") as cur:
+                        cur.itersize = itersize
+                        if self.info:
+                            print("<<< Streaming Query >>>")
+                            print(query)
+                        cur.execute(query, params)
+                        if batch:
+                            while True:
+                                rows = cur.fetchmany(itersize)
+                                if not rows:
+                                    break
+                                metric["rows"] += len(rows)
+                                sent = True
+                                yield rows
+                        else:
+                            for row in cur:
+                                metric["rows"] += 1
+                                sent = True
+                                yield row
+                    conn.commit()
+                    self.print_notices(conn)
+                return
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                # Rows already handed to the consumer can't be taken back, only a stream that never started moves
+                if read and len(routes) > 1 and not sent:
+                    continue
+                self.report_error(e)
+                raise
+            except psycopg2.Error as e:
+                self.report_error(e)
+                raise
+
+    # Streams a registered statement. Its $n placeholders are rewritten for the client side cursor.
+    def stream_statement(self, name, params=(), itersize=2000, batch=False, primary=False):
+        query = re.sub(r"\$(\d+)", r"%(p\1)s", STATEMENTS[name].replace("%", "%%"))
+        args = {f"p{i}": value for i, value in enumerate(params, start=1)}
+        return self.stream_query(query, args, itersize=itersize, batch=batch, primary=primary or name not in READ_ONLY)
+
+    # keep_open is kept for older callers, pooled connections already stay open between calls.
+    def update_database(self, database, kname, vname, key, value, keep_open=False):
+        query = sql.SQL("""
+            INSERT INTO {table} ({col_key}, {col_value})
+            VALUES (%s, %s)
+            ON CONFLICT ({col_key})
+            DO UPDATE SET {col_value} = EXCLUDED.{col_value};
+        """).format(
+            table=sql.Identifier(database),
+            col_key=sql.Identifier(kname),
+            col_value=sql.Identifier(vname)
+        )
+        try:
+            with self.timed(query, (key, value)) as (conn, metric):
+                with conn.cursor() as cur:
+                    cur.execute(query, (key, value))
+                    metric["rows"] = cur.rowcount
+            #if self.info:
+            print(f"Configuration key '{key}' updated to {value}")
+        except psycopg2.Error as e:
+            self.report_error(e)
+            raise
+
+    # Upserts many key/value rows into one table with a single statement and a single transaction.
+    # rows is a dict or a list of (key, value) pairs, later duplicates of a key win.
+    def update_database_many(self, database, kname, vname, rows):
+        # Values are sent as text so one VALUES list never mixes numeric and text literals
+        rows = [(k, None if v is None else str(v)) for k, v in dict(rows).items()]
+        if not rows:
+            return 0
+        query = sql.SQL("""
+            INSERT INTO {table} ({col_key}, {col_value})
+            VALUES %s
+            ON CONFLICT ({col_key})
+            DO UPDATE SET {col_value} = EXCLUDED.{col_value};
+        """).format(
+            table=sql.Identifier(database),
+            col_key=sql.Identifier(kname),
+            col_value=sql.Identifier(vname)
+        )
+        try:
+            with self.timed(query, [v for row in rows for v in row]) as (conn, metric):
+                conn.autocommit = False
+                try:
+                    with conn.cursor() as cur:
+                        extras.execute_values(cur, query, rows, page_size=len(rows))
+                    metric["rows"] = len(rows)
+                    conn.commit()
+                except psycopg2.Error:
+                    if not conn.closed:
+                        conn.rollback()
+                    raise
+            print(f"{len(rows)} keys updated in {database}")
+            return len(rows)
+        except psycopg2.Error as e:
+            self.report_error(e)
+            raise
+
+    # Insert or update a person in people_database
+    def update_people(self, employee_id, fields):
+        messages = {"error": [], "warning": [], "info": [], "success": []}
+        try:
+            with self.transaction() as tx:
+                existing = tx.query("SELECT employee_id FROM people_database WHERE employee_id = %s", (employee_id,))
+
+                if existing:
+                    update_fields = {k: v for k, v in fields.items() if v and str(v).strip()}
+                    if not update_fields:
+                        messages["info"].append(f"No new data to update for employee {employee_id}")
+                        print(f"No new data to update for employee {employee_id}")
+                        return messages
+
+                    update_parts = sql.SQL(', ').join([
+                        sql.SQL("{} = %s").format(sql.Identifier(k))
+                        for k in update_fields.keys()
+                    ])
+
+                    query = sql.SQL("UPDATE people_database SET {updates} WHERE employee_id = %s;").format(
+                        updates=update_parts
+                    )
+
+                    values = list(update_fields.values()) + [employee_id]
+                    messages["info"].append(f"Updated employee {employee_id}")
+                    if self.info:
+                        print(f"Updating existing employee {employee_id} with values: {values}")
+                    tx.command(query, values)
+                else:
+                    # Employee doesn't exist - do INSERT with all fields
+                    columns = ['employee_id'] + list(fields.keys())
+                    values = [employee_id] + list(fields.values())
+                    placeholders = sql.SQL(', ').join([sql.Placeholder()] * len(values))
+
+                    query = sql.SQL("INSERT INTO people_database ({columns}) VALUES ({placeholders});").format(
+                        columns=sql.SQL(', ').join(map(sql.Identifier, columns)),
+                        placeholders=placeholders
+                    )
+                    messages["info"].append(f"Inserted new employee {employee_id}")
+                    if self.info:
+                        print(f"Inserting new employee {employee_id} with values: {values}")
+                    tx.command(query, values)
+            messages["success"].append(f"Employee {employee_id} saved successfully")
+            print(f"Employee {employee_id} saved successfully")
+
+        except psycopg2.Error as e:
+            messages["error"].append(f"Database error for employee {employee_id}\n{e}")
+        return messages
+
+    def disconnect(self):
+        if hasattr(self, "_shared_conn") and self._shared_conn and not self._shared_conn.closed:
+            self._shared_conn.close()
+            self._shared_conn = None
@@ -0,0 +1,291 @@
+import json, os, sys, threading, time, uuid
+import psycopg2
+import redis
+from classHandler import Handler, register_statement
+from classRedis import RedisConnectionHandler
+from databaseConfig import ingestSettings
+
+
+# A queued scan is applied at the time it was taken, clock_toggle (migration 3) backdates the event to $3.
+register_statement("ingest_clock_toggle", """
+    SELECT employee_id, event_type, event_time, duplicate FROM clock_toggle($1, $2, $3)""")
+
+
+# Scans waiting to be written to timesheet_database, kept in Redis streams. The kiosk is answered as soon as
+# the scan is appended, ingest workers commit them later. Run Redis with appendonly for the stream to survive a restart.
+class Scan_Queue:
+    stream_prefix = "timewise:scans:"
+    dead_key = "timewise:scans:dead"
+    group = "timewise-ingest"
+
+    def __init__(self, redis_handler=None, settings=None):
+        self._redis = redis_handler
+        self.settings = settings or ingestSettings()
+        self.enqueued = 0
+        self.throttled = 0
+        self.workers = []
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._redis is None:
+            self._redis = RedisConnectionHandler()
+        return self._redis.client
+
+    @property
+    def enabled(self):
+        return self.settings["mode"] == "queue"
+
+    # Scans of one employee always land on the same shard
+    def stream(self, employee_id):
+        return f"{self.stream_prefix}{int(employee_id) % self.settings['shards']}"
+
+    def streams(self):
+        return [f"{self.stream_prefix}{shard}" for shard in range(self.settings["shards"])]
+
+    # Appends a scan, returns False when Redis can't take it and the scan has to be written directly.
+    def enqueue(self, employee_id, debounce, at):
+        try:
+            entry = self.client.xadd(self.stream(employee_id),
+                {"employee_id": employee_id, "debounce": debounce, "at": at.isoformat()})
+        except redis.RedisError as e:
+            print(f"Scan queue unavailable, writing scan directly: {e}")
+            return False
+        self.enqueued += 1
+        # Back-pressure: the kiosk waits while the workers are too far behind
+        deadline = time.monotonic() + self.settings["max_wait"]
+        if self.waiting() > self.settings["max_lag"]:
+            self.throttled += 1
+            while self.waiting() > self.settings["max_lag"] and time.monotonic() < deadline:
+                time.sleep(0.05)
+        return entry
+
+    # Scans appended but not yet committed, acknowledged entries are deleted from the stream
+    def waiting(self):
+        pipe = self.client.pipeline(transaction=False)
+        for key in self.streams():
+            pipe.xlen(key)
+        return sum(pipe.execute())
+
+    # Queue depth and the age of the oldest uncommitted scan, readable from any process
+    def lag(self):
+        pipe = self.client.pipeline(transaction=False)
+        for key in self.streams():
+            pipe.xlen(key)
+            pipe.xrange(key, count=1)
+        results = pipe.execute()
+        waiting = sum(results[0::2])
+        oldest = [int(first[0][0].split("-")[0]) for first in results[1::2] if first]
+        return {"waiting": waiting,
+            "oldest_ms": round(time.time() * 1000 - min(oldest)) if oldest else 0,
+            "dead": self.client.xlen(self.dead_key)}
+
+    # Starts a worker thread per shard in this process, shards already drained elsewhere are left to their worker
+    def start_workers(self):
+        with self._lock:
+            if not any(worker.pid == os.getpid() for worker in self.workers):
+                self.workers = [Ingest_Worker(shard, queue=self).start() for shard in range(self.settings["shards"])]
+        return self.workers
+
+    def stats(self):
+        stats = {"mode": self.settings["mode"], "enqueued": self.enqueued, "throttled": self.throttled}
+        if self.enabled:
+            try:
+                stats.update(self.lag())
+            except redis.RedisError as e:
+                stats["error"] = str(e)
+            stats["workers"] = [worker.stats() for worker in self.workers if worker.pid == os.getpid()]
+        return stats
+
+
+# Drains one shard of the scan queue into timesheet_database. A lease in Redis keeps a single worker on each
+# shard, and every worker of a shard reads as the same consumer so scans left unacknowledged by a worker that
+# died are picked up first by the next one.
+class Ingest_Worker:
+    lease_ms = 15000
+    # Refreshes the lease only while this worker still holds it
+    renew_script = """
+        if redis.call('get', KEYS[1]) == ARGV[1] then
+            return redis.call('pexpire', KEYS[1], ARGV[2])
+        end
+        return 0"""
+    release_script = """
+        if redis.call('get', KEYS[1]) == ARGV[1] then
+            return redis.call('del', KEYS[1])
+        end
+        return 0"""
+
+    def __init__(self, shard=0, handle=None, queue=None):
+        self.shard = shard
+        self.handle = handle or Handler("user")
+        self.queue = queue or SCAN_QUEUE
+        self.key = f"{self.queue.stream_prefix}{shard}"
+        self.lease_key = f"timewise:ingest:lease:{shard}"
+        self.consumer = f"shard-{shard}"
+        self.token = uuid.uuid4().hex
+        self.pid = os.getpid()
+        self.leased = False
+        self.backlog = True
+        self.applied = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.retried = 0
+        # Failed attempts of each scan left pending
+        self.attempts = {}
+        self.batches = 0
+        self.last_batch_ms = None
+        self.stop = threading.Event()
+        self.thread = None
+
+    @property
+    def client(self):
+        return self.queue.client
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name=f"timewise-ingest-{self.shard}", daemon=True)
+        self.thread.start()
+        return self
+
+    def ensure_group(self):
+        try:
+            self.client.xgroup_create(self.key, self.queue.group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def acquire(self):
+        if self.leased:
+            self.leased = bool(self.client.eval(self.renew_script, 1, self.lease_key, self.token, self.lease_ms))
+        if not self.leased:
+            self.leased = bool(self.client.set(self.lease_key, self.token, nx=True, px=self.lease_ms))
+            # A new holder starts with whatever the previous one read but never acknowledged
+            self.backlog = self.leased
+        return self.leased
+
+    def release(self):
+        if self.leased:
+            self.client.eval(self.release_script, 1, self.lease_key, self.token)
+            self.leased = False
+
+    def read(self):
+        batch = self.queue.settings["batch"]
+        if self.backlog:
+            entries = self.client.xreadgroup(self.queue.group, self.consumer, {self.key: "0"}, count=batch)
+            entries = entries[0][1] if entries else []
+            if entries:
+                return entries
+            self.backlog = False
+        entries = self.client.xreadgroup(self.queue.group, self.consumer, {self.key: ">"}, count=batch,
+            block=self.queue.settings["block_ms"])
+        return entries[0][1] if entries else []
+
+    # Commits a batch in one transaction. If the batch fails it is retried one scan at a time. Scans with bad data
+    # are moved to the dead letter stream so they can't hold up the rest of the shard. Scans that hit a deadlock,
+    # a serialization failure or another passing error stay pending and are read again, with every later scan of
+    # the same employee so they stay in order, until they have failed retries times.
+    def apply(self, entries):
+        start = time.perf_counter()
+        scans, dead, retry = [], [], []
+        for entry_id, fields in entries:
+            try:
+                scans.append((entry_id, fields, (int(fields["employee_id"]), int(fields["debounce"]), fields["at"])))
+            except (KeyError, TypeError, ValueError) as e:
+                dead.append((entry_id, fields, e))
+        try:
+            with self.handle.transaction() as tx:
+                for _, _, params in scans:
+                    tx.statement("ingest_clock_toggle", params)
+                results = tx.results
+        except Exception as e:
+            print(f"Ingest batch of {len(scans)} failed, applying one at a time: {e}")
+            results, held = [], set()
+            with self.handle.transaction() as tx:
+                for entry_id, fields, params in scans:
+                    if params[0] in held:
+                        retry.append(entry_id)
+                        continue
+                    try:
+                        with tx.savepoint():
+                            results.append(tx.statement("ingest_clock_toggle", params))
+                    except (psycopg2.DataError, psycopg2.IntegrityError) as e:
+                        dead.append((entry_id, fields, e))
+                    except psycopg2.Error as e:
+                        self.attempts[entry_id] = self.attempts.get(entry_id, 0) + 1
+                        if self.attempts[entry_id] >= self.queue.settings["retries"]:
+                            dead.append((entry_id, fields, e))
+                        else:
+                            print(f"Scan {entry_id} left pending, attempt {self.attempts[entry_id]}: {e}")
+                            held.add(params[0])
+                            retry.append(entry_id)
+        for rows in results:
+            if rows and rows[0][3]:
+                self.duplicates += 1
+        ids = [entry_id for entry_id, _ in entries if entry_id not in retry]
+        pipe = self.client.pipeline(transaction=True)
+        for entry_id, fields, e in dead:
+            pipe.xadd(self.queue.dead_key, {"entry": entry_id, "scan": json.dumps(fields), "error": str(e)})
+        if ids:
+            pipe.xack(self.key, self.queue.group, *ids)
+            pipe.xdel(self.key, *ids)
+        pipe.execute()
+        for entry_id in ids:
+            self.attempts.pop(entry_id, None)
+        self.applied += len(results)
+        self.failed += len(dead)
+        self.retried += len(retry)
+        self.batches += 1
+        self.last_batch_ms = round((time.perf_counter() - start) * 1000, 3)
+        if retry:
+            # Pending scans are read again before anything new on the shard
+            self.backlog = True
+            self.stop.wait(1)
+
+    def run(self):
+        print(f"Ingest worker for {self.key} started")
+        while not self.stop.is_set():
+            try:
+                self.ensure_group()
+                while not self.stop.is_set():
+                    if not self.acquire():
+                        self.stop.wait(self.lease_ms / 3000)
+                        continue
+                    entries = self.read()
+                    if entries:
+                        self.apply(entries)
+            except Exception as e:
+                # Unacknowledged scans stay pending and are read again once the worker is back
+                self.backlog = True
+                print(f"Ingest worker for {self.key} failed, retrying in 5s: {e}")
+                self.stop.wait(5)
+        try:
+            self.release()
+        except redis.RedisError:
+            pass
+
+    def stats(self):
+        return {"shard": self.shard,
+            "leased": self.leased,
+            "applied": self.applied,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+            "retried": self.retried,
+            "batches": self.batches,
+            "last_batch_ms": self.last_batch_ms}
+
+
+SCAN_QUEUE = Scan_Queue()
+
+
+# python classIngest.py [shard ...] runs ingest workers in the foreground, every shard by default
+if __name__ == "__main__":
+    shards = [int(arg) for arg in sys.argv[1:]] or range(SCAN_QUEUE.settings["shards"])
+    workers = [Ingest_Worker(shard).start() for shard in shards]
+    try:
+        while True:
+            time.sleep(10)
+            print(SCAN_QUEUE.lag(), [worker.stats() for worker in workers])
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.stop.set()
+        for worker in workers:
+            worker.thread.join()
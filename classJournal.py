@@ -0,0 +1,205 @@
+import os, sqlite3, threading, time, uuid
+import psycopg2
+from psycopg2.extensions import TransactionRollbackError
+from psycopg2.pool import PoolError
+from datetime import datetime as dt
+from databaseConfig import journalSettings
+
+
+# Write-ahead journal for scans taken while PostgreSQL is unreachable. A scan is one SQLite insert, so the kiosk is
+# answered without waiting for the database, and a replayer thread applies the journal in order once it is back.
+# Every journaled scan carries an idempotency key for clock_scan (migration 5): a batch that committed but was not
+# yet removed from the journal, or one replayed by two processes sharing the file, is only applied once.
+# A batch that fails is replayed one scan at a time, scans with bad data go to scan_journal_dead so they can't hold
+# up the journal, and every later scan keeps waiting while PostgreSQL is unreachable or an error may pass.
+class Scan_Journal:
+    def __init__(self, settings=None):
+        self.settings = settings or journalSettings()
+        self.path = self.settings["path"]
+        self.journaled = 0
+        self.replayed = 0
+        self.failed = 0
+        # Failed attempts of the scans that hit an error which may pass, by seq
+        self.attempts = {}
+        self.replay_rate = None
+        self.last_error = None
+        # Scans waiting in the journal as far as this process knows, read from the file once per process
+        self.queued = None
+        self.queued_pid = None
+        self.pid = None
+        self.thread = None
+        self.wake = threading.Event()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    # SQLite connections can't be shared between threads, each thread opens its own
+    @property
+    def db(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            # A scan is on disk before the kiosk is told it was recorded
+            conn.execute("PRAGMA synchronous=FULL;")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS scan_journal (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    employee_id INTEGER NOT NULL,
+                    scanned_at TEXT NOT NULL,
+                    idempotency_key TEXT NOT NULL);""")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS scan_journal_dead (
+                    seq INTEGER PRIMARY KEY,
+                    employee_id INTEGER NOT NULL,
+                    scanned_at TEXT NOT NULL,
+                    idempotency_key TEXT NOT NULL,
+                    error TEXT NOT NULL,
+                    failed_at TEXT NOT NULL);""")
+            self._local.conn = conn
+        return conn
+
+    def append(self, employee_id, at):
+        self.count()
+        self.db.execute("INSERT INTO scan_journal (employee_id, scanned_at, idempotency_key) VALUES (?, ?, ?);",
+            (employee_id, at.isoformat(), f"journal-{uuid.uuid4().hex}"))
+        with self._lock:
+            self.queued += 1
+        self.journaled += 1
+        self.start()
+        self.wake.set()
+
+    # True while scans are waiting, new scans queue behind them so each employee's scans stay in order.
+    # Checked on every scan, so it only reads the in-memory count.
+    def pending(self):
+        return self.count() > 0
+
+    # The in-memory count, the file is only opened the first time a process asks or after a fork
+    def count(self):
+        if self.queued is None or self.queued_pid != os.getpid():
+            self.queued = self.depth()
+            self.queued_pid = os.getpid()
+        return self.queued
+
+    def depth(self):
+        if not os.path.exists(self.path):
+            return 0
+        return self.db.execute("SELECT count(*) FROM scan_journal;").fetchone()[0]
+
+    # Applies the oldest batch of journaled scans and removes them, returns how many were applied.
+    def replay(self):
+        # classPerson imports the journal, clock_scans is looked up when it is needed
+        from classPerson import clock_scans
+        rows = self.db.execute("SELECT seq, employee_id, scanned_at, idempotency_key FROM scan_journal ORDER BY seq LIMIT ?;",
+            (self.settings["batch"],)).fetchall()
+        if not rows:
+            # Another process sharing the file may have replayed what this one counted
+            with self._lock:
+                self.queued = 0
+            return 0
+        start = time.perf_counter()
+        try:
+            clock_scans([self.scan(row) for row in rows], journaled=True)
+            self.db.execute("DELETE FROM scan_journal WHERE seq <= ?;", (rows[-1][0],))
+            applied = len(rows)
+        except psycopg2.Error as e:
+            if unreachable(e):
+                raise
+            print(f"Journal batch of {len(rows)} failed, replaying one at a time: {e}")
+            applied = self.replay_each(rows, clock_scans)
+        finally:
+            # Counted again after each batch, it also picks up scans other processes sharing the file journaled
+            with self._lock:
+                self.queued = self.depth()
+        self.replayed += applied
+        self.replay_rate = round(applied / (time.perf_counter() - start), 1)
+        print(f"Replayed {applied} journaled scans")
+        return len(rows)
+
+    # Applies rows in order, each in its own transaction, and removes each one once it is applied or dead lettered.
+    # Stops at the first scan that may still go through, run() waits and tries again from there.
+    def replay_each(self, rows, clock_scans):
+        applied = 0
+        for row in rows:
+            try:
+                clock_scans([self.scan(row)], journaled=True)
+                applied += 1
+            except (psycopg2.DataError, psycopg2.IntegrityError) as e:
+                self.dead_letter(row, e)
+                continue
+            except psycopg2.Error as e:
+                if unreachable(e):
+                    raise
+                self.attempts[row[0]] = self.attempts.get(row[0], 0) + 1
+                if self.attempts[row[0]] < self.settings["retries"]:
+                    print(f"Journaled scan {row[0]} left pending, attempt {self.attempts[row[0]]}: {e}")
+                    raise
+                self.dead_letter(row, e)
+                continue
+            self.attempts.pop(row[0], None)
+            self.db.execute("DELETE FROM scan_journal WHERE seq = ?;", (row[0],))
+        return applied
+
+    def dead_letter(self, row, e):
+        print(f"Journaled scan {row[0]} for ID {row[1]} moved to scan_journal_dead: {e}")
+        self.db.execute("BEGIN IMMEDIATE;")
+        try:
+            self.db.execute("INSERT OR REPLACE INTO scan_journal_dead VALUES (?, ?, ?, ?, ?, ?);",
+                (*row, str(e).strip(), dt.now().astimezone().isoformat()))
+            self.db.execute("DELETE FROM scan_journal WHERE seq = ?;", (row[0],))
+            self.db.execute("COMMIT;")
+        except BaseException:
+            self.db.execute("ROLLBACK;")
+            raise
+        self.attempts.pop(row[0], None)
+        self.failed += 1
+
+    @staticmethod
+    def scan(row):
+        _, employee_id, scanned_at, key = row
+        return {"employee_id": employee_id, "at": dt.fromisoformat(scanned_at), "key": key}
+
+    def start(self):
+        with self._lock:
+            # A forked worker has no copy of the replayer thread
+            if self.thread is None or self.pid != os.getpid():
+                self.pid = os.getpid()
+                self.thread = threading.Thread(target=self.run, name="timewise-journal", daemon=True)
+                self.thread.start()
+        return self
+
+    def run(self):
+        while True:
+            try:
+                while self.replay():
+                    pass
+                self.last_error = None
+                self.wake.wait()
+                self.wake.clear()
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Journal replay failed, retrying in {self.settings['retry']}s: {e}")
+                time.sleep(self.settings["retry"])
+
+    def stats(self):
+        oldest = None
+        if os.path.exists(self.path):
+            first = self.db.execute("SELECT scanned_at FROM scan_journal ORDER BY seq LIMIT 1;").fetchone()
+            if first:
+                oldest = round((dt.now().astimezone() - dt.fromisoformat(first[0])).total_seconds(), 1)
+        return {"depth": self.depth(),
+            "oldest_s": oldest,
+            "journaled": self.journaled,
+            "replayed": self.replayed,
+            "failed": self.failed,
+            "replay_rate": self.replay_rate,
+            "last_error": self.last_error}
+
+
+# PostgreSQL can't be reached, replay waits without counting it against a scan. A deadlock or serialization
+# failure is an OperationalError as well, but it is counted like any other error that may pass.
+def unreachable(e):
+    return isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError, PoolError)) \
+        and not isinstance(e, TransactionRollbackError)
+
+
+JOURNAL = Scan_Journal()
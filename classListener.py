@@ -0,0 +1,83 @@
+import os, select, threading, time
+from psycopg2 import sql
+from classHandler import Handler
+
+
+# One LISTEN connection per process shared by everything that reacts to pg_notify.
+# Subscribers give a callback per notification and optionally one that runs each time the channel is
+# (re)listened, which is where caches reload whatever they may have missed while disconnected.
+class Notify_Listener:
+    def __init__(self, handle=None, timeout=1.0, retry=5.0):
+        self.handle = handle or Handler("user")
+        self.timeout = timeout
+        self.retry = retry
+        self.pid = os.getpid()
+        self.channels = {}
+        self.connected = threading.Event()
+        self._lock = threading.Lock()
+        self.thread = None
+
+    def subscribe(self, channel, on_notify, on_connect=None):
+        with self._lock:
+            self.channels.setdefault(channel, []).append((on_notify, on_connect))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="timewise-listener", daemon=True)
+                self.thread.start()
+
+    def _call(self, callback, *args):
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"Error in notify callback {getattr(callback, '__qualname__', callback)}: {e}")
+
+    def listen(self, conn, channel):
+        with conn.cursor() as cur:
+            cur.execute(sql.SQL("LISTEN {};").format(sql.Identifier(channel)))
+        with self._lock:
+            subscribers = list(self.channels[channel])
+        for _, on_connect in subscribers:
+            if on_connect:
+                self._call(on_connect)
+
+    def run(self):
+        while True:
+            conn = None
+            try:
+                conn = self.handle.connect()
+                listening = set()
+                while True:
+                    # Channels subscribed after the thread started are picked up here
+                    with self._lock:
+                        new = [c for c in self.channels if c not in listening]
+                    for channel in new:
+                        self.listen(conn, channel)
+                        listening.add(channel)
+                    self.connected.set()
+                    if select.select([conn], [], [], self.timeout) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        with self._lock:
+                            subscribers = list(self.channels.get(notify.channel, []))
+                        for on_notify, _ in subscribers:
+                            self._call(on_notify, notify.payload)
+            except Exception as e:
+                self.connected.clear()
+                print(f"Notify listener disconnected, retrying in {self.retry}s: {e}")
+                if conn is not None and not conn.closed:
+                    conn.close()
+                time.sleep(self.retry)
+
+
+_listener = None
+_lock = threading.Lock()
+
+
+def get_listener():
+    global _listener
+    with _lock:
+        # A forked worker has no copy of the listener thread, start a new one
+        if _listener is None or _listener.pid != os.getpid():
+            _listener = Notify_Listener()
+        return _listener
@@ -47,10 +47,11 @@ class Change_City():
 
     # update config sends gps city and country data to the config database
     def update_config(self, long, lat, city, state, country):
-        self.user_handle.update_database("config_database", "key", "value", "lon", long)
-        self.user_handle.update_database("config_database", "key", "value", "lat", lat)
-        self.user_handle.update_database("config_database", "key", "value", "city", city)
-        self.user_handle.update_database("config_database", "key", "value", "state", state)
-        self.user_handle.update_database("config_database", "key", "value", "country", country)
+        self.user_handle.update_database_many("config_database", "key", "value", {
+            "lon": long,
+            "lat": lat,
+            "city": city,
+            "state": state,
+            "country": country})
         self.user_handle.update_database("updates_database", "key", "value", "weather", "NOW()")
 
@@ -1,7 +1,9 @@
-import smtplib, threading, pandas as pd, os
+import smtplib, threading, os
+from openpyxl import Workbook
 from classSettings import Setting
 from io import BytesIO
-from classHandler import Handler
+from classHandler import Handler, register_statement
+from databaseConfig import replicaSettings
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 from email.mime.text import MIMEText
@@ -13,13 +15,23 @@ from datetime import date, timedelta
 #Generate an App Password
 #Use that 16-character code instead of your normal password
 
+register_statement("mailer_report", """
+    SELECT t.work_date, t.clock_in, t.clock_out,
+        p.employee_id, p.first_name, p.last_name,
+        p.email, p.phone, p.employee_role, p.position, p.department
+    FROM timesheet_database t
+    JOIN people_database p ON p.employee_id = t.employee_id
+    WHERE t.work_date BETWEEN $1 AND $2
+    ORDER BY t.work_date, t.clock_in""", read_only=True)
+
+
 class Mailer():
     def __init__(self):
         self.today = date.today()
         self.yesterday = self.today - timedelta(days=1)
         self.week = self.today - timedelta(days=7)
         self.month = self.today - timedelta(days=30)
-        self.user_handle = Handler("user")
+        self.user_handle = Handler("user", replicas=replicaSettings()["dsns"])
         config = Setting()
         self.sender = config.sender_email
         self.spass = config.sender_password
@@ -37,41 +49,23 @@ class Mailer():
             t.join()
 
 
+    # Rows are streamed from a server side cursor into a write-only workbook, so memory stays flat for any date range.
     def generate_report(self, later):
-        start_date = date.today().strftime("%Y-%m-%d")
-        end_date = later.strftime("%Y-%m-%d")
-        query = f"""
-            SELECT t.work_date, t.clock_in, t.clock_out,
-                p.employee_id, p.first_name, p.last_name,
-                p.email, p.phone, p.employee_role, p.position, p.department
-            FROM timesheet_database t
-            JOIN people_database p ON p.employee_id = t.employee_id
-            WHERE t.work_date BETWEEN '{end_date}' AND '{start_date}'
-            ORDER BY t.work_date, t.clock_in;
-        """
-        data = self.user_handle.send_query(query)
-        cleaned_data = []
-        for row in data:
-            work_date = row[0] if len(row) > 0 else None
-            clock_in = row[1] if len(row) > 1 else None
-            clock_out = row[2] if len(row) > 2 else None
-
-            clock_in_time = None
-            clock_out_time = None
-            if clock_in is not None:
-                clock_in_time = clock_in.replace(tzinfo=None)
-            if clock_out is not None:
-                clock_out_time = clock_out.replace(tzinfo=None)
-
-            cleaned_data.append((work_date, clock_in_time, clock_out_time) + row[3:])
         columns = ["work_date", "clock_in", "clock_out", "id", "first_name", 
                 "last_name", "email", "phone", "role", "position", "department"]
-
-        df = pd.DataFrame(cleaned_data, columns=columns)
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        sheet.append(columns)
+        for rows in self.user_handle.stream_statement("mailer_report", (later, date.today()), batch=True):
+            for row in rows:
+                work_date, clock_in, clock_out = row[:3]
+                # Excel cannot store timezone aware datetimes
+                clock_in_time = clock_in.replace(tzinfo=None) if clock_in is not None else None
+                clock_out_time = clock_out.replace(tzinfo=None) if clock_out is not None else None
+                sheet.append((work_date, clock_in_time, clock_out_time) + row[3:])
 
         output = BytesIO()
-        with pd.ExcelWriter(output, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False)
+        workbook.save(output)
         output.seek(0)
         return output
 
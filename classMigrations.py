@@ -0,0 +1,587 @@
+import time
+import psycopg2
+from classHandler import Handler
+from databaseConfig import partitionSettings
+
+
+# Versioned schema changes for installs that already have their tables.
+# Each migration runs once and is recorded in schema_migrations. Migrations are never edited after
+# they ship, a change to an applied one goes in a new version.
+#   transactional=False  statements run one at a time in autocommit, needed for CREATE INDEX CONCURRENTLY.
+#                        They must be safe to run again since a failure part way leaves earlier ones applied.
+#   optional=True        a failure is reported and skipped instead of stopping startup, it is retried next run.
+MIGRATIONS = []
+
+
+def migration(version, name, statements, transactional=True, optional=False):
+    MIGRATIONS.append({"version": version, "name": name, "statements": statements,
+        "transactional": transactional, "optional": optional})
+    MIGRATIONS.sort(key=lambda m: m["version"])
+
+
+# Indexes for the scan lookup, the open shift report and the work_date range scans.
+# A CONCURRENTLY build that fails leaves an INVALID index behind, drop it before running again.
+TIMESHEET_INDEXES = {
+    # Person: WHERE employee_id = $1 ORDER BY clock_in DESC LIMIT 1
+    "timesheet_employee_clock_in_idx": "ON timesheet_database (employee_id, clock_in DESC)",
+    # Reports.get_clocked_in: WHERE clock_out IS NULL ORDER BY work_date DESC, clock_in DESC
+    "timesheet_open_shifts_idx": "ON timesheet_database (work_date DESC, clock_in DESC) WHERE clock_out IS NULL",
+    # Mailer: work_date BETWEEN $1 AND $2 ORDER BY work_date, clock_in, Reports.get_report reads it backwards
+    "timesheet_work_date_idx": "ON timesheet_database (work_date, clock_in)",
+}
+
+migration(1, "timesheet index pack",
+    [f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition};" for name, definition in TIMESHEET_INDEXES.items()]
+    + ["ANALYZE timesheet_database;"],
+    transactional=False)
+
+
+# Creates the partitions covering p_from up to p_to, each p_months long and aligned to multiples of p_months.
+# Rows that already landed in timesheet_default for a new partition's range are moved into it.
+# Returns the number of partitions created.
+TIMESHEET_ENSURE_PARTITIONS = """
+    CREATE OR REPLACE FUNCTION timesheet_ensure_partitions(p_from DATE, p_to DATE, p_months INTEGER DEFAULT 1)
+    RETURNS INTEGER LANGUAGE plpgsql AS $$
+    DECLARE
+        start_date DATE := (DATE '2000-01-01' + make_interval(months =>
+            ((extract(year FROM p_from)::int - 2000) * 12 + extract(month FROM p_from)::int - 1) / p_months * p_months))::date;
+        end_date DATE;
+        part TEXT;
+        created INTEGER := 0;
+    BEGIN
+        WHILE start_date < p_to LOOP
+            end_date := (start_date + make_interval(months => p_months))::date;
+            part := 'timesheet_' || to_char(start_date, '"y"YYYY"m"MM');
+            IF to_regclass(part) IS NULL THEN
+                IF EXISTS (SELECT 1 FROM timesheet_default WHERE work_date >= start_date AND work_date < end_date) THEN
+                    EXECUTE format('CREATE TABLE %I (LIKE timesheet_database INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', part);
+                    EXECUTE format('WITH moved AS (DELETE FROM timesheet_default WHERE work_date >= %L AND work_date < %L RETURNING *)
+                        INSERT INTO %I SELECT * FROM moved', start_date, end_date, part);
+                    EXECUTE format('ALTER TABLE timesheet_database ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)', part, start_date, end_date);
+                ELSE
+                    EXECUTE format('CREATE TABLE %I PARTITION OF timesheet_database FOR VALUES FROM (%L) TO (%L)', part, start_date, end_date);
+                END IF;
+                created := created + 1;
+            END IF;
+            start_date := end_date;
+        END LOOP;
+        RETURN created;
+    END $$;"""
+
+# Rebuilds timesheet_database as a table range partitioned by work_date and copies the existing rows over.
+# The old table keeps its id sequence so ids carry on where they were. Runs in one transaction,
+# the table is locked for the length of the copy.
+migration(2, "partition timesheet by work_date", [
+    "LOCK TABLE timesheet_database IN ACCESS EXCLUSIVE MODE;",
+    "ALTER TABLE timesheet_database RENAME TO timesheet_legacy;",
+    "ALTER TABLE timesheet_legacy RENAME CONSTRAINT timesheet_database_pkey TO timesheet_legacy_pkey;",
+    f"DROP INDEX IF EXISTS {', '.join(TIMESHEET_INDEXES)};",
+    """CREATE TABLE timesheet_database (
+        id INTEGER NOT NULL DEFAULT nextval('timesheet_database_id_seq'),
+        employee_id INTEGER NOT NULL REFERENCES people_database(employee_id) ON DELETE CASCADE,
+        clock_in TIMESTAMPTZ DEFAULT NOW(),
+        clock_out TIMESTAMPTZ,
+        work_date DATE NOT NULL DEFAULT CURRENT_DATE,
+        notes TEXT,
+        PRIMARY KEY (id, work_date)
+    ) PARTITION BY RANGE (work_date);""",
+    # Catches rows outside every partition so a late partition never rejects a scan
+    "CREATE TABLE timesheet_default PARTITION OF timesheet_database DEFAULT;",
+    TIMESHEET_ENSURE_PARTITIONS,
+    f"""SELECT timesheet_ensure_partitions(
+        LEAST((SELECT min(COALESCE(work_date, clock_in::date)) FROM timesheet_legacy), CURRENT_DATE),
+        (CURRENT_DATE + make_interval(months => {partitionSettings()["ahead"]} * {partitionSettings()["months"]}))::date,
+        {partitionSettings()["months"]});""",
+    """INSERT INTO timesheet_database (id, employee_id, clock_in, clock_out, work_date, notes)
+        SELECT id, employee_id, clock_in, clock_out, COALESCE(work_date, clock_in::date, CURRENT_DATE), notes
+        FROM timesheet_legacy;""",
+    "ALTER SEQUENCE timesheet_database_id_seq OWNED BY timesheet_database.id;",
+    "DROP TABLE timesheet_legacy;",
+    # Indexes on the parent are created on every partition, now and later
+    *[f"CREATE INDEX IF NOT EXISTS {name} {definition};" for name, definition in TIMESHEET_INDEXES.items()],
+    "ANALYZE timesheet_database;"])
+
+
+# One round trip per badge: looks the employee up, applies the debounce, opens or closes the shift
+# and returns the employee with the event. No row means the badge is unknown.
+# A scan inside the debounce window changes nothing and comes back with duplicate set and the last event.
+# p_at backdates the event for scans recorded elsewhere and replayed later, it defaults to now.
+migration(3, "clock_toggle function", ["""
+    CREATE OR REPLACE FUNCTION clock_toggle(p_employee_id INTEGER, p_debounce_seconds INTEGER DEFAULT 3, p_at TIMESTAMPTZ DEFAULT NULL)
+    RETURNS TABLE (employee_id INTEGER, first_name VARCHAR, last_name VARCHAR, email VARCHAR, phone VARCHAR,
+        pic_path VARCHAR, employee_role VARCHAR, "position" VARCHAR, department VARCHAR,
+        event_type TEXT, event_time TIMESTAMPTZ, duplicate BOOLEAN)
+    LANGUAGE plpgsql AS $$
+    #variable_conflict use_column
+    DECLARE
+        v_at TIMESTAMPTZ := COALESCE(p_at, NOW());
+        v_since DATE := (date_trunc('month', v_at) - INTERVAL '1 month')::date;
+        person people_database%ROWTYPE;
+        shift RECORD;
+    BEGIN
+        SELECT * INTO person FROM people_database p WHERE p.employee_id = p_employee_id;
+        IF NOT FOUND THEN
+            RETURN;
+        END IF;
+
+        -- Newest partitions first, older ones only for employees with no recent shift
+        SELECT t.id, t.work_date, t.clock_in, t.clock_out INTO shift FROM timesheet_database t
+        WHERE t.employee_id = p_employee_id AND t.work_date >= v_since
+        ORDER BY t.clock_in DESC LIMIT 1;
+        IF NOT FOUND THEN
+            SELECT t.id, t.work_date, t.clock_in, t.clock_out INTO shift FROM timesheet_database t
+            WHERE t.employee_id = p_employee_id AND t.work_date < v_since
+            ORDER BY t.clock_in DESC LIMIT 1;
+        END IF;
+
+        duplicate := FALSE;
+        IF shift.id IS NOT NULL AND v_at - COALESCE(shift.clock_out, shift.clock_in) <= make_interval(secs => p_debounce_seconds) THEN
+            duplicate := TRUE;
+            event_type := CASE WHEN shift.clock_out IS NULL THEN 'Clock In' ELSE 'Clock Out' END;
+            event_time := COALESCE(shift.clock_out, shift.clock_in);
+        ELSIF shift.id IS NOT NULL AND shift.clock_out IS NULL THEN
+            -- work_date is part of the key, it keeps the update on one partition
+            UPDATE timesheet_database t SET clock_out = v_at WHERE t.id = shift.id AND t.work_date = shift.work_date;
+            event_type := 'Clock Out';
+            event_time := v_at;
+        ELSE
+            INSERT INTO timesheet_database (employee_id, clock_in, work_date) VALUES (p_employee_id, v_at, v_at::date);
+            event_type := 'Clock In';
+            event_time := v_at;
+        END IF;
+
+        employee_id := person.employee_id;
+        first_name := person.first_name;
+        last_name := person.last_name;
+        email := person.email;
+        phone := person.phone;
+        pic_path := person.pic_path;
+        employee_role := person.employee_role;
+        "position" := person.position;
+        department := person.department;
+        RETURN NEXT;
+    END $$;"""])
+
+
+# Publishes every change to people_database on the people_changed channel for the employee directory.
+migration(4, "people_changed notifications", ["""
+    CREATE OR REPLACE FUNCTION people_notify() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'TRUNCATE' THEN
+            PERFORM pg_notify('people_changed', json_build_object('op', TG_OP)::text);
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM pg_notify('people_changed', json_build_object('op', TG_OP, 'employee_id', OLD.employee_id)::text);
+        END IF;
+        IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.employee_id <> OLD.employee_id) THEN
+            PERFORM pg_notify('people_changed', json_build_object('op', TG_OP, 'employee_id', NEW.employee_id)::text);
+        END IF;
+        RETURN NULL;
+    END $$;""",
+    "DROP TRIGGER IF EXISTS people_changed ON people_database;",
+    """CREATE TRIGGER people_changed AFTER INSERT OR UPDATE OR DELETE ON people_database
+        FOR EACH ROW EXECUTE FUNCTION people_notify();""",
+    "DROP TRIGGER IF EXISTS people_truncated ON people_database;",
+    """CREATE TRIGGER people_truncated AFTER TRUNCATE ON people_database
+        FOR EACH STATEMENT EXECUTE FUNCTION people_notify();"""])
+
+
+
+# Scans sent to /api/scan carry an idempotency key. clock_scan records the key with the result of the scan in the
+# same transaction, so a kiosk replaying a batch gets the first result back instead of toggling the shift again.
+# A NULL key is a plain clock_toggle.
+migration(5, "scan_requests and clock_scan", [
+    """CREATE TABLE IF NOT EXISTS scan_requests (
+        idempotency_key TEXT PRIMARY KEY,
+        employee_id INTEGER NOT NULL,
+        scanned_at TIMESTAMPTZ,
+        event_type TEXT,
+        event_time TIMESTAMPTZ,
+        duplicate BOOLEAN,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW());""",
+    "CREATE INDEX IF NOT EXISTS scan_requests_created_at_idx ON scan_requests (created_at);",
+    """CREATE OR REPLACE FUNCTION clock_scan(p_key TEXT, p_employee_id INTEGER, p_debounce_seconds INTEGER DEFAULT 3,
+        p_at TIMESTAMPTZ DEFAULT NULL)
+    RETURNS TABLE (employee_id INTEGER, first_name VARCHAR, last_name VARCHAR, email VARCHAR, phone VARCHAR,
+        pic_path VARCHAR, employee_role VARCHAR, "position" VARCHAR, department VARCHAR,
+        event_type TEXT, event_time TIMESTAMPTZ, duplicate BOOLEAN, replayed BOOLEAN)
+    LANGUAGE plpgsql AS $$
+    #variable_conflict use_column
+    DECLARE
+        done scan_requests%ROWTYPE;
+        scan RECORD;
+    BEGIN
+        IF p_key IS NOT NULL THEN
+            -- A replay of a key still being applied waits here for that transaction to finish
+            INSERT INTO scan_requests (idempotency_key, employee_id, scanned_at) VALUES (p_key, p_employee_id, p_at)
+            ON CONFLICT (idempotency_key) DO NOTHING;
+            IF NOT FOUND THEN
+                SELECT * INTO done FROM scan_requests r WHERE r.idempotency_key = p_key;
+                RETURN QUERY SELECT p.employee_id, p.first_name, p.last_name, p.email, p.phone, p.pic_path,
+                    p.employee_role, p.position, p.department, done.event_type, done.event_time, done.duplicate, TRUE
+                FROM people_database p WHERE p.employee_id = done.employee_id AND done.event_type IS NOT NULL;
+                RETURN;
+            END IF;
+        END IF;
+        FOR scan IN SELECT * FROM clock_toggle(p_employee_id, p_debounce_seconds, p_at) LOOP
+            IF p_key IS NOT NULL THEN
+                UPDATE scan_requests r SET event_type = scan.event_type, event_time = scan.event_time, duplicate = scan.duplicate
+                WHERE r.idempotency_key = p_key;
+            END IF;
+            employee_id := scan.employee_id;
+            first_name := scan.first_name;
+            last_name := scan.last_name;
+            email := scan.email;
+            phone := scan.phone;
+            pic_path := scan.pic_path;
+            employee_role := scan.employee_role;
+            "position" := scan.position;
+            department := scan.department;
+            event_type := scan.event_type;
+            event_time := scan.event_time;
+            duplicate := scan.duplicate;
+            replayed := FALSE;
+            RETURN NEXT;
+        END LOOP;
+    END $$;"""])
+
+
+# Publishes clock ins, clock outs and removed open shifts on the timesheet_changed channel for the live feed.
+# Only open shifts notify, so bulk loads of finished shifts stay quiet. Notifications are sent on commit.
+migration(6, "timesheet_changed notifications", ["""
+    CREATE OR REPLACE FUNCTION timesheet_notify() RETURNS trigger LANGUAGE plpgsql AS $$
+    DECLARE
+        shift timesheet_database%ROWTYPE;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            shift := OLD;
+        ELSE
+            shift := NEW;
+        END IF;
+        PERFORM pg_notify('timesheet_changed', json_build_object(
+            'op', CASE TG_OP WHEN 'INSERT' THEN 'in' WHEN 'UPDATE' THEN 'out' ELSE 'delete' END,
+            'id', shift.id, 'employee_id', shift.employee_id, 'work_date', shift.work_date,
+            'clock_in', shift.clock_in, 'clock_out', shift.clock_out)::text);
+        RETURN NULL;
+    END $$;""",
+    "DROP TRIGGER IF EXISTS timesheet_clocked_in ON timesheet_database;",
+    """CREATE TRIGGER timesheet_clocked_in AFTER INSERT ON timesheet_database
+        FOR EACH ROW WHEN (NEW.clock_out IS NULL) EXECUTE FUNCTION timesheet_notify();""",
+    "DROP TRIGGER IF EXISTS timesheet_clocked_out ON timesheet_database;",
+    """CREATE TRIGGER timesheet_clocked_out AFTER UPDATE OF clock_out ON timesheet_database
+        FOR EACH ROW WHEN (OLD.clock_out IS NULL AND NEW.clock_out IS NOT NULL) EXECUTE FUNCTION timesheet_notify();""",
+    "DROP TRIGGER IF EXISTS timesheet_open_removed ON timesheet_database;",
+    """CREATE TRIGGER timesheet_open_removed AFTER DELETE ON timesheet_database
+        FOR EACH ROW WHEN (OLD.clock_out IS NULL) EXECUTE FUNCTION timesheet_notify();"""])
+
+
+# Two kiosks scanning one badge at once could both find no open shift and both insert, or both close the same shift.
+# clock_toggle now takes a transaction level advisory lock on the employee before it reads the latest shift.
+# An open shift can't be made unique with an index, unique indexes on timesheet_database must include work_date.
+migration(7, "serialize clock_toggle per employee", ["""
+    CREATE OR REPLACE FUNCTION clock_toggle(p_employee_id INTEGER, p_debounce_seconds INTEGER DEFAULT 3, p_at TIMESTAMPTZ DEFAULT NULL)
+    RETURNS TABLE (employee_id INTEGER, first_name VARCHAR, last_name VARCHAR, email VARCHAR, phone VARCHAR,
+        pic_path VARCHAR, employee_role VARCHAR, "position" VARCHAR, department VARCHAR,
+        event_type TEXT, event_time TIMESTAMPTZ, duplicate BOOLEAN)
+    LANGUAGE plpgsql AS $$
+    #variable_conflict use_column
+    DECLARE
+        v_at TIMESTAMPTZ := COALESCE(p_at, NOW());
+        v_since DATE := (date_trunc('month', v_at) - INTERVAL '1 month')::date;
+        person people_database%ROWTYPE;
+        shift RECORD;
+    BEGIN
+        -- Toggles of one employee take turns until their transaction ends, the shift read below then sees the
+        -- previous toggle's row. Other employees' scans take other keys and never wait here.
+        PERFORM pg_advisory_xact_lock(hashtext('clock_toggle'), p_employee_id);
+        SELECT * INTO person FROM people_database p WHERE p.employee_id = p_employee_id;
+        IF NOT FOUND THEN
+            RETURN;
+        END IF;
+
+        -- Newest partitions first, older ones only for employees with no recent shift
+        SELECT t.id, t.work_date, t.clock_in, t.clock_out INTO shift FROM timesheet_database t
+        WHERE t.employee_id = p_employee_id AND t.work_date >= v_since
+        ORDER BY t.clock_in DESC LIMIT 1;
+        IF NOT FOUND THEN
+            SELECT t.id, t.work_date, t.clock_in, t.clock_out INTO shift FROM timesheet_database t
+            WHERE t.employee_id = p_employee_id AND t.work_date < v_since
+            ORDER BY t.clock_in DESC LIMIT 1;
+        END IF;
+
+        duplicate := FALSE;
+        IF shift.id IS NOT NULL AND v_at - COALESCE(shift.clock_out, shift.clock_in) <= make_interval(secs => p_debounce_seconds) THEN
+            duplicate := TRUE;
+            event_type := CASE WHEN shift.clock_out IS NULL THEN 'Clock In' ELSE 'Clock Out' END;
+            event_time := COALESCE(shift.clock_out, shift.clock_in);
+        ELSIF shift.id IS NOT NULL AND shift.clock_out IS NULL THEN
+            -- work_date is part of the key, it keeps the update on one partition
+            UPDATE timesheet_database t SET clock_out = v_at WHERE t.id = shift.id AND t.work_date = shift.work_date;
+            event_type := 'Clock Out';
+            event_time := v_at;
+        ELSE
+            INSERT INTO timesheet_database (employee_id, clock_in, work_date) VALUES (p_employee_id, v_at, v_at::date);
+            event_type := 'Clock In';
+            event_time := v_at;
+        END IF;
+
+        employee_id := person.employee_id;
+        first_name := person.first_name;
+        last_name := person.last_name;
+        email := person.email;
+        phone := person.phone;
+        pic_path := person.pic_path;
+        employee_role := person.employee_role;
+        "position" := person.position;
+        department := person.department;
+        RETURN NEXT;
+    END $$;"""])
+
+# Trigram indexes for Search. pg_trgm lets the ILIKE '%x%' filters use a GIN index instead of reading every row of
+# people_database, and gives the similarity() ranking of the search_*_trgm statements. The extension ships with
+# postgresql-contrib, installs without it keep the plain statements and this migration is retried on each start.
+PEOPLE_TRIGRAM_INDEXES = {
+    "people_first_name_trgm_idx": "ON people_database USING gin (first_name gin_trgm_ops)",
+    "people_last_name_trgm_idx": "ON people_database USING gin (last_name gin_trgm_ops)",
+    # Search lowercases the email on both sides
+    "people_email_trgm_idx": "ON people_database USING gin (LOWER(email) gin_trgm_ops)",
+    "people_role_trgm_idx": "ON people_database USING gin (employee_role gin_trgm_ops)",
+    "people_position_trgm_idx": "ON people_database USING gin (position gin_trgm_ops)",
+    "people_department_trgm_idx": "ON people_database USING gin (department gin_trgm_ops)",
+}
+
+migration(8, "people search trigram indexes",
+    ["CREATE EXTENSION IF NOT EXISTS pg_trgm;"]
+    + [f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition};" for name, definition in PEOPLE_TRIGRAM_INDEXES.items()]
+    + ["ANALYZE people_database;"],
+    transactional=False, optional=True)
+
+# Full text search for Search's "text" field. search_vector is generated from every attribute of an employee, names
+# weigh most and the email is split at its punctuation so its parts match too. Timesheet notes ("no clock out",
+# corrections) are matched through a partial expression index instead of a stored column: most shifts have no notes,
+# and a generated column would have to be rebuilt on every partition and copied by timesheet_ensure_partitions.
+# Queries must use to_tsvector('english', notes) with notes IS NOT NULL to reach the index.
+migration(9, "full text search", [
+    """ALTER TABLE people_database ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(first_name, '') || ' ' || coalesce(last_name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(email, '') || ' ' || translate(coalesce(email, ''), '@._-', '    ')), 'B') ||
+        setweight(to_tsvector('english', coalesce(employee_role, '') || ' ' || coalesce(position, '') || ' ' ||
+            coalesce(department, '')), 'C') ||
+        setweight(to_tsvector('english', employee_id::text || ' ' || coalesce(phone, '')), 'D')) STORED;""",
+    "CREATE INDEX IF NOT EXISTS people_search_vector_idx ON people_database USING gin (search_vector);",
+    """CREATE INDEX IF NOT EXISTS timesheet_notes_fts_idx ON timesheet_database
+        USING gin (to_tsvector('english', notes)) WHERE notes IS NOT NULL;""",
+    "ANALYZE people_database;"])
+
+# A scan older than the employee's last event, an offline kiosk's scan sent late, used to fall in the debounce window
+# (the difference is negative) and was dropped. The debounce now only applies to scans after the last event.
+# A late scan within the debounce of any recorded event is still a repeat. A late scan that opened the shift open
+# now is applied in order: it becomes the clock in and the open shift's clock in becomes its clock out. Any other
+# late scan would re-pair older shifts, it is kept in late_scans for review instead and changes nothing.
+# late is set for both, scan_requests keeps it for replays.
+migration(10, "apply late scans in order", [
+    """CREATE TABLE IF NOT EXISTS late_scans (
+        id BIGSERIAL PRIMARY KEY,
+        employee_id INTEGER NOT NULL,
+        scanned_at TIMESTAMPTZ NOT NULL,
+        received_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        reviewed BOOLEAN NOT NULL DEFAULT FALSE);""",
+    "CREATE INDEX IF NOT EXISTS late_scans_unreviewed_idx ON late_scans (received_at) WHERE NOT reviewed;",
+    "ALTER TABLE scan_requests ADD COLUMN IF NOT EXISTS late BOOLEAN;",
+    # The result columns change, CREATE OR REPLACE can't do that
+    "DROP FUNCTION IF EXISTS clock_scan(TEXT, INTEGER, INTEGER, TIMESTAMPTZ);",
+    "DROP FUNCTION IF EXISTS clock_toggle(INTEGER, INTEGER, TIMESTAMPTZ);",
+    """CREATE FUNCTION clock_toggle(p_employee_id INTEGER, p_debounce_seconds INTEGER DEFAULT 3, p_at TIMESTAMPTZ DEFAULT NULL)
+    RETURNS TABLE (employee_id INTEGER, first_name VARCHAR, last_name VARCHAR, email VARCHAR, phone VARCHAR,
+        pic_path VARCHAR, employee_role VARCHAR, "position" VARCHAR, department VARCHAR,
+        event_type TEXT, event_time TIMESTAMPTZ, duplicate BOOLEAN, late BOOLEAN)
+    LANGUAGE plpgsql AS $$
+    #variable_conflict use_column
+    DECLARE
+        v_at TIMESTAMPTZ := COALESCE(p_at, NOW());
+        v_since DATE := (date_trunc('month', v_at) - INTERVAL '1 month')::date;
+        v_debounce INTERVAL := make_interval(secs => p_debounce_seconds);
+        person people_database%ROWTYPE;
+        shift RECORD;
+        previous RECORD;
+    BEGIN
+        -- Toggles of one employee take turns until their transaction ends, the shift read below then sees the
+        -- previous toggle's row. Other employees' scans take other keys and never wait here.
+        PERFORM pg_advisory_xact_lock(hashtext('clock_toggle'), p_employee_id);
+        SELECT * INTO person FROM people_database p WHERE p.employee_id = p_employee_id;
+        IF NOT FOUND THEN
+            RETURN;
+        END IF;
+
+        -- Newest partitions first, older ones only for employees with no recent shift
+        SELECT t.id, t.work_date, t.clock_in, t.clock_out INTO shift FROM timesheet_database t
+        WHERE t.employee_id = p_employee_id AND t.work_date >= v_since
+        ORDER BY t.clock_in DESC LIMIT 1;
+        IF NOT FOUND THEN
+            SELECT t.id, t.work_date, t.clock_in, t.clock_out INTO shift FROM timesheet_database t
+            WHERE t.employee_id = p_employee_id AND t.work_date < v_since
+            ORDER BY t.clock_in DESC LIMIT 1;
+        END IF;
+
+        duplicate := FALSE;
+        late := FALSE;
+        event_type := CASE WHEN shift.clock_out IS NULL THEN 'Clock In' ELSE 'Clock Out' END;
+        event_time := COALESCE(shift.clock_out, shift.clock_in);
+        IF shift.id IS NULL OR v_at >= event_time THEN
+            IF shift.id IS NOT NULL AND v_at - event_time <= v_debounce THEN
+                duplicate := TRUE;
+            ELSIF shift.id IS NOT NULL AND shift.clock_out IS NULL THEN
+                -- work_date is part of the key, it keeps the update on one partition
+                UPDATE timesheet_database t SET clock_out = v_at WHERE t.id = shift.id AND t.work_date = shift.work_date;
+                event_type := 'Clock Out';
+                event_time := v_at;
+            ELSE
+                INSERT INTO timesheet_database (employee_id, clock_in, work_date) VALUES (p_employee_id, v_at, v_at::date);
+                event_type := 'Clock In';
+                event_time := v_at;
+            END IF;
+        ELSIF EXISTS (SELECT 1 FROM timesheet_database t
+                WHERE t.employee_id = p_employee_id
+                AND t.work_date BETWEEN (v_at - v_debounce)::date - 1 AND (v_at + v_debounce)::date + 1
+                AND (t.clock_in BETWEEN v_at - v_debounce AND v_at + v_debounce
+                    OR t.clock_out BETWEEN v_at - v_debounce AND v_at + v_debounce)) THEN
+            -- A late copy of a scan that was recorded
+            duplicate := TRUE;
+        ELSE
+            late := TRUE;
+            SELECT t.clock_in, t.clock_out INTO previous FROM timesheet_database t
+            WHERE t.employee_id = p_employee_id AND t.work_date <= shift.work_date AND t.clock_in < shift.clock_in
+            ORDER BY t.clock_in DESC LIMIT 1;
+            IF shift.clock_out IS NULL AND (previous.clock_in IS NULL OR v_at > COALESCE(previous.clock_out, previous.clock_in)) THEN
+                -- The late scan opened this shift, the scan that seemed to open it closed it
+                UPDATE timesheet_database t SET clock_in = v_at, clock_out = shift.clock_in, work_date = v_at::date
+                WHERE t.id = shift.id AND t.work_date = shift.work_date;
+                event_type := 'Clock In';
+                event_time := v_at;
+            ELSE
+                INSERT INTO late_scans (employee_id, scanned_at) VALUES (p_employee_id, v_at);
+                duplicate := TRUE;
+            END IF;
+        END IF;
+
+        employee_id := person.employee_id;
+        first_name := person.first_name;
+        last_name := person.last_name;
+        email := person.email;
+        phone := person.phone;
+        pic_path := person.pic_path;
+        employee_role := person.employee_role;
+        "position" := person.position;
+        department := person.department;
+        RETURN NEXT;
+    END $$;""",
+    """CREATE FUNCTION clock_scan(p_key TEXT, p_employee_id INTEGER, p_debounce_seconds INTEGER DEFAULT 3,
+        p_at TIMESTAMPTZ DEFAULT NULL)
+    RETURNS TABLE (employee_id INTEGER, first_name VARCHAR, last_name VARCHAR, email VARCHAR, phone VARCHAR,
+        pic_path VARCHAR, employee_role VARCHAR, "position" VARCHAR, department VARCHAR,
+        event_type TEXT, event_time TIMESTAMPTZ, duplicate BOOLEAN, replayed BOOLEAN, late BOOLEAN)
+    LANGUAGE plpgsql AS $$
+    #variable_conflict use_column
+    DECLARE
+        done scan_requests%ROWTYPE;
+        scan RECORD;
+    BEGIN
+        IF p_key IS NOT NULL THEN
+            -- A replay of a key still being applied waits here for that transaction to finish
+            INSERT INTO scan_requests (idempotency_key, employee_id, scanned_at) VALUES (p_key, p_employee_id, p_at)
+            ON CONFLICT (idempotency_key) DO NOTHING;
+            IF NOT FOUND THEN
+                SELECT * INTO done FROM scan_requests r WHERE r.idempotency_key = p_key;
+                RETURN QUERY SELECT p.employee_id, p.first_name, p.last_name, p.email, p.phone, p.pic_path,
+                    p.employee_role, p.position, p.department, done.event_type, done.event_time, done.duplicate, TRUE,
+                    COALESCE(done.late, FALSE)
+                FROM people_database p WHERE p.employee_id = done.employee_id AND done.event_type IS NOT NULL;
+                RETURN;
+            END IF;
+        END IF;
+        FOR scan IN SELECT * FROM clock_toggle(p_employee_id, p_debounce_seconds, p_at) LOOP
+            IF p_key IS NOT NULL THEN
+                UPDATE scan_requests r SET event_type = scan.event_type, event_time = scan.event_time,
+                    duplicate = scan.duplicate, late = scan.late
+                WHERE r.idempotency_key = p_key;
+            END IF;
+            employee_id := scan.employee_id;
+            first_name := scan.first_name;
+            last_name := scan.last_name;
+            email := scan.email;
+            phone := scan.phone;
+            pic_path := scan.pic_path;
+            employee_role := scan.employee_role;
+            "position" := scan.position;
+            department := scan.department;
+            event_type := scan.event_type;
+            event_time := scan.event_time;
+            duplicate := scan.duplicate;
+            replayed := FALSE;
+            late := scan.late;
+            RETURN NEXT;
+        END LOOP;
+    END $$;"""])
+
+class Migration_Runner():
+    def __init__(self, handle=None):
+        self.handle = handle or Handler("user")
+
+    def pending(self):
+        applied = {row[0] for row in self.handle.send_query("SELECT version FROM schema_migrations;", primary=True)}
+        return [m for m in MIGRATIONS if m["version"] not in applied]
+
+    # Applies every pending migration in version order and returns the versions applied.
+    # A session advisory lock keeps two processes starting at once from running the same migration.
+    def run(self):
+        self.handle.send_command("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMPTZ DEFAULT NOW());""")
+        applied = []
+        with self.handle.checkout() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT pg_advisory_lock(hashtext('schema_migrations'));")
+            try:
+                # Checked again under the lock, another process may have finished while this one waited
+                for m in self.pending():
+                    start = time.perf_counter()
+                    try:
+                        self.apply(conn, m)
+                    except psycopg2.Error as e:
+                        if not m["optional"]:
+                            raise
+                        print(f"Optional migration {m['version']} ({m['name']}) skipped: {str(e).strip()}")
+                        continue
+                    applied.append(m["version"])
+                    print(f"Migration {m['version']} ({m['name']}) applied in {time.perf_counter() - start:.1f}s")
+            finally:
+                if not conn.closed:
+                    with conn.cursor() as cur:
+                        cur.execute("SELECT pg_advisory_unlock(hashtext('schema_migrations'));")
+        if not applied:
+            print("Database schema is up to date")
+        return applied
+
+    def apply(self, conn, m):
+        record = ("INSERT INTO schema_migrations (version, name) VALUES (%s, %s);", (m["version"], m["name"]))
+        if m["transactional"]:
+            conn.autocommit = False
+            try:
+                with conn.cursor() as cur:
+                    for statement in m["statements"]:
+                        cur.execute(statement)
+                    cur.execute(*record)
+                conn.commit()
+            except psycopg2.Error:
+                conn.rollback()
+                raise
+            finally:
+                conn.autocommit = True
+        else:
+            with conn.cursor() as cur:
+                for statement in m["statements"]:
+                    cur.execute(statement)
+                cur.execute(*record)
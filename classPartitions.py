@@ -0,0 +1,84 @@
+import re
+from datetime import date
+from psycopg2 import sql
+from classHandler import Handler
+from databaseConfig import partitionSettings
+
+
+# Start of the partition `partitions - 1` before the current one. Reads bounded by it only touch the newest partitions.
+def recent_since(partitions=2):
+    months = partitionSettings()["months"]
+    today = date.today()
+    month = (today.year * 12 + today.month - 1) // months * months - (partitions - 1) * months
+    return date(month // 12, month % 12 + 1, 1)
+
+
+# Latest-first reads stay on the newest partitions. fetch(since) returns rows on or after since,
+# older(since, missing) is only called when the newest partitions hold fewer than limit rows.
+def recent_first(fetch, older, limit, since=None):
+    since = since or recent_since()
+    rows = list(fetch(since))
+    if len(rows) < limit:
+        rows += older(since, limit - len(rows))
+    return rows
+
+
+# Keeps the work_date partitions of timesheet_database ahead of the calendar and moves old ones out of it.
+# The partitions and timesheet_ensure_partitions() are created by migration 2 in classMigrations.
+class Timesheet_Partitions():
+    def __init__(self, handle=None):
+        self.handle = handle or Handler("user")
+        self.settings = partitionSettings()
+
+    # Returns (name, from, to) for every range partition, oldest first. The default partition is left out.
+    def partitions(self):
+        rows = self.handle.send_query("""
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'timesheet_database'::regclass;""", primary=True)
+        parts = []
+        for name, bound in rows:
+            dates = re.findall(r"'(\d{4}-\d{2}-\d{2})'", bound)
+            if len(dates) == 2:
+                parts.append((name, date.fromisoformat(dates[0]), date.fromisoformat(dates[1])))
+        return sorted(parts, key=lambda p: p[1])
+
+    # Creates partitions from the current one through settings["ahead"] partitions past it.
+    def ensure(self, ahead=None):
+        ahead = self.settings["ahead"] if ahead is None else ahead
+        months = self.settings["months"]
+        created = self.handle.send_query(f"""
+            SELECT timesheet_ensure_partitions(CURRENT_DATE,
+                (CURRENT_DATE + make_interval(months => {int(ahead) + 1} * {months}))::date, {months});""", primary=True)[0][0]
+        print(f"{created} timesheet partitions created")
+        return created
+
+    # Detaches every partition that ended before the cutoff. Archived partitions move to the archive schema
+    # and can be queried or re-attached later, otherwise they are dropped.
+    def detach(self, before, archive=None):
+        archive = self.settings["archive"] if archive is None else archive
+        detached = []
+        for name, start, end in self.partitions():
+            if end > before:
+                continue
+            table = sql.Identifier(name)
+            self.handle.send_command(sql.SQL("ALTER TABLE timesheet_database DETACH PARTITION {};").format(table))
+            if archive:
+                self.handle.send_command("CREATE SCHEMA IF NOT EXISTS archive;")
+                self.handle.send_command(sql.SQL("ALTER TABLE {} SET SCHEMA archive;").format(table))
+            else:
+                self.handle.send_command(sql.SQL("DROP TABLE {};").format(table))
+            detached.append(name)
+            print(f"Partition {name} ({start} to {end}) {'archived' if archive else 'dropped'}")
+        return detached
+
+    # Run by the scheduler: create upcoming partitions, then retire old ones when retain_months is set.
+    def maintain(self):
+        created = self.ensure()
+        detached = []
+        retain = self.settings["retain_months"]
+        if retain > 0:
+            today = date.today()
+            month = today.year * 12 + today.month - 1 - retain
+            detached = self.detach(date(month // 12, month % 12 + 1, 1))
+        return {"created": created, "detached": detached}
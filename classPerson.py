@@ -1,145 +1,204 @@
-import datetime as dt
-from datetime import datetime as dt, timezone
-from classHandler import Handler
-
-
-# Person takes input from idscan and stores and updates all information to retrieve employee data and update timesheets
-# A new instance of person is initalized with each scan
-class Person():
-    def __init__(self, idnumber, recent_list):
-        self.id = int(idnumber)
-        # recent list handles live updates to the home screen and reports from what was entered in the database.
-        self.recent = recent_list
-        # Handler instance connects to db
-        self.handle = Handler(profile="user")
-        # Upon init idnumber is used to look_up data in people_database
-        data = self.look_up()
-        if data:
-            # if data is returned the rest of the methods are called.
-            self.assign(data)
-            self.update_DB()
-            self.recent_list(50)
-        else:
-            # if the id is not valid default_person provides valid feedback to flask
-            data = Default_Person(self.recent, self.id)
-            self.assign([data.idnumber, data.fname, data.lname, data.email, data.phone, data.pic, data.role, data.position, data.department])
-        
-
-    # Queries the people_database for employee information reuturns set of tuples.
-    def look_up(self):
-        employee = self.handle.send_query(f"""
-            SELECT employee_id, first_name, last_name, email, phone, pic_path, employee_role, position, department
-            FROM people_database
-            WHERE employee_id = {self.id}""")
-        if not employee:
-            return None # return none to use default_person
-        return employee[0] #query returns a list of tuples index 0 bypasses dealing with the list.
-
-
-    # Assign takes the place of initalizing data in case no data is returned from lookup assign allows for graceful failure.
-    def assign(self, data):
-        # These attributes are accessed by flask
-        self.idnumber = data[0]
-        self.fname = data[1]
-        self.lname = data[2]
-        self.email = data[3]
-        self.phone = data[4]
-        self.pic = data[5]
-        self.role = data[6]
-        self.position = data[7]
-        self.department = data[8]
-        return data # Data is returned for flexibility in use instead of using object attributes.
-
-
-    # Update DB sends the employees ID to the timesheet database for record keeping.
-    def update_DB(self):
-        # Latest sends query to determine if the employee needs to be logged as clocking in or clocking out.
-        latest = self.handle.send_query(f"""
-            SELECT clock_in, clock_out FROM timesheet_database
-            WHERE employee_id = {self.id}
-            ORDER BY clock_in DESC LIMIT 1;""")
-        # prevent double scans by getting current time
-        now = dt.now(timezone.utc)
-        debounce = 3
-        # If clock in or clock out are not in the database insert new entry using clock in
-        if not latest:
-            self.handle.send_command(f"INSERT INTO timesheet_database (employee_id, clock_in) VALUES ({self.id}, NOW());")
-            action = "Clock In"
-        else:
-            clock_in, clock_out = latest[0]
-            if clock_out is None:
-                # Check that debounce secounds has passed since last scan
-                if (now - clock_in).total_seconds() <= debounce:
-                    print(f"Duplicate scan ignored for ID {self.id}")
-                    return
-                # If only clock in is present updates the entry with a clockout time.
-                self.handle.send_command(f"UPDATE timesheet_database SET clock_out = NOW() WHERE employee_id = {self.id} AND clock_out IS NULL;")
-                action = "Clock Out"
-            # If latest was present and not clock in then next entry will be a clock in
-            else:
-                if (now - clock_out).total_seconds() <= debounce:     
-                    print(f"Duplicate scan ignored for ID {self.id}")
-                    return
-                self.handle.send_command(f"INSERT INTO timesheet_database (employee_id, clock_in) VALUES ({self.id}, NOW());")
-                action = "Clock In"
-                    
-                
-        # Sends query to verify and display data commited to db. Query accounts for clock in or clock out conditions
-        data = self.handle.send_query(f"""SELECT p.first_name, p.last_name,
-                CASE WHEN t.clock_out IS NULL THEN t.clock_in ELSE t.clock_out 
-                END AS event_time,
-                CASE WHEN t.clock_out IS NULL THEN 'Clock In' ELSE 'Clock Out' 
-                END AS event_type
-            FROM people_database p
-            JOIN timesheet_database t ON p.employee_id = t.employee_id
-            WHERE p.employee_id = {self.id}
-            ORDER BY t.clock_in DESC LIMIT 2;""") # limit 2 gets in and out time for duration not implimented
-        
-        if not data:
-            return #don't update return_data
-
-        time = data[0][2]
-        # Check if datetime object was returned
-        if isinstance(time, str):
-            time = dt.fromisoformat(time)
-        time_str = time.strftime("%I:%M %p %d-%m") #Format date time object to string
-        direction = "==>" if action == "Clock In" else "<==" # connditional to determine which arrow to use.
-        self.io = "IN"if action == "Clock In" else "OUT" # conditional to determine which word to use.
-        #self.return_data = f"{self.io} {time_str} {direction} {data[0][0]} {data[0][1]}"
-        self.return_data = {"io": self.io, "time": time_str, "fname": data[0][0], "lname": data[0][1]}
-        #print(self.return_data)
-        return self.return_data # returns formatted data which can be added to recent list.
-
-
-    # Live view of recent scan in's limted by lenght.
-    def recent_list(self, length):
-        #insert return_data from update_db at the top of the list
-        self.recent.insert(0, self.return_data)
-        # if the list is longer that length remove old entries. while ensures the list is never longer even if there are persestent data errors. 
-        while len(self.recent) > length:
-            self.recent.pop(-1)
-        return self.recent # Returns a list of entries most recent at the top.
-
-
-# Default person allows for graceful failure of id's not in the database.
-class Default_Person:
-    def __init__(self, recent_list, scan):
-        # same attributes as the person class
-        self.idnumber = scan
-        self.fname = "Error"
-        self.lname = "Invalid ID"
-        self.email = " "
-        self.phone = " "
-        self.pic = "error.jpg" # error.jpg is a question mark picture
-        self.role = " "
-        self.position = " "
-        self.department = " "
-        self.recent = recent_list
-        self.time=dt.now().strftime("%H:%M") # Uses system time because database is not appended.
-        # recent list works the same as for the person class
-    def recent_list(self, length):
-        person_string = f"{self.time} ==> {self.fname} {self.lname}"
-        self.recent.insert(0, person_string)
-        while len(self.recent) > length:
-            self.recent.pop(-1)
-        return self.recent
\ No newline at end of file
+import psycopg2
+from psycopg2.pool import PoolError
+from datetime import datetime as dt
+from classHandler import Handler, register_statement
+from classDirectory import DIRECTORY
+from classScanState import SCAN_STATE
+from classIngest import SCAN_QUEUE
+from classRecent import RECENT_SCANS
+from classJournal import JOURNAL
+
+
+# A scan is one call to clock_toggle (migration 3), prepared once per pooled connection.
+register_statement("person_clock_toggle", """
+    SELECT employee_id, first_name, last_name, email, phone, pic_path, employee_role, position, department,
+        event_type, event_time, duplicate, late
+    FROM clock_toggle($1, $2)""")
+# Scans from the API, $1 is the idempotency key and $4 the time the kiosk took the scan (migration 5)
+register_statement("person_clock_scan", """
+    SELECT employee_id, first_name, last_name, email, phone, pic_path, employee_role, position, department,
+        event_type, event_time, duplicate, replayed, late
+    FROM clock_scan($1, $2, $3, $4)""")
+# Takes the clock_toggle lock of every employee in a batch up front, $1 is sorted by the caller and unnest reads it
+# in order. clock_toggle taking them again returns at once, so two batches sharing employees can't deadlock.
+register_statement("person_lock_employees", """
+    SELECT count(pg_advisory_xact_lock(hashtext('clock_toggle'), employee_id))
+    FROM unnest($1::int4[]) AS employee_id""")
+
+
+# employee_id is an int4 column, a badge outside its range can't belong to anyone and would fail the statement
+EMPLOYEE_ID_MIN, EMPLOYEE_ID_MAX = -2**31, 2**31 - 1
+
+
+def valid_employee_id(employee_id):
+    return EMPLOYEE_ID_MIN <= employee_id <= EMPLOYEE_ID_MAX
+
+
+# Keeps the employee directory and the open shift state in step with a row from clock_toggle or clock_scan.
+# A late scan changed an older shift, the open shift state is rebuilt from the database.
+def record_scan(row, replayed=False, late=False):
+    DIRECTORY.put(row[:9])
+    if late and not replayed:
+        SCAN_STATE.invalidate()
+    elif not row[11] and not replayed:
+        SCAN_STATE.record(row[0], row[9], row[10])
+
+
+# The recent scans entry shown on the home page for a clock event.
+def recent_entry(action, time, fname, lname):
+    # Check if datetime object was returned
+    if isinstance(time, str):
+        time = dt.fromisoformat(time)
+    return {"io": "IN" if action == "Clock In" else "OUT", "time": time.strftime("%I:%M %p %d-%m"), "fname": fname, "lname": lname}
+
+
+# Clocks a batch of scans in or out in one transaction without a Person per scan, for the scan API.
+# Each scan is {"employee_id", "at", "key"}, at is when the kiosk took it and key makes a replay return the
+# first result. Scans are applied oldest first and one result is returned per scan in the order given,
+# None for a badge that isn't in people_database. Journaled scans were put on the recent list when they were taken.
+def clock_scans(scans, handle=None, debounce=None, journaled=False):
+    handle = handle or Handler(profile="user")
+    debounce = Person.debounce if debounce is None else debounce
+    order = sorted(range(len(scans)), key=lambda i: scans[i]["at"])
+    results = [None] * len(scans)
+    with handle.transaction() as tx:
+        tx.statement("person_lock_employees", (sorted({scan["employee_id"] for scan in scans}),))
+        for i in order:
+            scan = scans[i]
+            rows = tx.statement("person_clock_scan", (scan.get("key"), scan["employee_id"], debounce, scan["at"]))
+            results[i] = rows[0] if rows else None
+    for row in results:
+        if row:
+            record_scan(row, replayed=row[12], late=row[13])
+            if not row[11] and not row[12] and not journaled:
+                RECENT_SCANS.add(recent_entry(row[9], row[10], row[1], row[2]))
+    return results
+
+
+# Person takes input from idscan and stores and updates all information to retrieve employee data and update timesheets
+# A new instance of person is initalized with each scan
+class Person():
+    # Seconds in which a repeat scan of the same badge is ignored
+    debounce = 3
+
+    def __init__(self, idnumber):
+        self.id = int(idnumber)
+        self.return_data = None
+        self.employee = DIRECTORY.get(self.id)
+        # Handler instance connects to db
+        self.handle = Handler(profile="user")
+        # Upon init idnumber is checked against the employee directory, then clocked in or out in one round trip
+        data = self.update_DB() if self.known() else None
+        if data:
+            # if data is returned the rest of the methods are called.
+            self.assign(data)
+            self.recent_list()
+        else:
+            # if the id is not valid default_person provides valid feedback to flask
+            data = Default_Person(self.id)
+            self.assign([data.idnumber, data.fname, data.lname, data.email, data.phone, data.pic, data.role, data.position, data.department])
+        
+
+    # Unknown badges are turned away by the in-memory employee directory without a query, but only while it
+    # is receiving every change. Otherwise clock_toggle decides, it looks the employee up itself.
+    # A badge outside the employee_id range is never journaled, it would fail every replay.
+    def known(self):
+        return valid_employee_id(self.id) and (self.employee is not None or not DIRECTORY.complete())
+
+
+    # Assign takes the place of initalizing data in case no data is returned from lookup assign allows for graceful failure.
+    def assign(self, data):
+        # These attributes are accessed by flask
+        self.idnumber = data[0]
+        self.fname = data[1]
+        self.lname = data[2]
+        self.email = data[3]
+        self.phone = data[4]
+        self.pic = data[5]
+        self.role = data[6]
+        self.position = data[7]
+        self.department = data[8]
+        return data # Data is returned for flexibility in use instead of using object attributes.
+
+
+    # Update DB sends the employees ID to the timesheet database for record keeping.
+    # clock_toggle picks clock in or clock out, applies the debounce and returns the employee and the event,
+    # so a scan is a single statement. Returns the employee data or None for an unknown badge.
+    # A repeat scan inside the debounce is turned away by the Redis claim without reaching the database,
+    # clock_toggle still applies the debounce itself for when Redis is down.
+    # In queue mode the scan is answered with the event predicted from Redis and an ingest worker commits it.
+    # While the database is unreachable, and until every scan journaled meanwhile is replayed, scans go to the journal.
+    def update_DB(self):
+        claimed, open_since = SCAN_STATE.claim(self.id, self.debounce)
+        if claimed is False and self.employee is not None:
+            self.io = "IN" if open_since else "OUT"
+            print(f"Duplicate scan ignored for ID {self.id}")
+            return self.employee
+        if JOURNAL.pending():
+            return self.journal(claimed, open_since)
+        if claimed and self.employee is not None and SCAN_QUEUE.enabled:
+            time = dt.now().astimezone()
+            action = "Clock Out" if open_since else "Clock In"
+            if SCAN_QUEUE.enqueue(self.id, self.debounce, time):
+                SCAN_STATE.record(self.id, action, time)
+                return self.event(self.employee, action, time)
+        try:
+            data = self.handle.run_statement("person_clock_toggle", (self.id, self.debounce))
+        except (psycopg2.OperationalError, psycopg2.InterfaceError, PoolError) as e:
+            print(f"Database unreachable, journaling scan for ID {self.id}: {e}")
+            return self.journal(claimed, open_since)
+        if not data:
+            return None # return none to use default_person
+        data = data[0]
+        # clock_toggle read the current row, keep the directory in step with it
+        record_scan(data, late=data[12])
+        action, time, duplicate = data[9], data[10], data[11]
+        if duplicate:
+            self.io = "IN"if action == "Clock In" else "OUT"
+            print(f"Duplicate scan ignored for ID {self.id}")
+            return data #don't update return_data
+        return self.event(data, action, time)
+
+
+    # Journal writes the scan to the local journal and answers with the event predicted from Redis,
+    # "SAVED" when Redis can't tell. The badge is checked against people_database when the journal is replayed.
+    def journal(self, claimed, open_since):
+        time = dt.now().astimezone()
+        JOURNAL.append(self.id, time)
+        data = self.employee or (self.id, "Scan", "Saved", " ", " ", "error.jpg", " ", " ", " ")
+        if claimed is None:
+            self.io = "SAVED"
+            self.return_data = {"io": self.io, "time": time.strftime("%I:%M %p %d-%m"), "fname": data[1], "lname": data[2]}
+            return data
+        action = "Clock Out" if open_since else "Clock In"
+        SCAN_STATE.record(self.id, action, time)
+        return self.event(data, action, time)
+
+
+    # Event sets the IN/OUT word and the recent list entry for a clock event and returns data.
+    def event(self, data, action, time):
+        self.io = "IN"if action == "Clock In" else "OUT" # conditional to determine which word to use.
+        self.return_data = recent_entry(action, time, data[1], data[2])
+        return data
+
+
+    # Live view of recent scans, shared by every server process and capped in RECENT_SCANS.
+    def recent_list(self):
+        # ignored duplicate scans add nothing
+        if self.return_data is not None:
+            RECENT_SCANS.add(self.return_data)
+
+
+# Default person allows for graceful failure of id's not in the database.
+class Default_Person:
+    def __init__(self, scan):
+        # same attributes as the person class
+        self.idnumber = scan
+        self.fname = "Error"
+        self.lname = "Invalid ID"
+        self.email = " "
+        self.phone = " "
+        self.pic = "error.jpg" # error.jpg is a question mark picture
+        self.role = " "
+        self.position = " "
+        self.department = " "
\ No newline at end of file
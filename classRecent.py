@@ -0,0 +1,70 @@
+import json, threading, time
+from collections import deque
+import redis
+from classRedis import RedisConnectionHandler
+from databaseConfig import recentSettings
+
+
+# Fixed size list of the latest scans, newest first. With the redis store every process pushes to one capped list,
+# LPUSH and LTRIM go in a single MULTI so it never holds more than length entries. The in-process deque is used
+# for the local store and while Redis is unreachable.
+class Recent_Scans:
+    key = "timewise:recent_scans"
+    # Seconds Redis is left alone after an error
+    retry_after = 30
+
+    def __init__(self, redis_handler=None, settings=None):
+        self._redis = redis_handler
+        self.settings = settings or recentSettings()
+        self.length = self.settings["length"]
+        self.local = deque(maxlen=self.length)
+        self.down_until = 0
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._redis is None:
+            self._redis = RedisConnectionHandler()
+        return self._redis.client
+
+    def shared(self):
+        return self.settings["store"] == "redis" and time.monotonic() >= self.down_until
+
+    def failed(self, e):
+        self.down_until = time.monotonic() + self.retry_after
+        print(f"Redis recent scans unavailable, using this process's list for {self.retry_after}s: {e}")
+
+    def add(self, entry):
+        with self._lock:
+            self.local.appendleft(entry)
+        if not self.shared():
+            return
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.lpush(self.key, json.dumps(entry))
+            pipe.ltrim(self.key, 0, self.length - 1)
+            pipe.execute()
+        except redis.RedisError as e:
+            self.failed(e)
+
+    # Newest first
+    def entries(self):
+        if self.shared():
+            try:
+                return [json.loads(entry) for entry in self.client.lrange(self.key, 0, self.length - 1)]
+            except redis.RedisError as e:
+                self.failed(e)
+        with self._lock:
+            return list(self.local)
+
+    def clear(self):
+        with self._lock:
+            self.local.clear()
+        if self.settings["store"] == "redis":
+            try:
+                self.client.delete(self.key)
+            except redis.RedisError as e:
+                self.failed(e)
+
+
+RECENT_SCANS = Recent_Scans()
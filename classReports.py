@@ -1,18 +1,43 @@
 from classHandler import Handler
+from databaseConfig import replicaSettings
+from classPartitions import recent_first
 from datetime import datetime as dt
 
 class Reports():
+    # Open shifts are found through the partial index on each partition, closed months add an empty index probe
+    clocked_in_query = """
+            SELECT t.work_date, t.clock_in, p.first_name, p.last_name, t.id
+            FROM people_database p JOIN timesheet_database t
+            ON p.employee_id = t.employee_id WHERE t.clock_out IS NULL
+            ORDER BY t.work_date DESC , t.clock_in DESC;"""
+
+    # The latest shifts come from the newest partitions, report_older_query tops them up when they hold fewer than report_limit
+    report_limit = 300
+    report_query = """
+            SELECT t.work_date,t.clock_in, t.clock_out, p.employee_id, p.first_name, p.last_name, p.employee_role, p.position, p.department
+            FROM people_database p JOIN timesheet_database t
+            ON p.employee_id = t.employee_id
+            WHERE t.work_date >= %(since)s
+            ORDER BY t.work_date DESC, t.clock_in DESC
+            LIMIT %(limit)s;"""
+
+    report_older_query = """
+            SELECT t.work_date,t.clock_in, t.clock_out, p.employee_id, p.first_name, p.last_name, p.employee_role, p.position, p.department
+            FROM people_database p JOIN timesheet_database t
+            ON p.employee_id = t.employee_id
+            WHERE t.work_date < %(since)s
+            ORDER BY t.work_date DESC, t.clock_in DESC
+            LIMIT %(limit)s;"""
+
     def __init__(self):
-        self.user_handle = Handler("user")
+        self.user_handle = Handler("user", replicas=replicaSettings()["dsns"])
 
 
     def get_clocked_in(self):
-        query_data = self.user_handle.send_query("""
-            SELECT t.work_date, t.clock_in, p.first_name, p.last_name
-            FROM people_database p JOIN timesheet_database t
-            ON p.employee_id = t.employee_id WHERE t.clock_out IS NULL
-            ORDER BY t.work_date DESC , t.clock_in DESC;""")
+        return self.format_clocked_in(self.user_handle.send_query(self.clocked_in_query))
+
 
+    def format_clocked_in(self, query_data):
         data = []
         for row in query_data:
             work_date = row[0].strftime("%m/%d/%Y")
@@ -20,7 +45,8 @@ class Reports():
             fname = row[2]
             lname = row[3]
 
-            entry = {work_date: {"clock_in": clock_in, "fname": fname, "lname": lname}}
+            # The live feed removes a shift from the board by id when it is clocked out
+            entry = {work_date: {"clock_in": clock_in, "fname": fname, "lname": lname, "id": row[4]}}
             data.append(entry)
         #print(data)
         grouped_data = {}
@@ -37,12 +63,12 @@ class Reports():
         return grouped_list
 
     def get_report(self):
-        data = self.user_handle.send_query("""
-            SELECT t.work_date,t.clock_in, t.clock_out, p.employee_id, p.first_name, p.last_name, p.employee_role, p.position, p.department
-            FROM people_database p JOIN timesheet_database t
-            ON p.employee_id = t.employee_id
-            ORDER BY t.work_date DESC, t.clock_in DESC
-            LIMIT 300;""")
+        return self.format_report(recent_first(
+            lambda since: self.user_handle.send_query(self.report_query, {"since": since, "limit": self.report_limit}),
+            lambda since, missing: self.user_handle.send_query(self.report_older_query, {"since": since, "limit": missing}),
+            self.report_limit))
+
+    def format_report(self, data):
         report = []
         for row in data:
             date, clock_in, clock_out, employee_id, first_name, last_name, employee_role, position, department = row
@@ -0,0 +1,132 @@
+import time
+import redis
+import psycopg2
+from datetime import datetime
+from classHandler import Handler
+from classRedis import RedisConnectionHandler
+
+
+# Scan path state in Redis: a debounce key per badge and the open shift start per employee.
+# SET NX PX claims a scan atomically, so two scans of one badge inside the window can't both get through
+# and a duplicate is answered without touching Postgres. Postgres stays the source of truth, the open
+# shift hash is rebuilt from timesheet_database whenever it is missing, stale or Redis comes back.
+class Scan_State:
+    debounce_prefix = "timewise:debounce:"
+    shifts_key = "timewise:open_shifts"
+    built_key = "timewise:open_shifts:built"
+    # Seconds before a rebuilt hash is rebuilt again, catches shifts closed outside the scan path
+    rebuild_every = 600
+    # Seconds Redis is left alone after an error, scans are decided by the database meanwhile
+    retry_after = 30
+
+    def __init__(self, handle=None, redis_handler=None):
+        self.handle = handle or Handler("user")
+        self._redis = redis_handler
+        self.down_until = 0
+        self.stale = False
+        self.claims = 0
+        self.duplicates = 0
+        self.rebuilds = 0
+        self.fallbacks = 0
+
+    @property
+    def client(self):
+        if self._redis is None:
+            self._redis = RedisConnectionHandler()
+        return self._redis.client
+
+    def available(self):
+        return time.monotonic() >= self.down_until
+
+    def failed(self, e):
+        self.down_until = time.monotonic() + self.retry_after
+        # Scans recorded while Redis was unreachable are only in the database
+        self.stale = True
+        print(f"Redis scan state unavailable, using the database for {self.retry_after}s: {e}")
+
+    # Claims a scan of employee_id for debounce seconds. Returns (claimed, open_since), claimed is False
+    # for a duplicate and None when Redis is unavailable and the database has to decide.
+    def claim(self, employee_id, debounce):
+        if not self.available():
+            self.fallbacks += 1
+            return None, None
+        try:
+            if self.stale:
+                self.rebuild()
+            pipe = self.client.pipeline(transaction=False)
+            pipe.exists(self.built_key)
+            pipe.hget(self.shifts_key, employee_id)
+            if debounce > 0:
+                pipe.set(f"{self.debounce_prefix}{employee_id}", 1, nx=True, px=int(debounce * 1000))
+            built, open_since, *claimed = pipe.execute()
+            claimed = claimed[0] if claimed else True
+            if not built:
+                self.rebuild()
+                open_since = self.client.hget(self.shifts_key, employee_id)
+        except redis.RedisError as e:
+            self.failed(e)
+            self.fallbacks += 1
+            return None, None
+        except psycopg2.Error as e:
+            # The database is unreachable, the state is rebuilt on a later scan
+            print(f"Open shift state could not be rebuilt: {e}")
+            self.stale = True
+            self.fallbacks += 1
+            return None, None
+        if claimed:
+            self.claims += 1
+        else:
+            self.duplicates += 1
+        return bool(claimed), datetime.fromisoformat(open_since) if open_since else None
+
+    # Mirrors a clock event written to the database.
+    def record(self, employee_id, event_type, event_time):
+        if not self.available():
+            return
+        try:
+            if event_type == "Clock In":
+                self.client.hset(self.shifts_key, employee_id, event_time.isoformat())
+            else:
+                self.client.hdel(self.shifts_key, employee_id)
+        except redis.RedisError as e:
+            self.failed(e)
+
+    # Reloads every open shift from timesheet_database in one MULTI.
+    def rebuild(self):
+        rows = self.handle.send_query("""
+            SELECT employee_id, max(clock_in) FROM timesheet_database
+            WHERE clock_out IS NULL GROUP BY employee_id;""", primary=True)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(self.shifts_key)
+        if rows:
+            pipe.hset(self.shifts_key, mapping={employee_id: clock_in.isoformat() for employee_id, clock_in in rows})
+        pipe.set(self.built_key, 1, ex=self.rebuild_every)
+        pipe.execute()
+        self.stale = False
+        self.rebuilds += 1
+        print(f"Open shift state rebuilt: {len(rows)} open shifts")
+
+    # Forces a rebuild on the next scan, for changes made to timesheet_database outside the scan path.
+    def invalidate(self):
+        try:
+            self.client.delete(self.built_key)
+        except redis.RedisError as e:
+            self.failed(e)
+
+    def open_since(self, employee_id):
+        try:
+            value = self.client.hget(self.shifts_key, employee_id)
+        except redis.RedisError as e:
+            self.failed(e)
+            return None
+        return datetime.fromisoformat(value) if value else None
+
+    def stats(self):
+        return {"available": self.available(),
+            "claims": self.claims,
+            "duplicates": self.duplicates,
+            "rebuilds": self.rebuilds,
+            "fallbacks": self.fallbacks}
+
+
+SCAN_STATE = Scan_State()
@@ -6,6 +6,9 @@ from datetime import datetime as dt
 from classMailer import Mailer
 from classNews import Update_News
 from classWeather import Weather_Report
+from classPartitions import Timesheet_Partitions
+from classScanState import SCAN_STATE
+from databaseConfig import ingestSettings
 
 # Global celery app (created later)
 celery_app = None
@@ -98,6 +101,8 @@ class Scheduler():
                     UPDATE timesheet_database
                     SET clock_out = (work_date + TIME '00:00:00')::timestamptz, notes = 'no clock out'
                     WHERE clock_out IS NULL;""")
+                # Every shift is closed, drop the open shift state so scanners rebuild it
+                SCAN_STATE.invalidate()
                 print("Auto clock-out completed")
                 return {'timestamp': dt.now().isoformat(), 'status': 'success'}
             except Exception as e:
@@ -105,6 +110,33 @@ class Scheduler():
                 raise self.retry(exc=e, countdown=300)
 
 
+        @celery_app.task(name='timewise.maintain_partitions', bind=True, max_retries=3)
+        def maintain_partitions(self):
+            try:
+                print("=== TIMESHEET PARTITION MAINTENANCE ===")
+                result = Timesheet_Partitions().maintain()
+                print("Partition maintenance completed")
+                return {'timestamp': dt.now().isoformat(), 'status': 'success', **result}
+            except Exception as e:
+                print(f"Error during partition maintenance: {e}")
+                raise self.retry(exc=e, countdown=600)
+
+
+        @celery_app.task(name='timewise.expire_scan_requests', bind=True, max_retries=3)
+        def expire_scan_requests(self):
+            try:
+                user_handle = Handler("user")
+                # Idempotency keys of /api/scan scans only need to outlive a kiosk's offline backlog
+                with user_handle.transaction() as tx:
+                    expired = tx.command("DELETE FROM scan_requests WHERE created_at < NOW() - make_interval(days => %s);",
+                        (ingestSettings()["request_days"],))
+                print(f"Expired scan requests removed: {expired}")
+                return {'timestamp': dt.now().isoformat(), 'status': 'success'}
+            except Exception as e:
+                print(f"Error expiring scan requests: {e}")
+                raise self.retry(exc=e, countdown=600)
+
+
     def define_schedule(self):
         global celery_app
         celery_app.conf.beat_schedule = {
@@ -134,6 +166,16 @@ class Scheduler():
                 'task': 'timewise.send_email',
                 'schedule': crontab(hour=23, minute=59),
             },
+
+            'maintain-partitions-daily': {
+                'task': 'timewise.maintain_partitions',
+                'schedule': crontab(hour=3, minute=30),
+            },
+
+            'expire-scan-requests-daily': {
+                'task': 'timewise.expire_scan_requests',
+                'schedule': crontab(hour=3, minute=45),
+            },
         }
 
 
@@ -1,20 +1,269 @@
+import base64, json
 from datetime import datetime as dt, date
-from classHandler import Handler
+from classHandler import Handler, register_statement, STATEMENTS
+from databaseConfig import replicaSettings
+from classPartitions import recent_first, recent_since
+
+
+# Search statements are prepared once per pooled connection, the search text is always a bound argument.
+base_query = """SELECT employee_id, first_name, last_name, email, phone, pic_path, employee_role, position, department"""
+# Every search statement returns these, in this order
+PERSON_COLUMNS = ["employee_id", "first_name", "last_name", "email", "phone", "pic_path", "employee_role", "position",
+    "department", "score"]
+
+register_statement("search_name", f"""
+    {base_query},
+    (CASE
+        WHEN first_name = $1 AND last_name = $2 THEN 4
+        WHEN first_name LIKE $1 || '%' AND last_name LIKE $2 || '%' THEN 3
+        WHEN first_name ILIKE '%' || $1 || '%' OR last_name ILIKE '%' || $1 || '%' THEN 2
+        WHEN first_name LIKE $2 || '%' AND last_name LIKE $1 || '%' THEN 1
+        ELSE 0
+    END) AS score
+    FROM people_database
+    WHERE first_name ILIKE '%' || $1 || '%'
+    OR last_name ILIKE '%' || $1 || '%'
+    OR first_name ILIKE '%' || $2 || '%'
+    OR last_name ILIKE '%' || $2 || '%'
+    ORDER BY score DESC, last_name, first_name""", read_only=True)
+
+register_statement("search_idnumber", f"""
+    {base_query},
+    (CASE WHEN employee_id = $1 THEN 1 ELSE 0 END) AS score
+    FROM people_database
+    WHERE employee_id = $1
+    ORDER BY score DESC""", read_only=True)
+
+register_statement("search_email", f"""
+    {base_query},
+    (CASE WHEN LOWER(email) = $1 THEN 3
+          WHEN LOWER(email) LIKE $1 || '%' THEN 2
+          WHEN LOWER(email) LIKE '%' || $1 || '%' THEN 1
+          ELSE 0 END) AS score
+    FROM people_database
+    WHERE LOWER(email) LIKE '%' || $1 || '%'
+    ORDER BY score DESC""", read_only=True)
+
+register_statement("search_phone", f"""
+    {base_query},
+    1 AS score
+    FROM people_database WHERE phone = $1""", read_only=True)
+
+# role, position and department share one shape, the column comes from this fixed map never from input
+for field, column in {"role": "employee_role", "position": "position", "department": "department"}.items():
+    register_statement(f"search_{field}", f"""
+        {base_query},
+        (CASE WHEN {column} = $1 THEN 3
+              WHEN {column} LIKE $1 || '%' THEN 2
+              WHEN {column} LIKE '%' || $1 || '%' THEN 1
+              ELSE 0 END) AS score
+        FROM people_database
+        WHERE {column} LIKE '%' || $1 || '%'
+        ORDER BY score DESC""", read_only=True)
+
+# Trigram variants for installs with pg_trgm (migration 8). Its GIN indexes serve the same ILIKE filters, names
+# also match on similarity so a misspelt name still finds the person. Results keep the score tiers above and
+# are ranked by similarity inside each tier: half the similarity is added to the score, it never reaches the next tier.
+register_statement("search_name_trgm", f"""
+    {base_query},
+    (CASE
+        WHEN first_name = $1 AND last_name = $2 THEN 4
+        WHEN first_name LIKE $1 || '%' AND last_name LIKE $2 || '%' THEN 3
+        WHEN first_name ILIKE '%' || $1 || '%' OR last_name ILIKE '%' || $1 || '%' THEN 2
+        WHEN first_name LIKE $2 || '%' AND last_name LIKE $1 || '%' THEN 1
+        ELSE 0
+    END) + GREATEST(similarity(first_name, $1), similarity(last_name, $2)) / 2 AS score
+    FROM people_database
+    WHERE first_name ILIKE '%' || $1 || '%'
+    OR last_name ILIKE '%' || $1 || '%'
+    OR first_name ILIKE '%' || $2 || '%'
+    OR last_name ILIKE '%' || $2 || '%'
+    OR first_name % $1
+    OR last_name % $2
+    ORDER BY score DESC, last_name, first_name""", read_only=True)
+
+register_statement("search_email_trgm", f"""
+    {base_query},
+    (CASE WHEN LOWER(email) = $1 THEN 3
+          WHEN LOWER(email) LIKE $1 || '%' THEN 2
+          WHEN LOWER(email) LIKE '%' || $1 || '%' THEN 1
+          ELSE 0 END) + similarity(LOWER(email), $1) / 2 AS score
+    FROM people_database
+    WHERE LOWER(email) LIKE '%' || $1 || '%'
+    ORDER BY score DESC, last_name, first_name""", read_only=True)
+
+for field, column in {"role": "employee_role", "position": "position", "department": "department"}.items():
+    register_statement(f"search_{field}_trgm", f"""
+        {base_query},
+        (CASE WHEN {column} = $1 THEN 3
+              WHEN {column} LIKE $1 || '%' THEN 2
+              WHEN {column} LIKE '%' || $1 || '%' THEN 1
+              ELSE 0 END) + similarity({column}, $1) / 2 AS score
+        FROM people_database
+        WHERE {column} LIKE '%' || $1 || '%'
+        ORDER BY score DESC, last_name, first_name""", read_only=True)
+
+# Full text search over every employee attribute and the timesheet notes (migration 9). An employee's score is
+# the best ts_rank of their own attributes or of any of their notes. Both sides are read through their GIN indexes.
+TEXT_MATCH = "notes IS NOT NULL AND to_tsvector('english', notes) @@ websearch_to_tsquery('english', $1)"
+
+register_statement("search_text", f"""
+    WITH matches AS (
+        SELECT employee_id, ts_rank(search_vector, websearch_to_tsquery('english', $1)) AS rank
+        FROM people_database
+        WHERE search_vector @@ websearch_to_tsquery('english', $1)
+        UNION ALL
+        SELECT employee_id, ts_rank(to_tsvector('english', notes), websearch_to_tsquery('english', $1))
+        FROM timesheet_database
+        WHERE {TEXT_MATCH})
+    SELECT {", ".join(f"p.{column}" for column in PERSON_COLUMNS[:-1])}, m.score
+    FROM (SELECT employee_id, max(rank)::float8 AS score FROM matches GROUP BY employee_id) m
+    JOIN people_database p ON p.employee_id = m.employee_id
+    ORDER BY score DESC, last_name, first_name""", read_only=True)
+
+# Times are read from the newest partitions first, search_times_older fills the page when they run short
+register_statement("search_times", """
+    SELECT id, employee_id, clock_in, clock_out, work_date
+    FROM timesheet_database
+    WHERE employee_id = $1 AND work_date >= $2
+    ORDER BY clock_in DESC
+    LIMIT $3""", read_only=True)
+
+register_statement("search_times_older", """
+    SELECT id, employee_id, clock_in, clock_out, work_date
+    FROM timesheet_database
+    WHERE employee_id = $1 AND work_date < $2
+    ORDER BY clock_in DESC
+    LIMIT $3""", read_only=True)
+
+# Order of the people in every search result, the keyset of page_of. Ties on score are broken by name and id so
+# the order, and which rows a page ends on, is the same on every run.
+SEARCH_ORDER = "p.score DESC, COALESCE(p.last_name, ''), COALESCE(p.first_name, ''), p.employee_id"
+
+
+# The people a search matches and each one's latest timesheet rows in a single statement, a search that matches
+# 200 people is still one round trip. The LATERAL read follows recent_first: the older partitions are only read
+# for a person whose newest partitions hold fewer than the limit. Rows come back as
+# (person columns, rank, id, employee_id, clock_in, clock_out, work_date, notes), ordered by SEARCH_ORDER.
+# With matches, a condition on timesheet rows, a person with matching rows gets those instead of their latest
+# and every row ends with whether it matched.
+def with_times(query, args, matches=None):
+    since, limit = f"${args + 1}", f"${args + 2}"
+    columns = ", ".join(f"people.{column}" for column in PERSON_COLUMNS)
+    noted, matched, flag, unmatched = "", "", "", ""
+    if matches:
+        noted = f""",
+            EXISTS (SELECT 1 FROM timesheet_database WHERE employee_id = p.employee_id AND {matches}) AS noted"""
+        matched = f"""(SELECT id, clock_in, clock_out, work_date, notes, true AS matched FROM timesheet_database
+         WHERE employee_id = people.employee_id AND {matches}
+         ORDER BY clock_in DESC LIMIT {limit})
+        UNION ALL
+        """
+        flag, unmatched = ", false", " AND NOT people.noted"
+    return f"""
+    WITH people AS (
+        SELECT p.*, row_number() OVER (ORDER BY {SEARCH_ORDER}) AS rank{noted} FROM ({query}) p)
+    SELECT {columns}, people.rank, t.id, people.employee_id, t.clock_in, t.clock_out, t.work_date, t.notes{", t.matched" if matches else ""}
+    FROM people LEFT JOIN LATERAL (
+        {matched}(SELECT id, clock_in, clock_out, work_date, notes{flag} FROM timesheet_database
+         WHERE employee_id = people.employee_id AND work_date >= {since}{unmatched}
+         ORDER BY clock_in DESC LIMIT {limit})
+        UNION ALL
+        (SELECT id, clock_in, clock_out, work_date, notes{flag} FROM timesheet_database
+         WHERE employee_id = people.employee_id AND work_date < {since}{unmatched}
+         ORDER BY clock_in DESC LIMIT {limit})
+        LIMIT {limit}) t ON true
+    ORDER BY people.rank, t.clock_in DESC"""
+
+# One page of a search, keyset paginated on (score, last_name, first_name, employee_id) so a later page costs the
+# same as the first. The cursor is the last row of the previous page, a NULL score starts at the top.
+def page_of(query, args):
+    score, last, first, employee_id, size = (f"${args + n}" for n in range(1, 6))
+    # The search's own ORDER BY is replaced by the keyset order
+    query = query.rsplit("ORDER BY", 1)[0] if "ORDER BY" in query else query
+    return f"""
+    SELECT * FROM ({query}) p
+    WHERE {score}::float8 IS NULL
+    OR p.score < {score}
+    OR (p.score = {score} AND (COALESCE(p.last_name, ''), COALESCE(p.first_name, ''), p.employee_id) > ({last}, {first}, {employee_id}))
+    ORDER BY {SEARCH_ORDER}
+    LIMIT {size}"""
+
+for field, args in {"name": 2, "idnumber": 1, "email": 1, "phone": 1, "role": 1, "position": 1, "department": 1,
+        "text": 1}.items():
+    # A text search shows each person's matching timesheet rows
+    matches = TEXT_MATCH if field == "text" else None
+    for name in (f"search_{field}", f"search_{field}_trgm"):
+        if name in STATEMENTS:
+            register_statement(f"{name}_times", with_times(STATEMENTS[name], args, matches), read_only=True)
+            register_statement(f"{name}_page", with_times(page_of(STATEMENTS[name], args), args + 5, matches), read_only=True)
+
+# A person's timesheet history after a cursor row, newest first. The cursor's date bounds work_date with a day
+# to spare for time zones, so partitions newer than the cursor are skipped.
+register_statement("search_times_page", """
+    SELECT id, employee_id, clock_in, clock_out, work_date, notes
+    FROM timesheet_database
+    WHERE employee_id = $1
+    AND ($2::timestamptz IS NULL OR (work_date <= $2::timestamptz::date + 1 AND (clock_in, id) < ($2, $3)))
+    ORDER BY clock_in DESC, id DESC
+    LIMIT $4""", read_only=True)
+
+# The same for a text search, only rows whose notes match $5
+register_statement("search_notes_page", f"""
+    SELECT id, employee_id, clock_in, clock_out, work_date, notes
+    FROM timesheet_database
+    WHERE employee_id = $1
+    AND ($2::timestamptz IS NULL OR (work_date <= $2::timestamptz::date + 1 AND (clock_in, id) < ($2, $3)))
+    AND {TEXT_MATCH.replace("$1", "$5")}
+    ORDER BY clock_in DESC, id DESC
+    LIMIT $4""", read_only=True)
+
+
+# Cursors travel in links and JSON as url safe base64 of the row values they continue after
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+
+def decode_cursor(token, *lengths):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+    if not isinstance(values, list) or len(values) not in lengths:
+        raise ValueError(f"Invalid cursor: {token}")
+    return values
+
+
+# Whether pg_trgm is installed, looked up once per process. Without it searches use the plain statements.
+_trigram = None
+
+def trigram_search(handle):
+    global _trigram
+    if _trigram is None:
+        try:
+            _trigram = handle.send_query("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm');")[0][0]
+        except Exception as e:
+            # Checked again on the next search
+            print(f"Error classSearch.trigram_search: {e}")
+            return False
+    return _trigram
 
 
 
 class Search():
+    # People on one page of results
+    page_size = 20
+
     def __init__(self, search, field, num_entries = 10, autorun = True):
-        self.search = search.title().strip().replace("'", "''")
+        self.search = search.title().strip()
         self.field = field
-        self.num_entries = num_entries or 10
-        self.search_handle = Handler("user")
+        self.num_entries = int(num_entries or 10)
+        self.search_handle = Handler("user", replicas=replicaSettings()["dsns"])
         if autorun == True:
             self.assign()
     
-    def field_parser(self):
-        
-        base_query = """SELECT employee_id, first_name, last_name, email, phone, pic_path, employee_role, position, department"""
+    # Picks the registered statement and bound arguments for the selected field, None if the search can't match.
+    def statement(self):
         if self.field == "name":
             twoName = self.search.split()
             if len(twoName) >1:
@@ -22,66 +271,40 @@ class Search():
                 lname = twoName[1]
             else:
                 fname = lname = twoName[0]
-            query = f"""
-                {base_query},
-                (CASE
-                    WHEN first_name = '{fname}' AND last_name = '{lname}' THEN 4
-                    WHEN first_name LIKE '{fname}%' AND last_name LIKE '{lname}%' THEN 3
-                    WHEN first_name ILIKE '%{fname}%' OR last_name ILIKE '%{fname}%' THEN 2
-                    WHEN first_name LIKE '{lname}%' AND last_name LIKE '{fname}%' THEN 1
-                    ELSE 0
-                END) AS score
-                FROM people_database
-                WHERE first_name ILIKE '%{fname}%' 
-                OR last_name ILIKE '%{fname}%'
-                OR first_name ILIKE '%{lname}%' 
-                OR last_name ILIKE '%{lname}%'
-                ORDER BY score DESC, last_name, first_name;
-            """
+            statement, params = "search_name", (fname, lname)
         elif self.field == "idnumber":
-            query = f"""
-                {base_query},
-                (CASE WHEN employee_id = '{self.search}' THEN 1 ELSE 0 END) AS score
-                FROM people_database
-                WHERE employee_id = '{self.search}'
-                ORDER BY score DESC;"""
+            try:
+                statement, params = "search_idnumber", (int(self.search),)
+            except ValueError:
+                return None
         elif self.field == "email":
-            s_lower = self.search.lower()
-            query = f"""
-                {base_query},
-                (CASE WHEN LOWER(email) = '{s_lower}' THEN 3
-                      WHEN LOWER(email) LIKE '{s_lower}%' THEN 2
-                      WHEN LOWER(email) LIKE '%{s_lower}%' THEN 1
-                      ELSE 0 END) AS score
-                FROM people_database
-                WHERE LOWER(email) LIKE '%{s_lower}%'
-                ORDER BY score DESC;
-            """
+            statement, params = "search_email", (self.search.lower(),)
         elif self.field == "phone":
-            query = f"""{base_query}
-                FROM people_database WHERE phone = '{self.search}'"""
+            statement, params = "search_phone", (self.search,)
         elif self.field in ["role", "position", "department"]:
-            query = f"""
-                {base_query},
-                (CASE WHEN {self.field} = '{self.search}' THEN 3
-                      WHEN {self.field} LIKE '{self.search}%' THEN 2
-                      WHEN {self.field} LIKE '%{self.search}%' THEN 1
-                      ELSE 0 END) AS score
-                FROM people_database
-                WHERE {self.field} LIKE '%{self.search}%'
-                ORDER BY score DESC;"""
+            statement, params = f"search_{self.field}", (self.search,)
+        elif self.field == "text":
+            statement, params = "search_text", (self.search,)
         else:
             print("Error classScheduler.fieldparser: Field not valid")
+            return None
+        if f"{statement}_trgm" in STATEMENTS and trigram_search(self.search_handle):
+            statement = f"{statement}_trgm"
+        return statement, params
 
+    def field_parser(self):
+        query = self.statement()
+        if query is None:
+            return []
         try:
-            result = self.search_handle.send_query(query)
+            result = self.search_handle.run_statement(*query)
         except Exception as e:
             print(f"Error classSchedule.field_parser: {e}")
             result=[("", "Error", "Field Parser", "", "", "", "", "", "", 0)]
+        return self.parse_people(result)
 
-
-        columns = ["employee_id", "first_name", "last_name", "email", "phone", "pic_path", "employee_role", "position", "department", "score"]
-        result = [dict(zip(columns, row)) for row in result]
+    def parse_people(self, result):
+        result = [dict(zip(PERSON_COLUMNS, row)) for row in result]
         return result
     
     def format_time(self, value):
@@ -97,17 +320,16 @@ class Search():
 
     def time_parser(self, idnumber):
         try:
-            query = f"""
-                SELECT id, employee_id, clock_in, clock_out, work_date
-                FROM timesheet_database
-                WHERE employee_id = {idnumber}
-                ORDER BY clock_in DESC
-                LIMIT {self.num_entries};"""
-            result = self.search_handle.send_query(query)
+            result = recent_first(
+                lambda since: self.search_handle.run_statement("search_times", (idnumber, since, self.num_entries)),
+                lambda since, missing: self.search_handle.run_statement("search_times_older", (idnumber, since, missing)),
+                self.num_entries)
         except Exception as e:
             print(f"Error classSchedule.time_parser: {e}")
             return []
+        return self.parse_times(result)
 
+    def parse_times(self, result):
         time_list = []
         for item in result:
             # Keep original datetime objects for calculation
@@ -134,18 +356,104 @@ class Search():
                 "clockin": clockin, 
                 "clockout": clockout,
                 "date": date_str,
-                "duration": duration
+                "duration": duration,
+                "notes": item[5] if len(item) > 5 else None
             }
             time_list.append(clock_row)
         return time_list
     
 
+    # The search statement with every person's times attached, None if the search can't match.
+    def times_statement(self):
+        query = self.statement()
+        if query is None:
+            return None
+        statement, params = query
+        return f"{statement}_times", (*params, recent_since(), self.num_entries)
+
+    # Groups the rows of a search_*_times statement into people, each with their "times". With limit every person
+    # also gets "next", the cursor of their older times or None when there are none.
+    def parse_people_times(self, rows, limit=None):
+        people, times = {}, {}
+        for row in rows:
+            rank = row[10]
+            if rank not in people:
+                people[rank] = self.parse_people([row[:10]])[0]
+                times[rank] = []
+            # A person without any timesheet rows comes back once with the time columns NULL
+            if row[11] is not None:
+                times[rank].append(row[11:])
+        for rank, person in people.items():
+            if limit is not None:
+                person["next"] = self.times_cursor(times[rank], limit)
+                times[rank] = times[rank][:limit]
+            person["times"] = self.parse_times(times[rank])
+        return list(people.values())
+
+    # Rows are fetched one past the limit, the extra row only says whether there is more.
+    # Matching rows of a text search carry the search in their cursor, the next page matches it as well.
+    def times_cursor(self, rows, limit, text=None):
+        if len(rows) <= limit:
+            return None
+        last = rows[limit - 1]
+        if len(last) > 6 and last[6]:
+            return encode_cursor([last[2].isoformat(), last[0], text or self.search])
+        return encode_cursor([last[2].isoformat(), last[0]])
+
+    # The page statement after the cursor token, None if the search can't match. Raises ValueError for a bad cursor.
+    def page_statement(self, after=None):
+        query = self.statement()
+        if query is None:
+            return None
+        statement, params = query
+        cursor = decode_cursor(after, 4) if after else [None, "", "", 0]
+        return f"{statement}_page", (*params, *cursor, self.page_size + 1, recent_since(), self.num_entries + 1)
+
+    # (people, cursor of the next page or None), each person with their first page of times
+    def parse_page(self, rows):
+        people = self.parse_people_times(rows, self.num_entries)
+        if len(people) <= self.page_size:
+            return people, None
+        people = people[:self.page_size]
+        last = people[-1]
+        return people, encode_cursor([last["score"], last["last_name"] or "", last["first_name"] or "", last["employee_id"]])
+
+    def page(self, after=None):
+        query = self.page_statement(after)
+        if query is None:
+            return [], None
+        try:
+            return self.parse_page(self.search_handle.run_statement(*query))
+        except Exception as e:
+            return self.search_error(e), None
+
+    # The next num_entries times of the employee searched by idnumber after a person's "next" cursor,
+    # as (times, cursor of the ones after them or None). Raises ValueError for a bad id or cursor.
+    def history(self, after):
+        clock_in, time_id, *text = decode_cursor(after, 2, 3)
+        if not text:
+            rows = self.search_handle.run_statement("search_times_page",
+                (int(self.search), clock_in, time_id, self.num_entries + 1))
+        else:
+            rows = self.search_handle.run_statement("search_notes_page",
+                (int(self.search), clock_in, time_id, self.num_entries + 1, text[0]))
+            # Flagged as matching so the cursor keeps the text
+            rows = [(*row, True) for row in rows]
+        return self.parse_times(rows[:self.num_entries]), self.times_cursor(rows, self.num_entries, text and text[0])
+
+    def search_error(self, e):
+        print(f"Error classSchedule.field_parser: {e}")
+        people_list = self.parse_people([("", "Error", "Field Parser", "", "", "", "", "", "", 0)])
+        people_list[0]["times"] = []
+        return people_list
+
     def assign(self):
-        people_list = self.field_parser()
-        index = 0
-        for person in people_list: 
-            ten_times = self.time_parser(person["employee_id"])
-            people_list[index]["times"] = ten_times
-            index +=1
+        query = self.times_statement()
+        people_list = []
+        if query is not None:
+            try:
+                people_list = self.parse_people_times(self.search_handle.run_statement(*query))
+            except Exception as e:
+                people_list = self.search_error(e)
         self.results = people_list
-        return people_list
\ No newline at end of file
+        return people_list
@@ -0,0 +1,175 @@
+import bisect, heapq, threading, time
+from classDirectory import DIRECTORY
+
+
+# Typeahead over the employee directory, answered from memory without a database round trip.
+# Every employee is indexed by first name, last name, full name, email and badge id. A sorted term list answers
+# exact and prefix matches with a binary search, a trigram index finds substring matches. Results follow the
+# Search score order, exact before prefix before substring, then last and first name.
+# The index follows the directory: a reload rebuilds it and every changed employee is indexed again.
+class Search_Index:
+    # Score of each kind of match, the same tiers as the search_* statements
+    EXACT, PREFIX, SUBSTRING = 3, 2, 1
+
+    def __init__(self, directory=None):
+        self.directory = directory or DIRECTORY
+        # Parallel lists sorted by term, each term with the sort key of its employee
+        self.term_list = []
+        self.key_list = []
+        self.terms = {}
+        self.keys = {}
+        self.grams = {}
+        self.loaded = False
+        self.builds = 0
+        self.updates = 0
+        self.queries = 0
+        self.query_ms = 0.0
+        self._lock = threading.Lock()
+        self._watching = False
+
+    def start(self):
+        with self._lock:
+            if not self._watching:
+                self.directory.watch(self.on_change)
+                self._watching = True
+        if self.directory.loaded and not self.loaded:
+            self.build()
+        return self
+
+    # Called by the directory with None after a reload, otherwise with the employee that changed
+    def on_change(self, employee_id):
+        if employee_id is None:
+            self.build()
+            return
+        with self._lock:
+            self.remove(employee_id)
+            row = self.directory.peek(employee_id)
+            if row is not None:
+                self.add(row)
+        self.updates += 1
+
+    def build(self):
+        with self._lock:
+            self.terms, self.keys, self.grams = {}, {}, {}
+            entries = []
+            for row in list(self.directory.employees.values()):
+                entries += self.index(row)
+            entries.sort()
+            self.term_list = [term for term, _ in entries]
+            self.key_list = [key for _, key in entries]
+            self.loaded = True
+        self.builds += 1
+        print(f"Search index built: {len(self.terms)} employees, {len(self.term_list)} terms")
+
+    # (lowered term, field, text) an employee can be found by, field is the Search field that finds them again
+    def index_terms(self, row):
+        employee_id, first_name, last_name, email = row[0], row[1] or "", row[2] or "", row[3] or ""
+        terms = [("name", first_name), ("name", last_name), ("name", f"{first_name} {last_name}".strip()),
+            ("email", email), ("idnumber", str(employee_id))]
+        return [(text.lower(), field, text) for field, text in terms if text]
+
+    def trigrams(self, text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    # Records row's terms and trigrams, returns its (term, key) entries for the sorted lists
+    def index(self, row):
+        employee_id = row[0]
+        terms = self.index_terms(row)
+        # One string sorts like (last name, first name, id) and compares much faster than the tuple
+        key = f"{(row[2] or '').lower()}\0{(row[1] or '').lower()}\0{employee_id:012d}"
+        self.terms[employee_id] = terms
+        self.keys[employee_id] = key
+        for gram in set().union(*(self.trigrams(term) for term, _, _ in terms)):
+            self.grams.setdefault(gram, set()).add(employee_id)
+        return [(term, key) for term, _, _ in terms]
+
+    # Where (term, key) is or would go, equal terms are kept in key order like a fresh build
+    def position(self, term, key):
+        low = bisect.bisect_left(self.term_list, term)
+        return bisect.bisect_left(self.key_list, key, low, bisect.bisect_right(self.term_list, term, low))
+
+    def add(self, row):
+        for term, key in self.index(row):
+            position = self.position(term, key)
+            self.term_list.insert(position, term)
+            self.key_list.insert(position, key)
+
+    def remove(self, employee_id):
+        terms = self.terms.pop(employee_id, None)
+        if terms is None:
+            return
+        key = self.keys.pop(employee_id)
+        for term, _, _ in terms:
+            position = self.position(term, key)
+            if position < len(self.term_list) and self.term_list[position] == term and self.key_list[position] == key:
+                del self.term_list[position]
+                del self.key_list[position]
+        for gram in set().union(*(self.trigrams(term) for term, _, _ in terms)):
+            ids = self.grams.get(gram)
+            if ids is not None:
+                ids.discard(employee_id)
+                if not ids:
+                    del self.grams[gram]
+
+    def employee(self, key):
+        return int(key.rsplit("\0", 1)[1])
+
+    # The best term of employee_id for query as (score, field, text)
+    def match(self, employee_id, query):
+        best = (0, None, None)
+        for term, field, text in self.terms[employee_id]:
+            score = self.EXACT if term == query else self.PREFIX if term.startswith(query) else \
+                self.SUBSTRING if query in term else 0
+            if score > best[0]:
+                best = (score, field, text)
+        return best
+
+    # The top k employees matching text as [(score, field, matched text, row)], best first.
+    # Each tier is ranked on its own and a lower one is only read when the ones above it ran short.
+    # Substring matches need three characters.
+    def suggest(self, text, k=10):
+        start = time.perf_counter()
+        query = " ".join(text.lower().split())
+        results = []
+        if query:
+            with self._lock:
+                low = bisect.bisect_left(self.term_list, query)
+                exact = bisect.bisect_right(self.term_list, query, low)
+                high = bisect.bisect_left(self.term_list, query + "\U0010ffff", exact)
+                found = set(self.key_list[low:exact])
+                chosen = heapq.nsmallest(k, found)
+                if len(chosen) < k:
+                    prefix = set(self.key_list[exact:high]) - found
+                    found |= prefix
+                    chosen += heapq.nsmallest(k - len(chosen), prefix)
+                if len(chosen) < k and len(query) >= 3:
+                    sets = sorted((self.grams.get(gram, set()) for gram in self.trigrams(query)), key=len)
+                    ids = set.intersection(*sets) if sets else set()
+                    # Trigrams can match out of order, candidates are checked best first until the page is full
+                    substring = list({self.keys[employee_id] for employee_id in ids} - found)
+                    heapq.heapify(substring)
+                    while substring and len(chosen) < k:
+                        key = heapq.heappop(substring)
+                        if self.match(self.employee(key), query)[0] == self.SUBSTRING:
+                            chosen.append(key)
+                for key in chosen:
+                    row = self.directory.peek(self.employee(key))
+                    # An employee removed from the directory before the index caught up is left out
+                    if row is not None:
+                        results.append((*self.match(row[0], query), row))
+        self.queries += 1
+        self.query_ms += (time.perf_counter() - start) * 1000
+        return results
+
+    def stats(self):
+        return {"employees": len(self.terms),
+            "terms": len(self.term_list),
+            "trigrams": len(self.grams),
+            "loaded": self.loaded,
+            "builds": self.builds,
+            "updates": self.updates,
+            "queries": self.queries,
+            "mean_ms": round(self.query_ms / self.queries, 4) if self.queries else None}
+
+
+SEARCH_INDEX = Search_Index()
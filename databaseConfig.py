@@ -1,14 +1,94 @@
-#Default setitng for the Postgre Database
-def databaseSettings():
-    return {"user" :"marcus",
-        "password" : "stoic",
-        "db_name" : "scanner",
-        "port" : 5000,
-        "host" : "localhost"}
-
-def databseAdmin(database = "postgres"):
-    return {"user" :"postgres",
-        "password" : "stoic",
-        "db_name" : database or "postgres",
-        "port" : 5000,
-        "host" : "localhost"}
+import os
+
+#Default setitng for the Postgre Database
+def databaseSettings():
+    return {"user" :"marcus",
+        "password" : "stoic",
+        "db_name" : "scanner",
+        "port" : 5000,
+        "host" : "localhost"}
+
+def databseAdmin(database = "postgres"):
+    return {"user" :"postgres",
+        "password" : "stoic",
+        "db_name" : database or "postgres",
+        "port" : 5000,
+        "host" : "localhost"}
+
+
+# Connection pool sizing shared by every Handler in a process. Environment variables override the defaults.
+def poolSettings():
+    return {"minconn" : int(os.environ.get("TIMEWISE_POOL_MIN", 1)),
+        "maxconn" : int(os.environ.get("TIMEWISE_POOL_MAX", 10)),
+        "timeout" : float(os.environ.get("TIMEWISE_POOL_TIMEOUT", 30)),
+        "check_idle" : float(os.environ.get("TIMEWISE_POOL_CHECK_IDLE", 30))}
+
+
+# Per-query timing. Statements slower than slow_query_ms are written to the slow query log.
+def metricsSettings():
+    return {"slow_query_ms" : float(os.environ.get("TIMEWISE_SLOW_QUERY_MS", 250)),
+        "slow_log_size" : int(os.environ.get("TIMEWISE_SLOW_LOG_SIZE", 100))}
+
+
+# Read-only replicas as a comma separated list of DSNs, e.g. "host=replica1,host=replica2 port=5433".
+# A replica that fails is skipped for retry_after seconds before it is tried again.
+def replicaSettings():
+    dsns = os.environ.get("TIMEWISE_REPLICAS", "")
+    return {"dsns" : [dsn.strip() for dsn in dsns.split(",") if dsn.strip()],
+        "retry_after" : float(os.environ.get("TIMEWISE_REPLICA_RETRY", 30))}
+
+
+# timesheet_database is range partitioned by work_date. months is the span of one partition,
+# ahead how many partitions are created before they are needed. Partitions that ended more than
+# retain_months ago are detached, into the archive schema when archive is on, dropped otherwise. 0 keeps everything.
+def partitionSettings():
+    return {"months" : int(os.environ.get("TIMEWISE_PARTITION_MONTHS", 1)),
+        "ahead" : int(os.environ.get("TIMEWISE_PARTITION_AHEAD", 3)),
+        "retain_months" : int(os.environ.get("TIMEWISE_PARTITION_RETAIN", 0)),
+        "archive" : os.environ.get("TIMEWISE_PARTITION_ARCHIVE", "True") == "True"}
+
+
+# How scans reach timesheet_database. "sync" writes each scan inside the request, "queue" appends it to a Redis
+# stream and ingest workers commit it in transactions of up to batch scans. The stream is split into shards by
+# employee_id, each drained by one worker at a time so an employee's scans stay in order. A kiosk is held back
+# for up to max_wait seconds while more than max_lag scans are waiting. A scan that keeps failing on a deadlock or
+# another passing error goes to the dead letter stream after retries attempts. Idempotency keys of /api/scan scans are
+# kept for request_days, a kiosk replaying older scans than that would apply them again.
+def ingestSettings():
+    return {"mode" : os.environ.get("TIMEWISE_INGEST", "sync"),
+        "shards" : int(os.environ.get("TIMEWISE_INGEST_SHARDS", 1)),
+        "batch" : int(os.environ.get("TIMEWISE_INGEST_BATCH", 200)),
+        "block_ms" : int(os.environ.get("TIMEWISE_INGEST_BLOCK_MS", 1000)),
+        "max_lag" : int(os.environ.get("TIMEWISE_INGEST_MAX_LAG", 5000)),
+        "max_wait" : float(os.environ.get("TIMEWISE_INGEST_MAX_WAIT", 2)),
+        "retries" : int(os.environ.get("TIMEWISE_INGEST_RETRIES", 10)),
+        "request_days" : int(os.environ.get("TIMEWISE_SCAN_REQUEST_DAYS", 7))}
+
+
+# The recent scans list on the home page. "redis" shares one list between every server process and kiosk,
+# "local" keeps it in memory for a single process setup. length is how many scans it holds.
+def recentSettings():
+    return {"store" : os.environ.get("TIMEWISE_RECENT_STORE", "redis"),
+        "length" : int(os.environ.get("TIMEWISE_RECENT_LENGTH", 50))}
+
+
+# Scans taken while PostgreSQL is unreachable are written to a SQLite journal at path and replayed in batches of
+# batch once it is back. The replayer checks again every retry seconds while the database is down. A scan with bad
+# data is moved to the journal's dead letter table, one that keeps failing for another reason after retries attempts.
+def journalSettings():
+    return {"path" : os.environ.get("TIMEWISE_JOURNAL", os.path.join(os.path.dirname(os.path.abspath(__file__)), "scan_journal.db")),
+        "batch" : int(os.environ.get("TIMEWISE_JOURNAL_BATCH", 200)),
+        "retry" : float(os.environ.get("TIMEWISE_JOURNAL_RETRY", 5)),
+        "retries" : int(os.environ.get("TIMEWISE_JOURNAL_RETRIES", 10))}
+
+
+# The live feed (/api/feed). An open stream keeps its request worker busy until it ends, so run the server with
+# workers that can hold long connections: gunicorn -k gevent (or eventlet), or Flask's threaded server as main.py
+# does. Under a sync worker each stream takes a whole worker, keep max_clients below the worker count there.
+# max_clients is the most streams one process serves, more get a 503. Each stream ends after lifetime seconds and
+# the browser reconnects, heartbeat is the seconds between keep alives, queue_size the events a stream may fall behind.
+def feedSettings():
+    return {"max_clients" : int(os.environ.get("TIMEWISE_FEED_MAX_CLIENTS", 50)),
+        "lifetime" : float(os.environ.get("TIMEWISE_FEED_LIFETIME", 300)),
+        "heartbeat" : float(os.environ.get("TIMEWISE_FEED_HEARTBEAT", 15)),
+        "queue_size" : int(os.environ.get("TIMEWISE_FEED_QUEUE", 100))}
@@ -0,0 +1,495 @@
+import re, statistics, sys, threading, time
+from datetime import date, datetime, timedelta
+from psycopg2.extensions import adapt
+from classHandler import Handler, STATEMENTS
+from classMigrations import TIMESHEET_INDEXES
+from classReports import Reports
+from classPartitions import recent_since
+# Importing these modules registers their statements
+import classPerson, classSearch, classMailer, services
+from classPerson import Person
+from classIngest import SCAN_QUEUE, Ingest_Worker
+from classDirectory import Employee_Directory
+from classSuggest import Search_Index
+
+# Seeded employees use ids from here up so they never collide with real badges
+SEED_ID = 900000000
+
+
+class DBBenchmark:
+    def __init__(self, handler: "Handler", iterations=200):
+        self.handler = handler
+        self.iterations = iterations
+
+    # Renders a registered statement with its arguments inlined, the way the f-string queries were built.
+    def literal(self, name, params):
+        return re.sub(r"\$(\d+)", lambda m: self.quote(params[int(m.group(1)) - 1]), STATEMENTS[name])
+
+    def quote(self, value):
+        adapted = adapt(value)
+        # Without a connection strings are quoted as latin-1, names with accents would not decode
+        if hasattr(adapted, "encoding"):
+            adapted.encoding = "utf8"
+        return adapted.getquoted().decode()
+
+    # Cases cover the scan, search and report paths with arguments that change on every call.
+    # A scan clocks in or out, it only runs on seeded employees like run_scans.
+    def cases(self):
+        ids = [r[0] for r in self.handler.send_query("SELECT employee_id FROM people_database ORDER BY employee_id LIMIT 50;")]
+        seeded = [r[0] for r in self.handler.send_query(f"SELECT employee_id FROM people_database WHERE employee_id > {SEED_ID} LIMIT 50;")]
+        names = [r for r in self.handler.send_query("SELECT first_name, last_name FROM people_database ORDER BY employee_id LIMIT 50;")]
+        today = date.today()
+        return {
+            "person_clock_toggle": [(i, 0) for i in seeded],
+            "search_name": [(f or "", l or "") for f, l in names],
+            "search_times": [(i, recent_since(), 10) for i in ids],
+            "mailer_report": [(today - timedelta(days=d), today) for d in (1, 7, 30)],
+        }
+
+    # Wall clock per call for literal SQL against the prepared statement, both through the pool.
+    def time_calls(self, name, param_sets):
+        literal_times, prepared_times = [], []
+        for i in range(self.iterations):
+            params = param_sets[i % len(param_sets)]
+            query = self.literal(name, params)
+            start = time.perf_counter()
+            self.handler.send_query(query)
+            literal_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            self.handler.run_statement(name, params)
+            prepared_times.append(time.perf_counter() - start)
+        return literal_times, prepared_times
+
+    # Server side planning and execution time from EXPLAIN ANALYZE for both forms.
+    def plan_times(self, name, param_sets):
+        literal_plan, literal_exec, prepared_plan, prepared_exec = [], [], [], []
+        with self.handler.checkout() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"PREPARE bench_{name} AS {STATEMENTS[name]};")
+                try:
+                    for i in range(self.iterations):
+                        params = param_sets[i % len(param_sets)]
+                        cur.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {self.literal(name, params)}")
+                        plan = cur.fetchone()[0][0]
+                        literal_plan.append(plan["Planning Time"])
+                        literal_exec.append(plan["Execution Time"])
+                        args = ", ".join(["%s"] * len(params))
+                        cur.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) EXECUTE bench_{name} ({args})", params)
+                        plan = cur.fetchone()[0][0]
+                        prepared_plan.append(plan["Planning Time"])
+                        prepared_exec.append(plan["Execution Time"])
+                finally:
+                    cur.execute(f"DEALLOCATE bench_{name};")
+        return literal_plan, literal_exec, prepared_plan, prepared_exec
+
+    def summary(self, values, scale=1):
+        values = sorted(v * scale for v in values)
+        return f"median {statistics.median(values):8.3f}  p95 {values[int(len(values) * 0.95) - 1]:8.3f}"
+
+    def run_statements(self):
+        print(f"Prepared statement benchmark ({self.iterations} iterations per case, times in ms)")
+        for name, param_sets in self.cases().items():
+            if not param_sets:
+                print(f"  {name}: no data to benchmark")
+                continue
+            literal_times, prepared_times = self.time_calls(name, param_sets)
+            literal_plan, literal_exec, prepared_plan, prepared_exec = self.plan_times(name, param_sets)
+            print(f"  {name}")
+            print(f"    round trip  literal  {self.summary(literal_times, 1000)}   prepared {self.summary(prepared_times, 1000)}")
+            print(f"    plan        literal  {self.summary(literal_plan)}   prepared {self.summary(prepared_plan)}")
+            print(f"    execute     literal  {self.summary(literal_exec)}   prepared {self.summary(prepared_exec)}")
+
+    # Wall clock of whole badge scans through Person, each one a clock in or out on a seeded employee.
+    def run_scans(self, scans=2000):
+        ids = [r[0] for r in self.handler.send_query(f"SELECT employee_id FROM people_database WHERE employee_id > {SEED_ID} LIMIT 200;")]
+        if not ids:
+            print("Scan benchmark needs seeded employees, run with seed first")
+            return
+        debounce, Person.debounce = Person.debounce, 0
+        times = []
+        try:
+            for i in range(scans):
+                start = time.perf_counter()
+                Person(ids[i % len(ids)])
+                times.append(time.perf_counter() - start)
+        finally:
+            Person.debounce = debounce
+        times = sorted(t * 1000 for t in times)
+        print(f"Badge scans ({scans}, ms)  median {statistics.median(times):.3f}  p95 {times[int(scans * 0.95) - 1]:.3f}  p99 {times[int(scans * 0.99) - 1]:.3f}")
+
+    # Scan latency with the scan queued for the ingest workers, then how long one worker takes to commit the backlog.
+    def run_ingest(self, scans=2000):
+        ids = [r[0] for r in self.handler.send_query(f"SELECT employee_id FROM people_database WHERE employee_id > {SEED_ID} LIMIT 200;")]
+        if not ids:
+            print("Ingest benchmark needs seeded employees, run with seed first")
+            return
+        debounce, Person.debounce = Person.debounce, 0
+        mode, SCAN_QUEUE.settings["mode"] = SCAN_QUEUE.settings["mode"], "queue"
+        times = []
+        try:
+            for i in range(scans):
+                start = time.perf_counter()
+                Person(ids[i % len(ids)])
+                times.append(time.perf_counter() - start)
+        finally:
+            Person.debounce = debounce
+            SCAN_QUEUE.settings["mode"] = mode
+        times = sorted(t * 1000 for t in times)
+        print(f"Queued scans ({scans}, ms)  median {statistics.median(times):.3f}  p95 {times[int(scans * 0.95) - 1]:.3f}  p99 {times[int(scans * 0.99) - 1]:.3f}")
+        workers = [Ingest_Worker(shard, queue=SCAN_QUEUE) for shard in range(SCAN_QUEUE.settings["shards"])]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        while SCAN_QUEUE.waiting():
+            time.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        for worker in workers:
+            worker.stop.set()
+        for worker in workers:
+            worker.thread.join()
+        batches = sum(worker.batches for worker in workers)
+        print(f"Ingest drained {scans} scans in {elapsed:.2f}s ({scans / elapsed:.0f} scans/s, {batches} batches)")
+
+    # Stress test for concurrent kiosks. Each round every thread scans at the same moment, in "same" mode several threads
+    # share each badge and in "distinct" mode every thread has its own. Toggles of one employee must see each other:
+    # never more than one open shift and exactly one row written per clock event returned. Distinct badges show
+    # whether scans of different employees still run in parallel.
+    def run_concurrency(self, threads=16, rounds=50, employees=4):
+        ids = [SEED_ID + 990000 + i for i in range(threads)]
+        self.handler.send_command(f"""
+            INSERT INTO people_database (employee_id, first_name, last_name, email, pic_path, employee_role, position, department)
+            SELECT g, 'Stress', 'Employee ' || g, 'stress' || g || '@timewise.com', 'stress_' || g || '.jpg', 'Staff', 'Seeded', 'Benchmark'
+            FROM unnest(ARRAY{ids}) g ON CONFLICT (employee_id) DO NOTHING;""")
+        for mode, badges in (("same", ids[:employees]), ("distinct", ids)):
+            self.handler.send_command(f"DELETE FROM timesheet_database WHERE employee_id = ANY(ARRAY{ids});")
+            barrier = threading.Barrier(threads)
+            events, times, errors = [], [], []
+
+            def kiosk(n):
+                handle = Handler("user")
+                for r in range(rounds):
+                    barrier.wait()
+                    start = time.perf_counter()
+                    try:
+                        row = handle.run_statement("person_clock_toggle", (badges[(n + r) % len(badges)], 0))[0]
+                        events.append((row[0], row[9], row[11]))
+                    except Exception as e:
+                        errors.append(e)
+                    times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            workers = [threading.Thread(target=kiosk, args=(n,)) for n in range(threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+            rows = self.handler.send_query(f"""
+                SELECT count(*), count(clock_out), count(*) FILTER (WHERE clock_out IS NULL)
+                FROM timesheet_database WHERE employee_id = ANY(ARRAY{ids}) GROUP BY employee_id;""", primary=True)
+            ins = sum(1 for _, event, duplicate in events if event == "Clock In" and not duplicate)
+            outs = sum(1 for _, event, duplicate in events if event == "Clock Out" and not duplicate)
+            violations = sum(1 for _, _, open_shifts in rows if open_shifts > 1)
+            lost = (ins - sum(r[0] for r in rows)) + (outs - sum(r[1] for r in rows))
+            times = sorted(t * 1000 for t in times)
+            print(f"Concurrent scans, {mode:8} badges ({len(times)} scans, {threads} threads)  {len(times) / elapsed:.0f} scans/s"
+                f"  median {statistics.median(times):.3f} ms  p99 {times[int(len(times) * 0.99) - 1]:.3f} ms")
+            print(f"  {ins} clock ins, {outs} clock outs, {len(events) - ins - outs} duplicates, {len(errors)} errors,"
+                f" {violations} employees with several open shifts, {lost} events without their row")
+        self.handler.send_command(f"DELETE FROM people_database WHERE employee_id = ANY(ARRAY{ids});")
+
+    # Search latency as the number of matched people grows, one statement for people and times against the
+    # people query followed by a times query per person. Each size gets its own department of seeded employees.
+    def run_search(self, sizes=(1, 10, 50, 200), shifts=30, runs=5):
+        base = SEED_ID + 2000000
+        for size in sizes:
+            self.handler.send_command(f"""
+                INSERT INTO people_database (employee_id, first_name, last_name, email, pic_path, employee_role, position, department)
+                SELECT {base + size * 1000} + g, 'Search', 'Employee ' || g, 'search{size}.' || g || '@timewise.com',
+                    'search_{size}_' || g || '.jpg', 'Staff', 'Seeded', 'Searchbench{size:03d}'
+                FROM generate_series(1, {size}) g ON CONFLICT (employee_id) DO NOTHING;
+                INSERT INTO timesheet_database (employee_id, clock_in, clock_out, work_date)
+                SELECT {base + size * 1000} + p, shift, shift + INTERVAL '8 hours', shift::date
+                FROM generate_series(1, {size}) p, LATERAL (
+                    SELECT NOW() - (s + p % 7) * INTERVAL '1 day' AS shift FROM generate_series(1, {shifts}) s) d;""")
+        print(f"Search by department, {shifts} shifts each, 10 time entries (median of {runs} runs, ms)")
+        for size in sizes:
+            search = classSearch.Search(f"Searchbench{size:03d}", "department", 10, autorun=False)
+            statement, single, per_person = [], [], []
+            for _ in range(runs):
+                start = time.perf_counter()
+                rows = search.search_handle.run_statement(*search.times_statement())
+                statement.append(time.perf_counter() - start)
+                people = search.parse_people_times(rows)
+                single.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                for person in search.field_parser():
+                    person["times"] = search.time_parser(person["employee_id"])
+                per_person.append(time.perf_counter() - start)
+            # The statement alone shows the database side, the rest of assign formats each time row
+            print(f"  {len(people):4} people  one statement {statistics.median(single) * 1000:8.2f}"
+                f" (query {statistics.median(statement) * 1000:7.2f})  query per person {statistics.median(per_person) * 1000:8.2f}")
+        self.handler.send_command(f"DELETE FROM people_database WHERE employee_id > {base} AND employee_id < {base + 1000000};")
+
+    # People search on a large directory, each field's statement timed and EXPLAINed. With pg_trgm (migration 8) the
+    # filters should read the trigram indexes, without it every search is a sequential scan of people_database.
+    def run_people_search(self, employees=500000, runs=5):
+        base = SEED_ID + 3000000
+        start = time.perf_counter()
+        self.handler.send_command(f"""
+            INSERT INTO people_database (employee_id, first_name, last_name, email, phone, pic_path, employee_role, position, department)
+            SELECT {base} + g, first, last, lower(first || '.' || last || g) || '@timewise.com', lpad(g::text, 10, '5'),
+                'directory_' || g || '.jpg', (ARRAY['Staff', 'Manager', 'Admin', 'Contractor'])[1 + g % 4],
+                (ARRAY['Cashier', 'Stocker', 'Driver', 'Technician', 'Supervisor', 'Analyst'])[1 + g % 6],
+                (ARRAY['Produce', 'Bakery', 'Deli', 'Logistics', 'Maintenance', 'Accounting', 'Security', 'Pharmacy'])[1 + g % 8]
+            FROM generate_series(1, {int(employees)}) g,
+                LATERAL (SELECT (ARRAY['Ada', 'Luke', 'Leia', 'Han', 'Rey', 'Finn', 'Poe', 'Lando', 'Mara', 'Wedge'])[1 + g % 10] AS first,
+                    initcap(substr(md5(g::text), 1, 8)) AS last) n
+            ON CONFLICT (employee_id) DO NOTHING;""")
+        self.handler.send_command("ANALYZE people_database;")
+        print(f"Seeded {employees} employees in {time.perf_counter() - start:.1f}s")
+        sample = self.handler.send_query(f"SELECT last_name, email FROM people_database WHERE employee_id = {base + employees // 2};")[0]
+        searches = {"name": sample[0], "email": sample[1].split("@")[0], "department": "Pharmacy", "position": "Tech", "role": "Contractor"}
+        print(f"People search on {employees} employees, trigram statements {'on' if classSearch.trigram_search(self.handler) else 'off'}"
+            f" (median of {runs} runs, ms)")
+        with self.handler.checkout() as conn:
+            with conn.cursor() as cur:
+                for field, text in searches.items():
+                    name, params = classSearch.Search(text, field, autorun=False).statement()
+                    times = []
+                    for _ in range(runs):
+                        begin = time.perf_counter()
+                        rows = self.handler.run_statement(name, params)
+                        times.append(time.perf_counter() - begin)
+                    plan, node = self.explain(cur, (self.literal(name, params), None), 1, "people_database")
+                    print(f"  {field:10} {text!r:22} {len(rows):6} rows  {statistics.median(times) * 1000:8.2f}"
+                        f"  (EXPLAIN ANALYZE {plan:7.2f})  {node}")
+        self.handler.send_command(f"DELETE FROM people_database WHERE employee_id > {base} AND employee_id <= {base + int(employees)};")
+        self.handler.send_command("ANALYZE people_database;")
+
+    # Full text search (migration 9) over the seeded shifts, about one in every noted shifts given a note for the run.
+    # Each search's first page is timed and EXPLAINed next to the ILIKE scan it replaces.
+    def run_text_search(self, noted=500, runs=5):
+        notes = ["no clock out, closed by manager", "manual correction after badge failure", "covered a double shift"]
+        self.handler.send_command(f"""
+            UPDATE timesheet_database SET notes = (ARRAY{notes})[1 + abs(hashint4(id::int)) / {int(noted)} % {len(notes)}]
+            WHERE employee_id > {SEED_ID} AND employee_id <= {SEED_ID + 1000000} AND abs(hashint4(id::int)) % {int(noted)} = 0;""")
+        self.handler.send_command("ANALYZE timesheet_database;")
+        total = self.handler.send_query("SELECT count(*) FROM timesheet_database WHERE notes IS NOT NULL;")[0][0]
+        print(f"Full text search, {total} noted shifts (median of {runs} runs, ms)")
+        try:
+            with self.handler.checkout() as conn:
+                with conn.cursor() as cur:
+                    for text, like in (("no clock out", "no clock out"), ("badge correction", "badge%correction"),
+                            ("Benchmark", "Benchmark")):
+                        search = classSearch.Search(text, "text", 10, autorun=False)
+                        name, params = search.page_statement()
+                        times = []
+                        for _ in range(runs):
+                            begin = time.perf_counter()
+                            rows = self.handler.run_statement(name, params)
+                            times.append(time.perf_counter() - begin)
+                        people = search.parse_page(rows)[0]
+                        plan, node = self.explain(cur, (self.literal("search_text", params[:1]), None), 1)
+                        scan, scan_node = self.explain(cur, (f"""
+                            SELECT DISTINCT employee_id FROM timesheet_database WHERE notes ILIKE %(like)s
+                            UNION SELECT employee_id FROM people_database
+                            WHERE concat_ws(' ', first_name, last_name, email, employee_role, position, department) ILIKE %(like)s""",
+                            {"like": f"%{like}%"}), 1)
+                        print(f"  {text!r:20} {len(people):3} people  page {statistics.median(times) * 1000:8.2f}"
+                            f"  (EXPLAIN ANALYZE {plan:8.2f}  {node})  ILIKE {scan:8.2f}  {scan_node}")
+                        self.check_pages(search)
+        finally:
+            self.handler.send_command(f"""
+                UPDATE timesheet_database SET notes = NULL
+                WHERE employee_id > {SEED_ID} AND employee_id <= {SEED_ID + 1000000} AND notes IS NOT NULL;""")
+
+    # Pages through search page_size people at a time and checks every person of the unpaged statement comes back
+    # exactly once, in the same order. ts_rank scores tie often and are rarely exact binary fractions, a cursor that
+    # lost precision repeats or skips people at page boundaries.
+    def check_pages(self, search, page_size=7):
+        name, params = search.statement()
+        expected = [row[0] for row in self.handler.run_statement(name, params)]
+        search.page_size = page_size
+        seen, after, pages = [], None, 0
+        while pages <= len(expected) // page_size + 1:
+            people, after = search.page(after)
+            seen += [person["employee_id"] for person in people]
+            pages += 1
+            if after is None:
+                break
+        scores = [row[-1] for row in self.handler.run_statement(name, params)]
+        tied = len(scores) - len(set(scores))
+        repeated = len(seen) - len(set(seen))
+        missing = len(set(expected) - set(seen))
+        print(f"  {'':20} {pages} pages of {page_size}, {len(expected)} people ({tied} tied scores):"
+            f" {repeated} repeated, {missing} missing")
+        # The unpaged order breaks ties on (last_name, first_name) only, so the sets are compared
+        assert repeated == 0 and missing == 0 and len(seen) == len(expected), f"{search.search!r} pages differ from the search"
+
+    # Late scans (migration 10) for one throwaway employee inside a transaction that is rolled back. A late clock in
+    # must reopen the shift in order, its repeat must be a duplicate and a scan inside a closed shift held for review.
+    def check_late_scans(self):
+        employee_id = SEED_ID + 4000001
+        day = datetime.now().astimezone().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+        at = lambda hours, seconds=0: day + timedelta(hours=hours, seconds=seconds)
+        expected = [
+            # (scan, status, event, shift rows afterwards as (clock_in, clock_out))
+            (at(16), "ok", "Clock In", [(at(16), None)]),
+            # The offline kiosk's clock in arrives after the clock out was taken as a clock in
+            (at(8), "late", "Clock In", [(at(8), at(16))]),
+            (at(8, 2), "duplicate", "Clock Out", [(at(8), at(16))]),
+            (at(12), "held", "Clock Out", [(at(8), at(16))]),
+            (at(17), "ok", "Clock In", [(at(8), at(16)), (at(17), None)]),
+            (at(17, 2), "duplicate", "Clock In", [(at(8), at(16)), (at(17), None)]),
+        ]
+        with self.handler.checkout() as conn:
+            autocommit, conn.autocommit = conn.autocommit, False
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("""INSERT INTO people_database (employee_id, first_name, last_name, email, pic_path)
+                        VALUES (%s, 'Late', 'Scan', 'late.scan@timewise.com', 'late_scan.jpg');""", (employee_id,))
+                    for scan_at, status, event, shifts in expected:
+                        cur.execute("SELECT * FROM clock_scan(NULL, %s, 3, %s);", (employee_id, scan_at))
+                        result = services.scan_result({"employee_id": employee_id, "at": scan_at}, cur.fetchone())
+                        cur.execute("""SELECT clock_in, clock_out FROM timesheet_database
+                            WHERE employee_id = %s ORDER BY clock_in;""", (employee_id,))
+                        rows = cur.fetchall()
+                        print(f"  {scan_at:%H:%M:%S}  {result['status']:9} {result['io']:3}  {len(rows)} shifts")
+                        assert (result["status"], result["io"], rows) == (status, "IN" if event == "Clock In" else "OUT", shifts), \
+                            f"scan at {scan_at}: {result} {rows}"
+                    cur.execute("SELECT scanned_at FROM late_scans WHERE employee_id = %s;", (employee_id,))
+                    held = [row[0] for row in cur.fetchall()]
+                    assert held == [at(12)], f"late_scans holds {held}"
+                print(f"Late scans applied in order, {len(held)} held for review")
+            finally:
+                conn.rollback()
+                conn.autocommit = autocommit
+
+    # Typeahead latency from the in-memory search index over the current directory, every prefix of sampled
+    # names, emails and ids as they would be typed.
+    def run_suggest(self, samples=200, k=10):
+        directory = Employee_Directory(self.handler)
+        directory.load()
+        index = Search_Index(directory).start()
+        rows = list(directory.employees.values())[:samples]
+        queries = [text[:n] for row in rows for text in (f"{row[1]} {row[2]}", row[3] or "", str(row[0]))
+            for n in range(1, min(len(text), 8) + 1)]
+        times = []
+        for query in queries:
+            start = time.perf_counter()
+            index.suggest(query, k)
+            times.append(time.perf_counter() - start)
+        times = sorted(t * 1000 for t in times)
+        print(f"Suggest top {k} over {len(directory.employees)} employees, {len(queries)} typed prefixes"
+            f"  median {statistics.median(times):.4f} ms  p99 {times[int(len(times) * 0.99) - 1]:.4f} ms  max {times[-1]:.4f} ms")
+
+    # Adds employees and a few years of shifts, one in every 1000 left open. Remove them with clear_seed().
+    def seed(self, rows=2000000, employees=2000):
+        start = time.perf_counter()
+        self.handler.send_command(f"""
+            INSERT INTO people_database (employee_id, first_name, last_name, email, pic_path, employee_role, position, department)
+            SELECT {SEED_ID} + g, 'Bench', 'Employee ' || g, 'bench' || g || '@timewise.com', 'bench_' || g || '.jpg',
+                'Staff', 'Seeded', 'Benchmark'
+            FROM generate_series(1, {int(employees)}) g
+            ON CONFLICT (employee_id) DO NOTHING;""")
+        self.handler.send_command(f"""
+            INSERT INTO timesheet_database (employee_id, clock_in, clock_out, work_date)
+            SELECT {SEED_ID} + 1 + g % {int(employees)}, shift,
+                CASE WHEN g % 1000 = 0 THEN NULL ELSE shift + INTERVAL '8 hours' END, shift::date
+            FROM (SELECT g, NOW() - random() * INTERVAL '1095 days' AS shift
+                  FROM generate_series(1, {int(rows)}) g) s;""")
+        self.handler.send_command("ANALYZE people_database; ANALYZE timesheet_database;")
+        print(f"Seeded {rows} shifts for {employees} employees in {time.perf_counter() - start:.1f}s")
+
+    def clear_seed(self):
+        # Shifts go with their employee through ON DELETE CASCADE
+        self.handler.send_command(f"DELETE FROM people_database WHERE employee_id > {SEED_ID};")
+        self.handler.send_command("ANALYZE timesheet_database;")
+
+    # The timesheet read paths the index pack is meant for, as (query, params).
+    def index_paths(self):
+        today = date.today()
+        return {
+            # The shift lookup inside clock_toggle
+            "scan latest shift": ("""SELECT id, work_date, clock_in, clock_out FROM timesheet_database
+                WHERE employee_id = %s AND work_date >= %s ORDER BY clock_in DESC LIMIT 1""", (SEED_ID + 1, recent_since())),
+            "reports clocked in": (Reports.clocked_in_query, None),
+            "reports latest 300": (Reports.report_query, {"since": recent_since(), "limit": Reports.report_limit}),
+            "mailer last 7 days": (self.literal("mailer_report", (today - timedelta(days=7), today)), None),
+        }
+
+    def explain(self, cur, query, runs, table="timesheet_"):
+        times = []
+        for _ in range(runs):
+            cur.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {query[0]}", query[1])
+            plan = cur.fetchone()[0][0]
+            times.append(plan["Planning Time"] + plan["Execution Time"])
+        return statistics.median(times), self.scan_node(plan["Plan"], table)
+
+    # How the plan reads timesheet_database or its partitions, e.g. "Index Scan timesheet_employee_clock_in_idx"
+    def scan_node(self, node, table):
+        if node.get("Relation Name", "").startswith(table):
+            # A bitmap heap scan names its index on the child node
+            index = node.get("Index Name") or next((c.get("Index Name") for c in node.get("Plans", []) if c.get("Index Name")), "")
+            return f"{node['Node Type']} {index}".strip()
+        for child in node.get("Plans", []):
+            found = self.scan_node(child, table)
+            if found:
+                return found
+        return None
+
+    # EXPLAIN ANALYZE of every path with the index pack and without it. The "without" runs drop the indexes
+    # inside a transaction that is rolled back, which blocks writes to timesheet_database meanwhile,
+    # so run it against a copy of the database rather than a live one.
+    def run_indexes(self, runs=5):
+        rows = self.handler.send_query("SELECT count(*) FROM timesheet_database;")[0][0]
+        print(f"Index pack on {rows} timesheet rows (median of {runs} EXPLAIN ANALYZE runs, planning + execution, ms)")
+        present = {r[0] for r in self.handler.send_query("SELECT indexname FROM pg_indexes WHERE tablename = 'timesheet_database';")}
+        missing = [name for name in TIMESHEET_INDEXES if name not in present]
+        if missing:
+            print(f"  Indexes missing, run the migrations first: {', '.join(missing)}")
+            return
+        with self.handler.checkout() as conn:
+            conn.autocommit = False
+            with conn.cursor() as cur:
+                after = {name: self.explain(cur, query, runs) for name, query in self.index_paths().items()}
+                for name in TIMESHEET_INDEXES:
+                    cur.execute(f"DROP INDEX {name};")
+                before = {name: self.explain(cur, query, runs) for name, query in self.index_paths().items()}
+            conn.rollback()
+        for name in after:
+            (old, old_node), (new, new_node) = before[name], after[name]
+            print(f"  {name:20} without {old:9.2f}  {old_node}")
+            print(f"  {'':20} with    {new:9.2f}  {new_node}   {old / new:.1f}x")
+
+
+# python db_benchmark.py [statements|indexes|scans|ingest|concurrency|late|search|people|text|suggest] [seed ROWS] [clear]
+if __name__ == "__main__":
+    bench = DBBenchmark(Handler(profile="user"))
+    args = sys.argv[1:] or ["statements"]
+    if "seed" in args:
+        position = args.index("seed") + 1
+        bench.seed(int(args[position]) if position < len(args) and args[position].isdigit() else 2000000)
+    if "statements" in args:
+        bench.run_statements()
+    if "indexes" in args:
+        bench.run_indexes()
+    if "scans" in args:
+        bench.run_scans()
+    if "ingest" in args:
+        bench.run_ingest()
+    if "concurrency" in args:
+        bench.run_concurrency()
+    if "late" in args:
+        bench.check_late_scans()
+    if "search" in args:
+        bench.run_search()
+    if "people" in args:
+        bench.run_people_search()
+    if "text" in args:
+        bench.run_text_search()
+    if "suggest" in args:
+        bench.run_suggest()
+    if "clear" in args:
+        bench.clear_seed()
@@ -0,0 +1,205 @@
+import argparse, csv, http.client, json, os, random, statistics, threading, time
+from datetime import date, datetime as dt
+from urllib.parse import urlencode, urlsplit
+
+
+# Load generator for the scan path of a running server (python main.py, gunicorn, ...).
+#   kiosks  N kiosks post badges from samples/employees.csv as fast as the server answers, or at --rate scans/s each
+#   replay  the clock ins and outs of a recorded day are sent again in order, --speed times faster than they happened
+# Throughput, p50/p95/p99 latency and the error rate are printed and written as JSON so runs can be compared.
+#   python loadtest.py kiosks --kiosks 20 --duration 30
+#   python loadtest.py replay --day 2025-11-26 --speed 120 --endpoint api
+class Load_Test:
+    def __init__(self, url="http://localhost:2000", endpoint="home", timeout=30):
+        parts = urlsplit(url)
+        self.url = url
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.latencies = []
+        self.errors = 0
+        self.statuses = {}
+        self.late = []
+        self._lock = threading.Lock()
+
+    # One keep-alive connection per kiosk thread
+    def connection(self):
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def request(self, conn, employee_id):
+        if self.endpoint == "api":
+            body = json.dumps({"employee_id": employee_id, "scanned_at": dt.now().astimezone().isoformat(),
+                "idempotency_key": f"loadtest-{os.getpid()}-{threading.get_ident()}-{time.perf_counter_ns()}"})
+            conn.request("POST", "/api/scan", body, {"Content-Type": "application/json"})
+        else:
+            conn.request("POST", "/home", urlencode({"idscan": employee_id}), {"Content-Type": "application/x-www-form-urlencoded"})
+        response = conn.getresponse()
+        data = response.read()
+        # /home answers 200 with a flashed message when the scan failed
+        failed = response.status >= 400 or (self.endpoint == "home" and b"Failed to match person to ID" in data)
+        return response.status, failed
+
+    def scan(self, conn, employee_id):
+        start = time.perf_counter()
+        try:
+            status, failed = self.request(conn, employee_id)
+        except (OSError, http.client.HTTPException) as e:
+            status, failed = type(e).__name__, True
+            conn.close()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.latencies.append(elapsed)
+            self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+            self.errors += failed
+
+    # Every kiosk scans random badges until duration runs out, rate limits each kiosk to that many scans a second
+    def kiosks(self, badges, kiosks=10, duration=30, rate=None):
+        deadline = time.monotonic() + duration
+
+        def kiosk():
+            conn = self.connection()
+            generator = random.Random()
+            next_scan = time.monotonic()
+            while time.monotonic() < deadline:
+                if rate:
+                    next_scan += generator.expovariate(rate)
+                    time.sleep(max(0, next_scan - time.monotonic()))
+                self.scan(conn, generator.choice(badges))
+            conn.close()
+
+        return self.run([threading.Thread(target=kiosk) for _ in range(kiosks)])
+
+    # Sends each (time, employee_id) of the trace at its place on a clock running speed times faster.
+    # Scans are spread over kiosks threads, lateness is how far behind the accelerated clock a scan was sent.
+    def replay(self, trace, speed=60, kiosks=10):
+        trace = sorted(trace)
+        if not trace:
+            raise ValueError("The trace is empty")
+        first = trace[0][0]
+        begin = time.monotonic()
+        shares = [trace[i::kiosks] for i in range(kiosks)]
+
+        def kiosk(share):
+            conn = self.connection()
+            for at, employee_id in share:
+                due = begin + (at - first).total_seconds() / speed
+                wait = due - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                else:
+                    with self._lock:
+                        self.late.append(-wait)
+                self.scan(conn, employee_id)
+            conn.close()
+
+        return self.run([threading.Thread(target=kiosk, args=(share,)) for share in shares if share])
+
+    def run(self, threads):
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start
+
+    def percentile(self, values, p):
+        return values[min(len(values) - 1, int(len(values) * p))]
+
+    def report(self, elapsed, config):
+        times = sorted(t * 1000 for t in self.latencies)
+        scans = len(times)
+        result = {"started": config.pop("started"),
+            "config": config,
+            "scans": scans,
+            "errors": self.errors,
+            "error_rate": round(self.errors / scans, 4) if scans else None,
+            "duration_s": round(elapsed, 3),
+            "throughput": round(scans / elapsed, 1) if elapsed else None,
+            "statuses": self.statuses}
+        if times:
+            result["latency_ms"] = {"p50": round(self.percentile(times, 0.50), 3),
+                "p95": round(self.percentile(times, 0.95), 3),
+                "p99": round(self.percentile(times, 0.99), 3),
+                "mean": round(statistics.mean(times), 3),
+                "max": round(times[-1], 3)}
+        if self.late:
+            result["late_scans"] = len(self.late)
+            result["max_late_ms"] = round(max(self.late) * 1000, 1)
+        result["server"] = self.server_metrics()
+        return result
+
+    # The server's own counters (/metrics) after the run, None when they can't be read
+    def server_metrics(self):
+        try:
+            conn = self.connection()
+            conn.request("GET", "/metrics")
+            response = conn.getresponse()
+            data = json.loads(response.read()) if response.status == 200 else None
+            conn.close()
+        except (OSError, http.client.HTTPException, ValueError):
+            return None
+        return data and {key: data[key] for key in ("pools", "scan_state", "ingest", "journal") if key in data}
+
+
+def sample_badges(path):
+    with open(path, newline="") as file:
+        return [int(row["employee_id"]) for row in csv.DictReader(file)]
+
+
+# Every clock in and clock out that happened on day in timesheet_database as (time, employee_id)
+def recorded_day(day):
+    # Only replays of a recorded day need the database, kiosk runs just talk to the server
+    from classHandler import Handler
+    rows = Handler("user").send_query("""
+        SELECT clock_in, employee_id FROM timesheet_database WHERE work_date = %(day)s
+        UNION ALL
+        SELECT clock_out, employee_id FROM timesheet_database
+        WHERE clock_out >= %(day)s AND clock_out < %(day)s + 1;""",
+        {"day": day})
+    return [(at, employee_id) for at, employee_id in rows]
+
+
+# A trace file is a CSV of employee_id,scanned_at with ISO timestamps
+def trace_file(path):
+    with open(path, newline="") as file:
+        return [(dt.fromisoformat(row["scanned_at"]), int(row["employee_id"])) for row in csv.DictReader(file)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the TimeWise scan path")
+    parser.add_argument("mode", choices=["kiosks", "replay"])
+    parser.add_argument("--url", default="http://localhost:2000")
+    parser.add_argument("--endpoint", choices=["home", "api"], default="home")
+    parser.add_argument("--kiosks", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30, help="seconds, kiosks mode")
+    parser.add_argument("--rate", type=float, help="scans a second per kiosk, kiosks mode, as fast as possible when left out")
+    parser.add_argument("--badges", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "samples", "employees.csv"))
+    parser.add_argument("--day", type=date.fromisoformat, help="recorded day to replay from timesheet_database")
+    parser.add_argument("--trace", help="CSV of employee_id,scanned_at to replay instead of a recorded day")
+    parser.add_argument("--speed", type=float, default=60, help="replay clock speed up")
+    parser.add_argument("--out", default="loadtest_results", help="directory the JSON results are written to")
+    args = parser.parse_args()
+
+    test = Load_Test(args.url, args.endpoint)
+    config = {key: str(value) if key == "day" else value for key, value in vars(args).items() if value is not None}
+    config["started"] = dt.now().astimezone().isoformat()
+    if args.mode == "kiosks":
+        elapsed = test.kiosks(sample_badges(args.badges), args.kiosks, args.duration, args.rate)
+    else:
+        if not args.trace and not args.day:
+            parser.error("replay needs --day or --trace")
+        trace = trace_file(args.trace) if args.trace else recorded_day(args.day)
+        config["trace_scans"] = len(trace)
+        elapsed = test.replay(trace, args.speed, args.kiosks)
+    result = test.report(elapsed, config)
+
+    os.makedirs(args.out, exist_ok=True)
+    path = os.path.join(args.out, f"loadtest_{args.mode}_{dt.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, "w") as file:
+        json.dump(result, file, indent=2)
+    latency = result.get("latency_ms", {})
+    print(f"{result['scans']} scans in {result['duration_s']}s  {result['throughput']} scans/s  "
+        f"p50 {latency.get('p50')} ms  p95 {latency.get('p95')} ms  p99 {latency.get('p99')} ms  "
+        f"error rate {result['error_rate']}")
+    print(f"Results written to {path}")
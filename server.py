@@ -1,281 +1,378 @@
-from flask import Flask, render_template, request, redirect, Blueprint, flash, session, jsonify
-import classSettings
-from classNews import News_Report, Update_News
-from classQuotes import quote_generator
-from classWeather import Weather_Report, Update_Weather
-from classHandler import Handler
-from classPerson import Person, Default_Person
-from classReports import Reports
-from classSearch import Search
-from classMailer import Mailer
-from classLocation import Change_City
-import services
-
-
-def preload_data():
-    config = None
-    weather_data = None
-    news = None
-    quoteOTDay = ["Welcome to TimeWise", "System"]
-    try:
-        config = classSettings.Setting()
-        print("Config loaded")
-    except Exception as e:
-        print(f"Error loading config: {e}")
-        raise RuntimeError("Critical Error: Database not initialized. ")
-    try:
-        weather_data = Update_Weather()
-        print("Weather data loaded")
-    except Exception as e:
-        print(f"Weather unavailable: {e}")
-    
-    try:
-        news = Update_News()
-        print("News Database Updated")
-    except Exception as e:
-        print(f"News unavailable: {e}")
-    
-    try:
-        quoteOTDay = quote_generator().QotD
-        print("Quotes loaded")
-    except Exception as e:
-        print(f"Quote unavailable: {e}")
-    return config, weather_data, news, quoteOTDay
-
-
-def message_parser(messages):
-    for k,v in messages.items():
-        if len(v) > 0:
-            counter = 1
-            catagory = k
-            for msg in v:
-                flash(msg, catagory)
-                counter +=1
-                if counter > 12:
-                    flash(f"{len(v)-counter} more", catagory)
-                    break
-    return messages
-
-
-# Intialize flask server
-app = Flask(__name__)
-app.secret_key = "stoic"
-frontend = Blueprint('frontend', __name__, template_folder='templates', static_folder='static')
-recent_list = []
-
-config, weather_data, news, quoteOTDay = preload_data()
-user_handle = Handler("user")
-
-weather_cache = Weather_Report()
-news_cache = News_Report()
-
-# Set default and index route
-@frontend.route ('/')
-def index():
-    return redirect('/home')
-
-
-@frontend.route('/home', methods=['GET', 'POST'])
-def home():
-    global recent_list
-    employee = None
-    idscan = None
-    if request.method == 'POST':
-        idscan = request.form.get('idscan')
-        if not idscan:
-            employee = Default_Person(recent_list, idscan)
-        else:
-            try:
-                employee = Person(idscan, recent_list)
-                message_parser({"success":[f"{idscan} Clocked {employee.io}"]})
-                # Save last successful scan ID to session
-                session['last_scan_id'] = idscan
-                
-            except Exception as e:
-                print(f"Error: Person failed to find matching ID {e}")
-                message_parser({"error":["Failed to match person to ID"]})
-                employee = Default_Person(recent_list, idscan)
-                
-        recent_list = employee.recent
-        session['recent_list'] = recent_list
-        
-    else:  # GET request
-        # Restore recent list from session
-        if 'recent_list' in session:
-            recent_list = session['recent_list']
-        
-        # If there was a last scan, recreate that person
-        if 'last_scan_id' in session:
-            try:
-                idscan = session['last_scan_id']
-                employee = Person(idscan, recent_list)
-            except:
-                employee = Default_Person(recent_list, None)
-        else:
-            employee = Default_Person(recent_list, None)
-
-    # Fallback if employee is still None
-    if employee is None:
-        employee = Default_Person(recent_list, idscan)
-
-    articles = news_cache.get_news()
-    weather_data = weather_cache.get_weather()
-    return render_template("home.html", 
-                           recent_people=recent_list,
-                           scan=employee,
-                           cf=config,
-                           quote=quoteOTDay[0],
-                           author=quoteOTDay[1],
-                           wd=weather_data,
-                           news_articles=articles
-                           )
-
-
-@frontend.route("/refresher/news")
-def refresh_news():
-    return jsonify(news_cache.get_news())
-
-
-@frontend.route("/refresher/weather")
-def refresh_weather():
-    return jsonify(weather_cache.get_weather())
-
-
-@frontend.route('/settings', methods=['GET', 'POST'])
-def settings():
-    if request.method == "POST":
-        global config, weather_data, news
-        # Danger Zone
-        action = request.form.get("action")
-        if action:
-            msg = services.danger(action, user_handle)
-            config = classSettings.Setting()
-            message_parser(msg)
-        
-        # Simple config changes    
-        keys = ["company", "city", "weather_key", "news_key"]
-        if any(key in request.form for key in keys):
-            updated = False
-            for key in keys:
-                try:
-                    msg = services.single_button(key, user_handle)
-                    if len(msg['success']) > 0:
-                        message_parser(msg)
-                        updated = True
-                    elif len(msg['error']) > 0:
-                        message_parser(msg)
-                except Exception as e:
-                    print(f"Failed to update {key}: {e}")
-            if updated:
-                global news_cache, weather_cache
-                config = classSettings.Setting()
-                Change_City(config.city)
-                news_cache = News_Report()
-                weather_cache = Weather_Report()
-
-        # color updates dynamically
-        if request.form.get("form_type") == "colors":
-            for key, value in request.form.items():
-                if services.hex_check(value):
-                    if hasattr(config, key):
-                        try:
-                            setattr(config, key, value)
-                            user_handle.update_database("config_database", "key", "value", key, value)
-                            config = classSettings.Setting()
-                            flash(f"{key} updated to {value}", "success")
-                        except Exception as e:
-                            flash(f"Failed to update {key}: {e}", "error")
-                else:
-                    flash(f"{value} is not a valid Hex Color", "error")
-
-        
-        # reset colors to default settings
-        if "reset_colors" in request.form:
-            default = config.default_colors()
-            for key,value in default.items():
-                try:
-                    user_handle.update_database("config_database", "key", "value", key, value)
-                    flash(f"{key} reset to {value}", "info")
-                except Exception as e:
-                    flash(f"Failed to reset {key}: {e}", "error")
-            config = classSettings.Setting()
-            #user_handle.send_query("SELECT * FROM config_database;")
-
-
-        # Emails
-        if "emails" in request.form:
-            report_email = request.form.get("emails").strip().lower().replace("'", "''")
-            freq = request.form.get("send-reports").strip().lower().replace("'", "''")
-            try:
-                user_handle.update_database("email_list", "key", "value", report_email, freq)
-                flash(f"Added {report_email} at frequency {freq } to database", "success")
-            except Exception as e:
-                flash(f"Failed to insert {report_email} into database: {e}", "error")
-
-        # file upload
-        if "fileUpload" in request.files:
-            file_handle = request.files["fileUpload"]
-            msgs = services.upload(file_handle, user_handle)
-            message_parser(msgs)
-
-        # manual database entry
-        if 'manual-entry-action' in request.form:
-            action = request.form.get('manual-entry-action')
-            request_dict = request.form.to_dict()
-            msg = services.manual_entry(action, request_dict, user_handle)
-            message_parser(msg)
-    
-    return render_template("settings.html", cf=config)
-
-
-@frontend.route('/search', methods=['GET', 'POST'])
-def search():
-    search = session.get('last_search')
-    field = session.get('last_field', 'name')
-    time_entries = session.get('last_time_entries', '10')
-    search_result = session.get('search_result', [])
-
-    if request.method == "POST":
-        search = request.form.get("search")
-        field = request.form.get("field")
-        time_entries = request.form.get("time_entries", 10)
-        if search is not None:
-            se = Search(search, field, time_entries)
-            search_result = se.results
-        
-            # Save to session
-            session['last_search'] = search
-            session['last_field'] = field
-            session['last_time_entries'] = time_entries
-            session['search_result'] = search_result
-        if request.form.get("preview"):
-            pass
-        if request.form.get("send-now"):
-            Mailer().send_now()
-        if request.form.get("save-now"):
-            Mailer().save_report()
-        
-    return render_template("search.html", 
-        cf = config,
-        search_result = search_result,
-        )
-    
-
-@frontend.route('/reports', methods=['GET', 'POST'])
-def reports():
-    current = Reports()
-
-    if request.method == "POST":
-        pass
-        if request.form.get("preview"):
-            pass
-        if request.form.get("send-now"):
-            Mailer().send_now()
-        if request.form.get("save-now"):
-            Mailer().save_report()
-        
-    return render_template("reports.html", 
-        cf = config,
-        live = current.get_clocked_in(),
-        report = current.get_report()
+from flask import Flask, render_template, request, redirect, Blueprint, flash, session, jsonify, Response
+import classSettings
+from classNews import News_Report, Update_News
+from classQuotes import quote_generator
+from classWeather import Weather_Report, Update_Weather
+from classHandler import Handler, pool_stats, query_stats, slow_queries
+from classDirectory import DIRECTORY
+from classSuggest import SEARCH_INDEX
+from classScanState import SCAN_STATE
+from classIngest import SCAN_QUEUE
+from classRecent import RECENT_SCANS
+from classFeed import FEED
+from classJournal import JOURNAL
+from classPerson import Person, Default_Person, clock_scans
+from classReports import Reports
+from classSearch import Search
+from classMailer import Mailer
+from classLocation import Change_City
+import services
+
+
+def preload_data():
+    config = None
+    weather_data = None
+    news = None
+    quoteOTDay = ["Welcome to TimeWise", "System"]
+    try:
+        config = classSettings.Setting()
+        print("Config loaded")
+    except Exception as e:
+        print(f"Error loading config: {e}")
+        raise RuntimeError("Critical Error: Database not initialized. ")
+    try:
+        weather_data = Update_Weather()
+        print("Weather data loaded")
+    except Exception as e:
+        print(f"Weather unavailable: {e}")
+    
+    try:
+        news = Update_News()
+        print("News Database Updated")
+    except Exception as e:
+        print(f"News unavailable: {e}")
+    
+    try:
+        quoteOTDay = quote_generator().QotD
+        print("Quotes loaded")
+    except Exception as e:
+        print(f"Quote unavailable: {e}")
+    return config, weather_data, news, quoteOTDay
+
+
+def message_parser(messages):
+    for k,v in messages.items():
+        if len(v) > 0:
+            counter = 1
+            catagory = k
+            for msg in v:
+                flash(msg, catagory)
+                counter +=1
+                if counter > 12:
+                    flash(f"{len(v)-counter} more", catagory)
+                    break
+    return messages
+
+
+# Intialize flask server
+app = Flask(__name__)
+app.secret_key = "stoic"
+frontend = Blueprint('frontend', __name__, template_folder='templates', static_folder='static')
+
+config, weather_data, news, quoteOTDay = preload_data()
+user_handle = Handler("user")
+# Employee lookups on the scan path are served from memory, kept current by people_database notifications
+DIRECTORY.start()
+# The search page's typeahead reads the same directory, indexed in memory
+SEARCH_INDEX.start()
+# One publisher per process fans committed clock events out to every open live feed
+FEED.start()
+# Scans journaled before a restart are replayed as soon as the database answers
+if JOURNAL.pending():
+    JOURNAL.start()
+# In queue mode scans are committed by ingest workers, one per shard across every server process
+if SCAN_QUEUE.enabled:
+    SCAN_QUEUE.start_workers()
+
+weather_cache = Weather_Report()
+news_cache = News_Report()
+
+# Set default and index route
+@frontend.route ('/')
+def index():
+    return redirect('/home')
+
+
+@frontend.route('/home', methods=['GET', 'POST'])
+def home():
+    employee = None
+    idscan = None
+    if request.method == 'POST':
+        idscan = request.form.get('idscan')
+        if not idscan:
+            employee = Default_Person(idscan)
+        else:
+            try:
+                employee = Person(idscan)
+                message_parser({"success":[f"{idscan} Clocked {employee.io}"]})
+                
+            except Exception as e:
+                print(f"Error: Person failed to find matching ID {e}")
+                message_parser({"error":["Failed to match person to ID"]})
+                employee = Default_Person(idscan)
+
+    # Fallback if employee is still None
+    if employee is None:
+        employee = Default_Person(idscan)
+
+    # Every worker and kiosk reads the same list
+    recent_people = RECENT_SCANS.entries()
+    articles = news_cache.get_news()
+    weather_data = weather_cache.get_weather()
+    return render_template("home.html", 
+                           recent_people=recent_people,
+                           scan=employee,
+                           cf=config,
+                           quote=quoteOTDay[0],
+                           author=quoteOTDay[1],
+                           wd=weather_data,
+                           news_articles=articles
+                           )
+
+
+# JSON scans for kiosks, one scan or a batch. Each scan carries the time it was taken and an idempotency key,
+# a kiosk that was offline sends its scans again until it gets an answer and each is applied once, oldest first.
+@frontend.route("/api/scan", methods=["POST"])
+def api_scan():
+    payload = request.get_json(silent=True)
+    batch = isinstance(payload, list) or (isinstance(payload, dict) and "scans" in payload)
+    try:
+        parsed = services.parse_scans(payload)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    valid = [scan for scan, error in parsed if error is None]
+    try:
+        rows = iter(clock_scans(valid, user_handle) if valid else [])
+    except Exception as e:
+        print(f"Error recording scans: {e}")
+        # Nothing in the batch was applied, it is safe to send again
+        return jsonify({"error": "Scans were not recorded, send them again"}), 503
+    results = [services.scan_result(scan, error=error) if error else services.scan_result(scan, next(rows))
+        for scan, error in parsed]
+    if batch:
+        return jsonify({"results": results})
+    return jsonify(results[0]), 400 if results[0]["status"] == "invalid" else 200
+
+
+# Server-Sent Events of clock ins and outs for the home recent list and the reports clocked in board.
+# A stream holds its worker for up to feedSettings lifetime, see databaseConfig for the worker class to run under.
+@frontend.route("/api/feed")
+def feed():
+    client = FEED.subscribe(request.headers.get("Last-Event-ID"))
+    if client is None:
+        # Full, the EventSource retries and the page keeps working from /api/recent
+        return Response("retry: 30000\n\n", status=503, mimetype="text/event-stream", headers={"Retry-After": "30"})
+    return Response(FEED.stream(client), mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+# The shared recent scans list, the home page fetches it again after missing live feed events
+@frontend.route("/api/recent")
+def recent():
+    return jsonify(RECENT_SCANS.entries())
+
+
+# Typeahead for the search page, the top k people matching q from the in-memory search index
+@frontend.route("/api/search/suggest")
+def search_suggest():
+    query = request.args.get("q", "")[:50]
+    k = min(max(request.args.get("k", 10, type=int), 1), 50)
+    return jsonify({"query": query,
+        "ready": SEARCH_INDEX.loaded,
+        "results": [{"employee_id": row[0], "first_name": row[1], "last_name": row[2], "email": row[3],
+                "department": row[8], "pic_path": row[5], "score": score, "field": field, "match": match}
+            for score, field, match, row in SEARCH_INDEX.suggest(query, k)]})
+
+
+@frontend.route("/refresher/news")
+def refresh_news():
+    return jsonify(news_cache.get_news())
+
+
+@frontend.route("/refresher/weather")
+def refresh_weather():
+    return jsonify(weather_cache.get_weather())
+
+
+# Per-query timings, the slow query log and connection pool usage for this process
+@frontend.route("/metrics")
+def metrics():
+    return jsonify({
+        "queries": query_stats(),
+        "slow_queries": slow_queries(),
+        "pools": pool_stats(),
+        "directory": DIRECTORY.stats(),
+        "search_index": SEARCH_INDEX.stats(),
+        "scan_state": SCAN_STATE.stats(),
+        "ingest": SCAN_QUEUE.stats(),
+        "feed": FEED.stats(),
+        "journal": JOURNAL.stats()})
+
+
+@frontend.route('/settings', methods=['GET', 'POST'])
+def settings():
+    if request.method == "POST":
+        global config, weather_data, news
+        # Danger Zone
+        action = request.form.get("action")
+        if action:
+            msg = services.danger(action, user_handle)
+            config = classSettings.Setting()
+            message_parser(msg)
+        
+        # Simple config changes    
+        keys = ["company", "city", "weather_key", "news_key"]
+        if any(key in request.form for key in keys):
+            updated = False
+            for key in keys:
+                try:
+                    msg = services.single_button(key, user_handle)
+                    if len(msg['success']) > 0:
+                        message_parser(msg)
+                        updated = True
+                    elif len(msg['error']) > 0:
+                        message_parser(msg)
+                except Exception as e:
+                    print(f"Failed to update {key}: {e}")
+            if updated:
+                global news_cache, weather_cache
+                config = classSettings.Setting()
+                Change_City(config.city)
+                news_cache = News_Report()
+                weather_cache = Weather_Report()
+
+        # color updates dynamically
+        if request.form.get("form_type") == "colors":
+            colors = {}
+            for key, value in request.form.items():
+                if services.hex_check(value):
+                    if hasattr(config, key):
+                        colors[key] = value
+                else:
+                    flash(f"{value} is not a valid Hex Color", "error")
+            if colors:
+                try:
+                    user_handle.update_database_many("config_database", "key", "value", colors)
+                    config = classSettings.Setting()
+                    for key, value in colors.items():
+                        flash(f"{key} updated to {value}", "success")
+                except Exception as e:
+                    flash(f"Failed to update {', '.join(colors)}: {e}", "error")
+
+        
+        # reset colors to default settings
+        if "reset_colors" in request.form:
+            default = config.default_colors()
+            try:
+                user_handle.update_database_many("config_database", "key", "value", default)
+                for key,value in default.items():
+                    flash(f"{key} reset to {value}", "info")
+            except Exception as e:
+                flash(f"Failed to reset {', '.join(default)}: {e}", "error")
+            config = classSettings.Setting()
+            #user_handle.send_query("SELECT * FROM config_database;")
+
+
+        # Emails
+        if "emails" in request.form:
+            report_email = request.form.get("emails").strip().lower().replace("'", "''")
+            freq = request.form.get("send-reports").strip().lower().replace("'", "''")
+            try:
+                user_handle.update_database("email_list", "key", "value", report_email, freq)
+                flash(f"Added {report_email} at frequency {freq } to database", "success")
+            except Exception as e:
+                flash(f"Failed to insert {report_email} into database: {e}", "error")
+
+        # file upload
+        if "fileUpload" in request.files:
+            file_handle = request.files["fileUpload"]
+            msgs = services.upload(file_handle, user_handle)
+            message_parser(msgs)
+
+        # manual database entry
+        if 'manual-entry-action' in request.form:
+            action = request.form.get('manual-entry-action')
+            request_dict = request.form.to_dict()
+            msg = services.manual_entry(action, request_dict, user_handle)
+            message_parser(msg)
+    
+    return render_template("settings.html", cf=config)
+
+
+# Results are pages of people linked by cursors, only the search itself is kept in the session.
+# Older time entries of each person load on demand from /api/search/times.
+@frontend.route('/search', methods=['GET', 'POST'])
+def search():
+    search = request.values.get("search", session.get('last_search'))
+    field = request.values.get("field", session.get('last_field', 'name'))
+    time_entries = request.values.get("time_entries", session.get('last_time_entries', '10'))
+    after = request.values.get("after")
+    search_result, next_page = [], None
+    # Sessions from before paging carried the whole result list
+    session.pop('search_result', None)
+
+    if search:
+        se = Search(search, field, time_entries, autorun=False)
+        try:
+            search_result, next_page = se.page(after)
+        except ValueError as e:
+            # A mangled page link starts the search over
+            print(f"Error: {e}")
+            after = None
+            search_result, next_page = se.page()
+        session['last_search'] = search
+        session['last_field'] = field
+        session['last_time_entries'] = time_entries
+
+    if request.method == "POST":
+        if request.form.get("preview"):
+            pass
+        if request.form.get("send-now"):
+            Mailer().send_now()
+        if request.form.get("save-now"):
+            Mailer().save_report()
+        
+    return render_template("search.html", 
+        cf = config,
+        search_result = search_result,
+        search = search,
+        field = field,
+        time_entries = time_entries,
+        after = after,
+        next_page = next_page,
+        )
+
+
+# The next page of one person's time entries, after the "next" cursor of the page before
+@frontend.route("/api/search/times")
+def search_times():
+    employee_id = request.args.get("employee_id", type=int)
+    after = request.args.get("after")
+    limit = min(max(request.args.get("limit", 10, type=int), 1), 100)
+    if employee_id is None or not after:
+        return jsonify({"error": "employee_id and after are required"}), 400
+    try:
+        times, next_times = Search(str(employee_id), "idnumber", limit, autorun=False).history(after)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"employee_id": employee_id, "times": times, "next": next_times})
+    
+
+@frontend.route('/reports', methods=['GET', 'POST'])
+def reports():
+    current = Reports()
+
+    if request.method == "POST":
+        pass
+        if request.form.get("preview"):
+            pass
+        if request.form.get("send-now"):
+            Mailer().send_now()
+        if request.form.get("save-now"):
+            Mailer().save_report()
+        
+    return render_template("reports.html", 
+        cf = config,
+        live = current.get_clocked_in(),
+        report = current.get_report()
         )
\ No newline at end of file
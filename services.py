@@ -3,6 +3,9 @@ from datetime import datetime as dt
 from flask import request
 import os, json, re, pandas as pd
 from classSettings import Setting
+from classScanState import SCAN_STATE
+from classRecent import RECENT_SCANS
+from classPerson import valid_employee_id
 
 def danger(action, handle):
     messages = {"error": [], "warning": [], "info": [], "success": []}
@@ -20,12 +23,12 @@ def danger(action, handle):
             #'weather_key': 'baeb0ce1961c460b651e6a3a91bfeac6',
             #'country': 'us',
             #'news_key': '04fbd2b9df7b49f6b6a626b4a4ae36be'}
-        for key, value in config_list.items():
-            try:
-                handle.update_database("config_database", "key", "value", key, value)
+        try:
+            handle.update_database_many("config_database", "key", "value", config_list)
+            for key, value in config_list.items():
                 messages["success"].append(f"{key} reset to {value}")
-            except Exception as e:
-                messages["error"].append(f"Failed to reset {key}\n{e}")
+        except Exception as e:
+            messages["error"].append(f"Failed to reset {', '.join(config_list)}\n{e}")
         return messages
 
     elif action == "clear":
@@ -41,6 +44,7 @@ def danger(action, handle):
         try:
             print("db reset")
             handle.send_command("DELETE FROM people_database;")
+            SCAN_STATE.invalidate()
             messages["success"].append("Employee database deleted")
         except Exception as e:
             messages["error"].append(f"Failed to delete people database.\n{e}")
@@ -51,6 +55,8 @@ def danger(action, handle):
             print("db reset")
             handle.send_command("DELETE FROM timesheet_database;")
             handle.send_query("SELECT * FROM timesheet_database;")
+            SCAN_STATE.invalidate()
+            RECENT_SCANS.clear()
             messages["success"].append("Timesheet database deleted")
         except Exception as e:
             messages["error"].append(f"Failed to delete timesheet database.\n{e}")
@@ -172,7 +178,70 @@ def manual_entry(action, req_dict, handle):
     return messages
 
 def hex_check(value):
-    if re.match (r'^#[A-Fa-f0-9]{6}$'):
+    if re.match (r'^#[A-Fa-f0-9]{6}$', value):
         return True
     else:
         return False
+
+
+# Reads the body of /api/scan: one scan, a list of scans or {"scans": [...]}. A scan is
+# {"employee_id": 123, "scanned_at": "2025-01-31T08:00:00-05:00", "idempotency_key": "kiosk1-000042"}.
+# Returns (scan, error) pairs in the order given, error is None for a scan clock_scans can take.
+def parse_scans(payload, limit=500):
+    if isinstance(payload, dict):
+        payload = payload["scans"] if "scans" in payload else [payload]
+    if not isinstance(payload, list) or not payload:
+        raise ValueError("Expected a scan, a list of scans or {\"scans\": [...]}")
+    if len(payload) > limit:
+        raise ValueError(f"At most {limit} scans per request")
+    now = dt.now().astimezone()
+    parsed = []
+    for item in payload:
+        if not isinstance(item, dict):
+            parsed.append(({}, "Scan must be an object"))
+            continue
+        key = item.get("idempotency_key")
+        scan = {"employee_id": item.get("employee_id"), "key": key, "at": now}
+        employee_id = scan["employee_id"]
+        # A whole number or a string of digits, int() would also take true and truncate 12.7
+        if isinstance(employee_id, str) and re.fullmatch(r"\s*-?\d+\s*", employee_id):
+            employee_id = int(employee_id)
+        if type(employee_id) is not int or not valid_employee_id(employee_id):
+            parsed.append((scan, "Invalid employee_id"))
+            continue
+        scan["employee_id"] = employee_id
+        if key is not None and (not isinstance(key, str) or not 0 < len(key) <= 200):
+            parsed.append((scan, "idempotency_key must be a string of 1 to 200 characters"))
+            continue
+        if item.get("scanned_at"):
+            try:
+                at = dt.fromisoformat(str(item["scanned_at"]).replace("Z", "+00:00"))
+            except ValueError:
+                parsed.append((scan, "scanned_at must be an ISO 8601 timestamp"))
+                continue
+            # Times without an offset are the server's local time
+            scan["at"] = at if at.tzinfo else at.astimezone()
+            if (scan["at"] - now).total_seconds() > 300:
+                parsed.append((scan, "scanned_at is in the future"))
+                continue
+        parsed.append((scan, None))
+    return parsed
+
+
+# The JSON answer for one scan from its clock_scan row, row is None for an unknown badge.
+def scan_result(scan, row=None, error=None):
+    result = {"employee_id": scan.get("employee_id"), "idempotency_key": scan.get("key")}
+    if error:
+        result.update(status="invalid", error=error)
+    elif row is None:
+        result.update(status="unknown")
+    else:
+        # A late scan (older than the employee's last event) is applied in order or held in late_scans for review
+        status = "late" if row[13] and not row[11] else "held" if row[13] else "duplicate" if row[11] else "ok"
+        result.update(status=status,
+            io="IN" if row[9] == "Clock In" else "OUT",
+            time=row[10].isoformat(),
+            fname=row[1],
+            lname=row[2],
+            replayed=row[12])
+    return result
@@ -1,78 +1,124 @@
-// ----------------------
-// Standalone News Cycle
-// ----------------------
-function initNewsCycle(newsArticles) {
-    let currentIndex = 0;
-
-    function showNews() {
-        if (!newsArticles || newsArticles.length === 0) return;
-
-        const news = newsArticles[currentIndex];
-        document.getElementById('news-src').textContent = news.src;
-        document.getElementById('news-art').textContent = news.art;
-        document.getElementById('news-url').href = news.url;
-
-        currentIndex = (currentIndex + 1) % newsArticles.length;
-    }
-
-    showNews(); // show first immediately
-    return setInterval(showNews, 30000); // cycle every 30s
-}
-
-// ----------------------
-// Weather Update Function
-// ----------------------
-function updateWeatherWidget(weatherData) {
-    if (!weatherData) return;
-
-    document.querySelector(".sidebar h3").textContent = `${weatherData.city}, ${weatherData.state || ''}${weatherData.state && weatherData.country ? ' - ' : ''}${weatherData.country || ''}`;
-    document.querySelector(".sidebar img").src = `/static/weather_icon/${weatherData.icon || 'default.png'}`;
-    document.querySelector(".sidebar .weather-row:nth-child(1) .value").textContent = `${weatherData.feel}°F`;
-    document.querySelector(".sidebar .weather-row:nth-child(2) .value").textContent = `${weatherData.temp}°F`;
-    document.querySelector(".sidebar .weather-row:nth-child(3) .value").textContent = `${weatherData.humid}%`;
-    document.querySelector(".sidebar .weather-row:nth-child(4) .value").textContent = `${weatherData.clouds}%`;
-    document.querySelector(".sidebar .weather-row:nth-child(5) .value").textContent = weatherData.wind;
-}
-
-// ----------------------
-// DOMContentLoaded Setup
-// ----------------------
-document.addEventListener("DOMContentLoaded", () => {
-    // --- ID Scan Auto-Submit ---
-    const input = document.getElementById("idscan");
-    const form = document.getElementById("autoForm");
-    const maxLength = 8;
-
-    input.focus();
-    input.addEventListener("input", () => {
-        if (input.value.length >= maxLength) form.submit();
-    });
-
-    // --- News Fetch & Update ---
-    let newsCycleInterval;
-    async function fetchAndUpdateNews() {
-        try {
-            const data = await fetch("/refresher/news").then(r => r.json());
-            if (newsCycleInterval) clearInterval(newsCycleInterval);
-            newsCycleInterval = initNewsCycle(data);
-        } catch (error) {
-            console.error("Error fetching news:", error);
-        }
-    }
-
-    fetchAndUpdateNews(); // initial load
-    setInterval(fetchAndUpdateNews, 3600000); // every 1 hour
-
-    // --- Weather Fetch & Update ---
-    async function fetchAndUpdateWeather() {
-        try {
-            const weatherData = await fetch("/refresher/weather").then(r => r.json());
-            updateWeatherWidget(weatherData);
-        } catch (error) {
-            console.error("Error fetching weather:", error);
-        }
-    }
-
-    fetchAndUpdateWeather(); // initial load
-    setInterval(fetchAndUpdateWeather, 120 * 60 * 1000); // every 2 hours
-});
+// ----------------------
+// Standalone News Cycle
+// ----------------------
+function initNewsCycle(newsArticles) {
+    let currentIndex = 0;
+
+    function showNews() {
+        if (!newsArticles || newsArticles.length === 0) return;
+
+        const news = newsArticles[currentIndex];
+        document.getElementById('news-src').textContent = news.src;
+        document.getElementById('news-art').textContent = news.art;
+        document.getElementById('news-url').href = news.url;
+
+        currentIndex = (currentIndex + 1) % newsArticles.length;
+    }
+
+    showNews(); // show first immediately
+    return setInterval(showNews, 30000); // cycle every 30s
+}
+
+// ----------------------
+// Weather Update Function
+// ----------------------
+function updateWeatherWidget(weatherData) {
+    if (!weatherData) return;
+
+    document.querySelector(".sidebar h3").textContent = `${weatherData.city}, ${weatherData.state || ''}${weatherData.state && weatherData.country ? ' - ' : ''}${weatherData.country || ''}`;
+    document.querySelector(".sidebar img").src = `/static/weather_icon/${weatherData.icon || 'default.png'}`;
+    document.querySelector(".sidebar .weather-row:nth-child(1) .value").textContent = `${weatherData.feel}°F`;
+    document.querySelector(".sidebar .weather-row:nth-child(2) .value").textContent = `${weatherData.temp}°F`;
+    document.querySelector(".sidebar .weather-row:nth-child(3) .value").textContent = `${weatherData.humid}%`;
+    document.querySelector(".sidebar .weather-row:nth-child(4) .value").textContent = `${weatherData.clouds}%`;
+    document.querySelector(".sidebar .weather-row:nth-child(5) .value").textContent = weatherData.wind;
+}
+
+// ----------------------
+// DOMContentLoaded Setup
+// ----------------------
+document.addEventListener("DOMContentLoaded", () => {
+    // --- ID Scan Auto-Submit ---
+    const input = document.getElementById("idscan");
+    const form = document.getElementById("autoForm");
+    const maxLength = 8;
+
+    input.focus();
+    input.addEventListener("input", () => {
+        if (input.value.length >= maxLength) form.submit();
+    });
+
+    // --- News Fetch & Update ---
+    let newsCycleInterval;
+    async function fetchAndUpdateNews() {
+        try {
+            const data = await fetch("/refresher/news").then(r => r.json());
+            if (newsCycleInterval) clearInterval(newsCycleInterval);
+            newsCycleInterval = initNewsCycle(data);
+        } catch (error) {
+            console.error("Error fetching news:", error);
+        }
+    }
+
+    fetchAndUpdateNews(); // initial load
+    setInterval(fetchAndUpdateNews, 3600000); // every 1 hour
+
+    // --- Weather Fetch & Update ---
+    async function fetchAndUpdateWeather() {
+        try {
+            const weatherData = await fetch("/refresher/weather").then(r => r.json());
+            updateWeatherWidget(weatherData);
+        } catch (error) {
+            console.error("Error fetching weather:", error);
+        }
+    }
+
+    fetchAndUpdateWeather(); // initial load
+    setInterval(fetchAndUpdateWeather, 120 * 60 * 1000); // every 2 hours
+
+    // --- Live Recent Scans ---
+    // Scans from every kiosk arrive on the live feed, rows are added without reloading the page
+    const recent = document.getElementById("recent-scans");
+    const recentLength = 50;
+
+    function recentRow(scan) {
+        const row = document.createElement("div");
+        row.className = "excel-row";
+        for (const value of [scan.fname, scan.lname, scan.io, scan.time]) {
+            const cell = document.createElement("div");
+            cell.className = "excel-cell";
+            cell.textContent = value;
+            row.appendChild(cell);
+        }
+        return row;
+    }
+
+    function addRecent(event) {
+        recent.querySelector(".excel-header").after(recentRow(JSON.parse(event.data)));
+        const rows = recent.querySelectorAll(".excel-row:not(.excel-header)");
+        for (let i = recentLength; i < rows.length; i++) rows[i].remove();
+    }
+
+    // After missed events the whole list is fetched again, the page is left alone so a scan being typed isn't lost
+    async function reloadRecent() {
+        try {
+            const scans = await fetch("/api/recent").then(r => r.json());
+            recent.querySelectorAll(".excel-row:not(.excel-header)").forEach(row => row.remove());
+            recent.append(...scans.map(recentRow));
+        } catch (error) {
+            console.error("Error fetching recent scans:", error);
+        }
+    }
+
+    // The browser reconnects a stream that ends by itself, a refused one (server full) is opened again later
+    function openFeed() {
+        const feed = new EventSource("/api/feed");
+        feed.addEventListener("in", addRecent);
+        feed.addEventListener("out", addRecent);
+        feed.addEventListener("resync", reloadRecent);
+        feed.addEventListener("error", () => {
+            if (feed.readyState === EventSource.CLOSED) setTimeout(() => { reloadRecent(); openFeed(); }, 30000);
+        });
+    }
+    openFeed();
+});
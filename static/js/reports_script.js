@@ -0,0 +1,64 @@
+// ----------------------
+// Live Clocked In Board
+// ----------------------
+// Clock ins and outs arrive on the live feed and are applied to the board without reloading the page
+document.addEventListener("DOMContentLoaded", () => {
+    const board = document.getElementById("live-board");
+
+    function findDateRow(date) {
+        return board.querySelector(`tr.date-row[data-date="${date}"]`);
+    }
+
+    function dateRow(date) {
+        let row = findDateRow(date);
+        if (row) return row;
+        row = document.createElement("tr");
+        row.className = "date-row";
+        row.dataset.date = date;
+        const cell = document.createElement("td");
+        cell.colSpan = 3;
+        cell.append(document.createElement("hr"), date, document.createElement("hr"));
+        row.appendChild(cell);
+        // Dates are listed newest first
+        const older = [...board.querySelectorAll("tr.date-row")].find(r => new Date(r.dataset.date) < new Date(date));
+        board.insertBefore(row, older || null);
+        return row;
+    }
+
+    function clockIn(event) {
+        const shift = JSON.parse(event.data);
+        if (board.querySelector(`tr[data-shift="${shift.id}"]`)) return;
+        const row = document.createElement("tr");
+        row.dataset.shift = shift.id;
+        for (const value of ["", shift.clock_in, `${shift.fname} ${shift.lname}`]) {
+            const cell = document.createElement("td");
+            cell.textContent = value;
+            row.appendChild(cell);
+        }
+        // Newest clock in first under its date
+        dateRow(shift.work_date).after(row);
+    }
+
+    function clockOut(event) {
+        const shift = JSON.parse(event.data);
+        const row = board.querySelector(`tr[data-shift="${shift.id}"]`);
+        if (!row) return;
+        row.remove();
+        // A date with nobody left clocked in is removed as well
+        const date = findDateRow(shift.work_date);
+        if (date && (!date.nextElementSibling || date.nextElementSibling.classList.contains("date-row"))) {
+            date.remove();
+        }
+    }
+
+    const feed = new EventSource("/api/feed");
+    feed.addEventListener("in", clockIn);
+    feed.addEventListener("out", clockOut);
+    feed.addEventListener("delete", clockOut);
+    // Events were missed, the board is rebuilt from the database
+    feed.addEventListener("resync", () => location.reload());
+    // The browser reconnects a stream that ends by itself, a refused one (server full) is retried with a reload
+    feed.addEventListener("error", () => {
+        if (feed.readyState === EventSource.CLOSED) setTimeout(() => location.reload(), 30000);
+    });
+});
@@ -0,0 +1,77 @@
+// ----------------------
+// Search Typeahead
+// ----------------------
+// Suggestions come from the server's in-memory index as the user types, picking one selects the field it matched.
+// Older time entries of a person load into their card on request.
+document.addEventListener("DOMContentLoaded", () => {
+    const input = document.getElementById("search");
+    const field = document.getElementById("field");
+    const list = document.getElementById("suggestions");
+    let latest = 0;
+    let timer = null;
+
+    async function suggest() {
+        const query = input.value.trim();
+        const request = ++latest;
+        if (!query) {
+            list.replaceChildren();
+            return;
+        }
+        try {
+            const response = await fetch(`/api/search/suggest?q=${encodeURIComponent(query)}&k=10`);
+            const data = await response.json();
+            // An answer to an older keystroke is dropped
+            if (request !== latest) return;
+            list.replaceChildren(...data.results.map(person => {
+                const option = document.createElement("option");
+                option.value = person.match;
+                option.label = `${person.first_name} ${person.last_name} (${person.employee_id}) ${person.department || ""}`;
+                option.dataset.field = person.field;
+                return option;
+            }));
+        } catch (e) {
+            console.error("Search suggestions unavailable", e);
+        }
+    }
+
+    // Older time entries of one person, a page at a time from their section's cursor
+    async function loadMore(section, button) {
+        const params = new URLSearchParams({employee_id: section.dataset.employee, after: section.dataset.next,
+            limit: section.dataset.limit});
+        button.disabled = true;
+        try {
+            const response = await fetch(`/api/search/times?${params}`);
+            const data = await response.json();
+            if (!response.ok) throw new Error(data.error);
+            const columns = section.querySelectorAll(".time-column");
+            for (const time of data.times) {
+                [time.date, time.clockin, time.clockout, time.duration, time.notes || ""].forEach((value, i) => {
+                    const cell = document.createElement("span");
+                    cell.className = "time-value";
+                    cell.textContent = value;
+                    columns[i].appendChild(cell);
+                });
+            }
+            section.dataset.next = data.next || "";
+            if (data.next) {
+                button.disabled = false;
+            } else {
+                button.remove();
+            }
+        } catch (e) {
+            console.error("Time entries unavailable", e);
+            button.disabled = false;
+        }
+    }
+
+    document.querySelectorAll(".time-entries-section .load-more").forEach(button => {
+        button.addEventListener("click", () => loadMore(button.closest(".time-entries-section"), button));
+    });
+
+    input.addEventListener("input", () => {
+        clearTimeout(timer);
+        timer = setTimeout(suggest, 50);
+        const picked = [...list.options].find(option => option.value === input.value);
+        if (picked) field.value = picked.dataset.field;
+    });
+});